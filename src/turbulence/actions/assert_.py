@@ -1,12 +1,10 @@
 """Assert action runner for validating expectations."""
 
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from jsonpath_ng import parse as jsonpath_parse
-from jsonpath_ng.exceptions import JsonPathParserError
-
 from turbulence.config.scenario import AssertAction, Expectation
 from turbulence.evaluation import (
     ExpressionError,
@@ -16,12 +14,19 @@ from turbulence.evaluation import (
 )
 from turbulence.models.assertion_result import AssertionResult
 from turbulence.models.observation import Observation
+from turbulence.utils.jsonpath import NO_MATCH
 from turbulence.validation import SchemaValidationError, validate_json_schema
 
 # Sentinel object to distinguish "not set" from "set to None"
 _NOT_SET = object()
 
 
+@lru_cache(maxsize=1024)
+def _split_path(path: str) -> tuple[str, ...]:
+    """Split a dot-notation context path, caching the result per path."""
+    return tuple(path.split("."))
+
+
 class AssertActionRunner:
     """Runner for assert actions that validate expectations.
 
@@ -51,7 +56,8 @@ class AssertActionRunner:
 
         Returns:
             A tuple of (Observation, context) where observation.ok indicates
-            whether all expectations passed.
+            whether all expectations passed. The assertion result is recorded
+            in ``context`` in place.
         """
         start_time = time.perf_counter()
 
@@ -68,15 +74,11 @@ class AssertActionRunner:
         )
 
         # Store assertion result in context for reporting
-        assertion_results = context.get("_assertion_results", [])
-        assertion_results.append(result.model_dump())
-        updated_context = {
-            **context,
-            "_assertion_results": assertion_results,
-            "_last_assertion": result.model_dump(),
-        }
+        result_dict = result.model_dump()
+        context.setdefault("_assertion_results", []).append(result_dict)
+        context["_last_assertion"] = result_dict
 
-        return observation, updated_context
+        return observation, context
 
     def _evaluate_expectation(
         self,
@@ -150,16 +152,14 @@ class AssertActionRunner:
             )
 
         passed = actual_status == expect.status_code
-
-        if passed:
-            message = (
-                f"Status code {actual_status} matches expected {expect.status_code}"
-            )
-        else:
-            message = (
+        message = (
+            ""
+            if passed
+            else (
                 f"Status code mismatch: expected {expect.status_code}, "
                 f"got {actual_status}"
             )
+        )
 
         return AssertionResult(
             name=self.action.name,
@@ -230,7 +230,6 @@ class AssertActionRunner:
             passed=True,
             expected=expect.json_schema,
             actual=None,
-            message="Schema validation passed",
             comparison="schema",
         )
 
@@ -284,11 +283,7 @@ class AssertActionRunner:
             )
 
         passed = bool(result)
-        message = (
-            "Expression evaluated to True"
-            if passed
-            else f"Expression evaluated to False (result={result!r})"
-        )
+        message = "" if passed else f"Expression evaluated to False (result={result!r})"
 
         return AssertionResult(
             name=self.action.name,
@@ -316,8 +311,7 @@ class AssertActionRunner:
         last_response = context.get("last_response", {})
         body = last_response.get("body")
 
-        has_equals = "equals" in expect.model_fields_set
-        has_contains = "contains" in expect.model_fields_set
+        has_equals = expect._has_equals
 
         if body is None:
             return AssertionResult(
@@ -330,20 +324,22 @@ class AssertActionRunner:
                 comparison="equals" if has_equals else "contains",
             )
 
-        # Parse and evaluate JSONPath
-        try:
-            jsonpath_expr = jsonpath_parse(expect.jsonpath)
-        except JsonPathParserError as e:
+        # Evaluate the JSONPath compiled when the expectation was built
+        jsonpath_expr = expect._compiled_jsonpath
+        if jsonpath_expr is None:
             return AssertionResult(
                 name=self.action.name,
                 passed=False,
-                message=f"Invalid JSONPath expression '{expect.jsonpath}': {e}",
+                message=(
+                    f"Invalid JSONPath expression '{expect.jsonpath}': "
+                    f"{expect._jsonpath_error}"
+                ),
                 path=expect.jsonpath,
             )
 
-        matches = jsonpath_expr.find(body)
+        actual_value = jsonpath_expr.first(body)
 
-        if not matches:
+        if actual_value is NO_MATCH:
             return AssertionResult(
                 name=self.action.name,
                 passed=False,
@@ -354,17 +350,7 @@ class AssertActionRunner:
                 comparison="equals" if has_equals else "contains",
             )
 
-        # Get the first match value
-        actual_value = matches[0].value
-
-        return self._compare_values(
-            actual=actual_value,
-            expected_equals=expect.equals,
-            expected_contains=expect.contains,
-            path=expect.jsonpath,
-            has_equals=has_equals,
-            has_contains=has_contains,
-        )
+        return self._compare_values(actual_value, expect, expect.jsonpath)
 
     def _evaluate_context_path(
         self,
@@ -381,8 +367,7 @@ class AssertActionRunner:
             AssertionResult for context value comparison.
         """
         context_path = expect.context_path
-        has_equals = "equals" in expect.model_fields_set
-        has_contains = "contains" in expect.model_fields_set
+        has_equals = expect._has_equals
 
         # Handle nested paths with dot notation
         if context_path is None:
@@ -395,27 +380,18 @@ class AssertActionRunner:
 
         actual_value = self._get_nested_value(context, context_path)
 
-        if actual_value is None and context_path not in context:
-            # Check if it's truly missing or just has None value
-            if not self._path_exists(context, context_path):
-                return AssertionResult(
-                    name=self.action.name,
-                    passed=False,
-                    expected=expect.equals if has_equals else expect.contains,
-                    actual=None,
-                    message=f"Context path '{context_path}' not found in context",
-                    path=context_path,
-                    comparison="equals" if has_equals else "contains",
-                )
+        if actual_value is _NOT_SET:
+            return AssertionResult(
+                name=self.action.name,
+                passed=False,
+                expected=expect.equals if has_equals else expect.contains,
+                actual=None,
+                message=f"Context path '{context_path}' not found in context",
+                path=context_path,
+                comparison="equals" if has_equals else "contains",
+            )
 
-        return self._compare_values(
-            actual=actual_value,
-            expected_equals=expect.equals,
-            expected_contains=expect.contains,
-            path=context_path,
-            has_equals=has_equals,
-            has_contains=has_contains,
-        )
+        return self._compare_values(actual_value, expect, context_path)
 
     def _get_nested_value(
         self,
@@ -429,126 +405,78 @@ class AssertActionRunner:
             path: Dot-separated path (e.g., "user.profile.name").
 
         Returns:
-            The value at the path, or None if not found.
+            The value at the path (which may be None), or ``_NOT_SET`` if any
+            segment of the path is missing.
         """
-        keys = path.split(".")
-        current = data
+        current: Any = data
 
-        for key in keys:
+        for key in _split_path(path):
             if isinstance(current, dict) and key in current:
                 current = current[key]
             else:
-                return None
+                return _NOT_SET
 
         return current
 
-    def _path_exists(
-        self,
-        data: dict[str, Any],
-        path: str,
-    ) -> bool:
-        """Check if a nested path exists in a dictionary.
-
-        Args:
-            data: The dictionary to search.
-            path: Dot-separated path.
-
-        Returns:
-            True if the path exists (even if value is None).
-        """
-        keys = path.split(".")
-        current = data
-
-        for key in keys:
-            if isinstance(current, dict) and key in current:
-                current = current[key]
-            else:
-                return False
-
-        return True
-
     def _compare_values(
         self,
         actual: Any,
-        expected_equals: Any,
-        expected_contains: Any,
+        expect: Expectation,
         path: str | None,
-        *,
-        has_equals: bool,
-        has_contains: bool,
     ) -> AssertionResult:
         """Compare actual value against expected using equals or contains.
 
         Args:
             actual: The actual value found.
-            expected_equals: Value to compare for equality (if has_equals is True).
-            expected_contains: Value to check for containment (if has_contains is True).
+            expect: Expectation whose bound comparator performs the check.
             path: The path that was evaluated (for error messages).
-            has_equals: Whether equals comparison was explicitly specified.
-            has_contains: Whether contains comparison was explicitly specified.
 
         Returns:
             AssertionResult for the comparison.
         """
-        # Equals comparison
-        if has_equals:
-            passed = actual == expected_equals
-            if passed:
-                message = f"Value at '{path}' equals expected {expected_equals!r}"
-            else:
-                message = (
-                    f"Value mismatch at '{path}': "
-                    f"expected {expected_equals!r}, got {actual!r}"
-                )
+        compare = expect._compare
+
+        # No comparison specified
+        if compare is None:
             return AssertionResult(
                 name=self.action.name,
-                passed=passed,
-                expected=expected_equals,
+                passed=False,
                 actual=actual,
-                message=message,
+                message=(
+                    f"No comparison specified for path '{path}' "
+                    "(need equals or contains)"
+                ),
                 path=path,
-                comparison="equals",
             )
 
+        passed = compare(actual)
+        message = ""
+
+        # Equals comparison
+        if expect._has_equals:
+            expected = expect.equals
+            comparison = "equals"
+            if not passed:
+                message = (
+                    f"Value mismatch at '{path}': "
+                    f"expected {expected!r}, got {actual!r}"
+                )
         # Contains comparison
-        if has_contains:
-            try:
-                if isinstance(actual, str):
-                    passed = str(expected_contains) in actual
-                elif isinstance(actual, (list, tuple)):
-                    passed = expected_contains in actual
-                elif isinstance(actual, dict):
-                    passed = expected_contains in actual
-                else:
-                    passed = False
-            except TypeError:
-                passed = False
-
-            if passed:
-                message = f"Value at '{path}' contains {expected_contains!r}"
-            else:
+        else:
+            expected = expect.contains
+            comparison = "contains"
+            if not passed:
                 message = (
-                    f"Value at '{path}' does not contain {expected_contains!r}, "
+                    f"Value at '{path}' does not contain {expected!r}, "
                     f"actual: {actual!r}"
                 )
 
-            return AssertionResult(
-                name=self.action.name,
-                passed=passed,
-                expected=expected_contains,
-                actual=actual,
-                message=message,
-                path=path,
-                comparison="contains",
-            )
-
-        # No comparison specified
         return AssertionResult(
             name=self.action.name,
-            passed=False,
+            passed=passed,
+            expected=expected,
             actual=actual,
-            message=(
-                f"No comparison specified for path '{path}' (need equals or contains)"
-            ),
+            message=message,
             path=path,
+            comparison=comparison,
         )
@@ -25,8 +25,8 @@ class ActionRunner(Protocol):
             context: Current execution context with variables.
 
         Returns:
-            A tuple of (Observation, updated_context) where updated_context
-            contains any extracted values merged with the input context.
+            A tuple of (Observation, context). Runners record extracted values
+            by updating the input context in place and return that same dict.
         """
         ...
 
@@ -49,7 +49,7 @@ class BaseActionRunner(ABC):
             context: Current execution context with variables.
 
         Returns:
-            A tuple of (Observation, updated_context) where updated_context
-            contains any extracted values merged with the input context.
+            A tuple of (Observation, context). Runners record extracted values
+            by updating the input context in place and return that same dict.
         """
         ...
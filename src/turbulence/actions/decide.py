@@ -75,7 +75,8 @@ class DecideActionRunner(BaseActionRunner):
             context: Current execution context.
 
         Returns:
-            Tuple of (Observation, updated_context) with decision result.
+            Tuple of (Observation, context), with the decision result recorded
+            in ``context`` in place.
         """
         start_time = time.perf_counter()
 
@@ -108,8 +109,8 @@ class DecideActionRunner(BaseActionRunner):
         # Make the weighted random selection
         choice = self._weighted_choice(options)
 
-        # Update context with the decision result
-        updated_context = {**context, output_var: choice}
+        # Record the decision result in the context in place
+        context[output_var] = choice
 
         elapsed = (time.perf_counter() - start_time) * 1000
 
@@ -125,5 +126,5 @@ class DecideActionRunner(BaseActionRunner):
                     "options": options,
                 },
             ),
-            updated_context,
+            context,
         )
@@ -18,6 +18,9 @@ class ActionRunnerFactory:
     """
 
     _runners: dict[str, type[ActionRunner]] = {}
+    # Constructor parameter names for each action type, read at registration
+    # so creating a runner per step does not inspect its signature again
+    _runner_params: dict[str, frozenset[str]] = {}
 
     @classmethod
     def register(cls, action_type: str, runner_class: type[ActionRunner]) -> None:
@@ -28,6 +31,9 @@ class ActionRunnerFactory:
             runner_class: The class to instantiate for this type.
         """
         cls._runners[action_type] = runner_class
+        cls._runner_params[action_type] = frozenset(
+            inspect.signature(runner_class.__init__).parameters
+        )
 
     @classmethod
     def create(
@@ -58,9 +64,8 @@ class ActionRunnerFactory:
 
         runner_class = cls._runners[action_type]
 
-        # Use inspection to determine which arguments the runner requires
-        sig = inspect.signature(runner_class.__init__)
-        params = sig.parameters
+        # Pass only the arguments the runner's constructor accepts
+        params = cls._runner_params[action_type]
 
         init_args: dict[str, Any] = {}
 
@@ -33,9 +33,13 @@ class GrpcActionRunner(BaseActionRunner):
             action: The gRPC action configuration to execute.
             sut_config: The system under test configuration.
             channel: Optional gRPC channel. If not provided, one will be created.
+
+        Raises:
+            KeyError: If the action's service is not defined in the SUT config.
         """
         self.action = action
         self.sut_config = sut_config
+        self._service = sut_config.get_service(action.service)
         self.channel = channel
 
     async def execute(
@@ -45,7 +49,7 @@ class GrpcActionRunner(BaseActionRunner):
         """Execute the gRPC action and return observation with updated context."""
         from turbulence.actions.grpc_utils import GrpcReflectionClient
 
-        service = self.sut_config.get_service(self.action.service)
+        service = self._service
 
         if service.protocol != "grpc" or not service.grpc:
             raise ValueError(f"Service '{self.action.service}' is not configured for gRPC")
@@ -1,7 +1,10 @@
 """HTTP action runner for executing HTTP requests."""
 
 import time
+from collections.abc import Mapping
 from datetime import datetime, timezone
+from http import HTTPStatus
+from types import MappingProxyType
 from typing import Any
 
 import httpx
@@ -10,9 +13,44 @@ from turbulence.actions.base import BaseActionRunner
 from turbulence.config.scenario import HttpAction
 from turbulence.config.sut import SUTConfig
 from turbulence.models.observation import Observation
-from turbulence.utils.extractor import extract_values
+from turbulence.utils.extractor import extract_compiled_values
 from turbulence.utils.retry_policy import RetryConfig, with_retry
 
+# Standard reason phrases, so error messages don't decode the status line
+_STATUS_PHRASES: dict[int, str] = {status.value: status.phrase for status in HTTPStatus}
+
+
+def _status_error(status_code: int) -> str:
+    """Format the error message recorded for a non-2xx status code."""
+    phrase = _STATUS_PHRASES.get(status_code)
+    if phrase is None:
+        return f"HTTP {status_code}"
+    return f"HTTP {status_code}: {phrase}"
+
+
+def _is_json_content_type(content_type: str) -> bool:
+    """Return True for application/json and +json media types."""
+    media_type = content_type.partition(";")[0].strip().lower()
+    return media_type == "application/json" or media_type.endswith("+json")
+
+
+def _decode_body(response: httpx.Response) -> Any:
+    """Decode a response body based on its Content-Type.
+
+    JSON media types are parsed as JSON (falling back to text if malformed),
+    other declared types are returned as text without a JSON attempt, and
+    responses without a Content-Type are sniffed as before. Current httpx
+    parses ``response.json()`` straight from the raw bytes, so no
+    intermediate str is decoded first.
+    """
+    content_type = response.headers.get("content-type")
+    if content_type is not None and not _is_json_content_type(content_type):
+        return response.text
+    try:
+        return response.json()
+    except ValueError:
+        return response.text
+
 
 class HttpActionRunner(BaseActionRunner):
     """Executes HTTP actions and extracts values from responses.
@@ -33,25 +71,24 @@ class HttpActionRunner(BaseActionRunner):
         Args:
             action: The HTTP action configuration to execute.
             sut_config: The system under test configuration.
-            client: Optional httpx async client. If not provided, a new one
-                will be created for each request.
+            client: Optional httpx async client, normally a pooled client from
+                ClientPool. If not provided, a client is opened for each
+                execute call and shared by its retry attempts.
+
+        Raises:
+            KeyError: If the action's service is not defined in the SUT config.
         """
         self.action = action
         self.sut_config = sut_config
         self._client = client
+        self._service = sut_config.get_service(action.service)
+        self._request_kwargs = self._build_request_kwargs()
 
-    async def execute(
-        self,
-        context: dict[str, Any],
-    ) -> tuple[Observation, dict[str, Any]]:
-        """Execute the HTTP action and return observation with updated context."""
-        service = self.sut_config.get_service(self.action.service)
+    def _build_request_kwargs(self) -> Mapping[str, Any]:
+        """Build the request arguments, which are fixed for this action."""
+        service = self._service
 
         # Determine protocol configuration
-        base_url = ""
-        service_headers = {}
-        timeout = 30.0
-
         if service.protocol == "http" and service.http:
             base_url = str(service.http.base_url)
             service_headers = service.http.headers
@@ -62,8 +99,6 @@ class HttpActionRunner(BaseActionRunner):
             service_headers = service.headers
             timeout = service.timeout_seconds
 
-        url = f"{base_url}{self.action.path}"
-
         headers = {
             **self.sut_config.default_headers,
             **service_headers,
@@ -72,7 +107,7 @@ class HttpActionRunner(BaseActionRunner):
 
         request_kwargs: dict[str, Any] = {
             "method": self.action.method.upper(),
-            "url": url,
+            "url": f"{base_url}{self.action.path}",
             "headers": headers,
             "params": self.action.query if self.action.query else None,
             "timeout": timeout,
@@ -81,6 +116,15 @@ class HttpActionRunner(BaseActionRunner):
         if self.action.body is not None:
             request_kwargs["json"] = self.action.body
 
+        return MappingProxyType(request_kwargs)
+
+    async def execute(
+        self,
+        context: dict[str, Any],
+    ) -> tuple[Observation, dict[str, Any]]:
+        """Execute the HTTP action and return observation with updated context."""
+        request_kwargs = self._request_kwargs
+
         attempts: list[dict[str, Any]] = []
 
         def on_attempt(idx: int, obs: Observation | None, exc: Exception | None, dur: float):
@@ -115,8 +159,13 @@ class HttpActionRunner(BaseActionRunner):
         else:
             retry_policy = RetryConfig(max_attempts=1, strategy="fixed")
 
+        client = self._client
+        owned_client: httpx.AsyncClient | None = None
+        if client is None:
+            client = owned_client = httpx.AsyncClient()
+
         async def do_request() -> Observation:
-            return await self._execute_single_request(request_kwargs)
+            return await self._execute_single_request(client, request_kwargs)
 
         def is_retryable(e: Exception) -> bool:
             if not self.action.retry:
@@ -155,64 +204,57 @@ class HttpActionRunner(BaseActionRunner):
                 ok=False,
                 status_code=None,
                 latency_ms=(time.perf_counter() - total_start) * 1000,
-                headers={},
-                body=None,
                 errors=[error_msg],
                 action_name=self.action.name,
                 service=self.action.service,
                 attempts=attempts,
             )
+        finally:
+            if owned_client is not None:
+                await owned_client.aclose()
 
         observation.attempts = attempts
         observation.latency_ms = (time.perf_counter() - total_start) * 1000
 
-        # Extraction logic
-        updated_context = dict(context)
-        if observation.ok and observation.body and self.action.extract:
-            extracted = extract_values(observation.body, self.action.extract)
-            updated_context.update(extracted)
+        # Extraction logic (extracted values are written into context in place).
+        # Actions without extract rules return the input context untouched.
+        if self.action.extract and observation.ok and observation.body:
+            extracted = extract_compiled_values(
+                observation.body, self.action._compiled_extract
+            )
+            context.update(extracted)
 
             # Check for missing extractions to report as errors
             for key in self.action.extract:
                 if key not in extracted:
                     observation.errors.append(f"JSONPath '{self.action.extract[key]}' did not match any values")
 
-        return observation, updated_context
+        return observation, context
 
-    async def _execute_single_request(self, request_kwargs: dict[str, Any]) -> Observation:
+    async def _execute_single_request(
+        self, client: httpx.AsyncClient, request_kwargs: Mapping[str, Any]
+    ) -> Observation:
         """Execute a single HTTP request and return an Observation."""
         start_time = time.perf_counter()
 
         try:
-            if self._client is not None:
-                response = await self._client.request(**request_kwargs)
-            else:
-                async with httpx.AsyncClient() as client:
-                    response = await client.request(**request_kwargs)
+            response = await client.request(**request_kwargs)
 
             status_code = response.status_code
-            headers = dict(response.headers)
-
-            try:
-                body = response.json()
-            except Exception:
-                body = response.text
-
             ok = 200 <= status_code < 300
-            errors = []
-            if not ok:
-                errors.append(f"HTTP {status_code}: {response.reason_phrase}")
 
-            return Observation(
+            observation = Observation(
                 ok=ok,
                 status_code=status_code,
+                headers=dict(response.headers),
+                body=_decode_body(response),
                 latency_ms=(time.perf_counter() - start_time) * 1000,
-                headers=headers,
-                body=body,
-                errors=errors,
                 action_name=self.action.name,
                 service=self.action.service,
             )
+            if not ok:
+                observation.errors.append(_status_error(status_code))
+            return observation
         except Exception:
             # Re-raise to let with_retry handle it
             raise
@@ -5,14 +5,13 @@ import time
 from typing import Any
 
 import httpx
-from jsonpath_ng import parse as jsonpath_parse
-from jsonpath_ng.exceptions import JsonPathParserError
 from pydantic import BaseModel, ConfigDict, Field
 
 from turbulence.actions.base import BaseActionRunner
 from turbulence.config.scenario import Expectation, WaitAction
 from turbulence.config.sut import SUTConfig
 from turbulence.models.observation import Observation
+from turbulence.utils.jsonpath import NO_MATCH
 
 
 class PollAttempt(BaseModel):
@@ -93,9 +92,13 @@ class WaitActionRunner(BaseActionRunner):
             sut_config: The system under test configuration.
             client: Optional httpx async client. If not provided, a new one
                 will be created for each request.
+
+        Raises:
+            KeyError: If the action's service is not defined in the SUT config.
         """
         self.action = action
         self.sut_config = sut_config
+        self._service = sut_config.get_service(action.service)
         self._client = client
 
     async def execute(
@@ -108,9 +111,9 @@ class WaitActionRunner(BaseActionRunner):
             context: Current execution context with variables.
 
         Returns:
-            A tuple of (WaitObservation, updated_context).
+            A tuple of (WaitObservation, context).
         """
-        service = self.sut_config.get_service(self.action.service)
+        service = self._service
 
         # Determine protocol configuration
         base_url = ""
@@ -152,96 +155,103 @@ class WaitActionRunner(BaseActionRunner):
         errors: list[str] = []
         timed_out = False
 
-        while True:
-            attempt_number += 1
-            elapsed_ms = (time.perf_counter() - start_time) * 1000
-            elapsed_seconds = elapsed_ms / 1000
-
-            # Check timeout before making request
-            if elapsed_seconds >= self.action.timeout_seconds:
-                timed_out = True
-                errors.append(
-                    f"Timeout after {elapsed_seconds:.1f}s "
-                    f"({attempt_number - 1} attempts)"
-                )
-                break
-
-            # Execute poll request
-            poll_start = time.perf_counter()
-            poll_error: str | None = None
-            poll_body: Any = None
-            poll_status_code: int | None = None
-
-            try:
-                if self._client is not None:
-                    response = await self._client.request(**request_kwargs)
-                else:
-                    async with httpx.AsyncClient() as client:
-                        response = await client.request(**request_kwargs)
-
-                poll_status_code = response.status_code
-                last_status_code = poll_status_code
+        # Polls reuse one connection; without a pooled client, open our own
+        client = self._client
+        owned_client: httpx.AsyncClient | None = None
+        if client is None:
+            client = owned_client = httpx.AsyncClient()
+
+        try:
+            while True:
+                attempt_number += 1
+                elapsed_ms = (time.perf_counter() - start_time) * 1000
+                elapsed_seconds = elapsed_ms / 1000
+
+                # Check timeout before making request
+                if elapsed_seconds >= self.action.timeout_seconds:
+                    timed_out = True
+                    errors.append(
+                        f"Timeout after {elapsed_seconds:.1f}s "
+                        f"({attempt_number - 1} attempts)"
+                    )
+                    break
+
+                # Execute poll request
+                poll_start = time.perf_counter()
+                poll_error: str | None = None
+                poll_body: Any = None
+                poll_status_code: int | None = None
 
-                # Parse response body
                 try:
-                    poll_body = response.json()
-                except Exception:
-                    poll_body = response.text
-
-                last_body = poll_body
-
-            except (asyncio.CancelledError, KeyboardInterrupt):
-                raise
-            except httpx.TimeoutException as e:
-                poll_error = f"Request timeout: {e}"
-            except httpx.RequestError as e:
-                poll_error = f"Request error: {e}"
-            except Exception as e:
-                import traceback
-                from logging import getLogger
-                getLogger(__name__).debug(f"Unexpected exception in poll request: {traceback.format_exc()}")
-                poll_error = f"Unexpected error: {e}"
-
-            poll_end = time.perf_counter()
-            poll_latency_ms = (poll_end - poll_start) * 1000
-            poll_timestamp_ms = (poll_start - start_time) * 1000
-
-            # Check condition if no error
-            if poll_error is None:
-                condition_met = self._check_condition(
-                    poll_body,
-                    poll_status_code,
-                    self.action.expect,
+                    response = await client.request(**request_kwargs)
+
+                    poll_status_code = response.status_code
+                    last_status_code = poll_status_code
+
+                    # Parse response body
+                    try:
+                        poll_body = response.json()
+                    except Exception:
+                        poll_body = response.text
+
+                    last_body = poll_body
+
+                except (asyncio.CancelledError, KeyboardInterrupt):
+                    raise
+                except httpx.TimeoutException as e:
+                    poll_error = f"Request timeout: {e}"
+                except httpx.RequestError as e:
+                    poll_error = f"Request error: {e}"
+                except Exception as e:
+                    import traceback
+                    from logging import getLogger
+                    getLogger(__name__).debug(f"Unexpected exception in poll request: {traceback.format_exc()}")
+                    poll_error = f"Unexpected error: {e}"
+
+                poll_end = time.perf_counter()
+                poll_latency_ms = (poll_end - poll_start) * 1000
+                poll_timestamp_ms = (poll_start - start_time) * 1000
+
+                # Check condition if no error
+                if poll_error is None:
+                    condition_met = self._check_condition(
+                        poll_body,
+                        poll_status_code,
+                        self.action.expect,
+                    )
+
+                # Record attempt
+                attempt = PollAttempt(
+                    attempt_number=attempt_number,
+                    timestamp_ms=poll_timestamp_ms,
+                    latency_ms=poll_latency_ms,
+                    status_code=poll_status_code,
+                    body=poll_body,
+                    condition_met=condition_met,
+                    error=poll_error,
                 )
+                attempts.append(attempt)
 
-            # Record attempt
-            attempt = PollAttempt(
-                attempt_number=attempt_number,
-                timestamp_ms=poll_timestamp_ms,
-                latency_ms=poll_latency_ms,
-                status_code=poll_status_code,
-                body=poll_body,
-                condition_met=condition_met,
-                error=poll_error,
-            )
-            attempts.append(attempt)
-
-            # If condition met, we're done
-            if condition_met:
-                break
-
-            # Wait before next poll, but check we won't exceed timeout
-            remaining_seconds = self.action.timeout_seconds - elapsed_seconds
-            sleep_time = min(self.action.interval_seconds, remaining_seconds)
-
-            if sleep_time <= 0:
-                timed_out = True
-                errors.append(
-                    f"Timeout after {elapsed_seconds:.1f}s ({attempt_number} attempts)"
-                )
-                break
+                # If condition met, we're done
+                if condition_met:
+                    break
+
+                # Wait before next poll, but check we won't exceed timeout
+                remaining_seconds = self.action.timeout_seconds - elapsed_seconds
+                sleep_time = min(self.action.interval_seconds, remaining_seconds)
+
+                if sleep_time <= 0:
+                    timed_out = True
+                    errors.append(
+                        f"Timeout after {elapsed_seconds:.1f}s "
+                        f"({attempt_number} attempts)"
+                    )
+                    break
 
-            await asyncio.sleep(sleep_time)
+                await asyncio.sleep(sleep_time)
+        finally:
+            if owned_client is not None:
+                await owned_client.aclose()
 
         end_time = time.perf_counter()
         total_latency_ms = (end_time - start_time) * 1000
@@ -261,7 +271,8 @@ class WaitActionRunner(BaseActionRunner):
             timed_out=timed_out,
         )
 
-        return observation, dict(context)
+        # Wait actions extract nothing, so the input context is returned as is
+        return observation, context
 
     def _check_condition(
         self,
@@ -286,15 +297,15 @@ class WaitActionRunner(BaseActionRunner):
 
         # Check JSONPath condition if specified
         if expect.jsonpath is not None:
+            parsed_path = expect._compiled_jsonpath
+            if parsed_path is None:
+                return False
             try:
-                parsed_path = jsonpath_parse(expect.jsonpath)
-                matches = parsed_path.find(body)
+                value = parsed_path.first(body)
 
-                if not matches:
+                if value is NO_MATCH:
                     return False
 
-                value = matches[0].value
-
                 # Check equals
                 if expect.equals is not None:
                     if value != expect.equals:
@@ -305,8 +316,6 @@ class WaitActionRunner(BaseActionRunner):
                     if not self._check_contains(value, expect.contains):
                         return False
 
-            except JsonPathParserError:
-                return False
             except Exception:
                 return False
 
@@ -6,9 +6,11 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
+from turbulence.api.responses import ArtifactJSONResponse
 from turbulence.api.routes.configs import router as configs_router
 from turbulence.api.routes.runs import router as runs_router
 from turbulence.api.routes.stream import router as stream_router
+from turbulence.api.services.artifact_reader import ArtifactReaderService
 
 
 def create_app(
@@ -32,6 +34,7 @@ def create_app(
         title="Turbulence API",
         description="API for Turbulence workflow testing framework",
         version="0.1.0",
+        default_response_class=ArtifactJSONResponse,
     )
 
     # CORS middleware for development
@@ -48,6 +51,9 @@ def create_app(
     app.state.sut_dir = sut_dir
     app.state.scenarios_dir = scenarios_dir
 
+    # One reader serves every request; routes fetch it via get_reader
+    app.state.reader = ArtifactReaderService(runs_dir)
+
     # Include API routes
     app.include_router(runs_router, prefix="/api")
     app.include_router(stream_router, prefix="/api")
@@ -0,0 +1,29 @@
+"""Response classes for the Turbulence API."""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+def encode_json(content: Any) -> bytes:
+    """Encode content as compact UTF-8 JSON, the way pydantic responses are.
+
+    Datetimes use "Z" for UTC, and NaN and infinity, which the JSONL
+    artifacts can contain, are written as null so the output stays valid
+    JSON.
+    """
+    return to_json(content, inf_nan_mode="null")
+
+
+class ArtifactJSONResponse(JSONResponse):
+    """JSON response that encodes artifact payloads in a single pass.
+
+    Routes that return this response directly skip FastAPI's response model
+    validation and ``jsonable_encoder`` walk; the payload is handed straight
+    to ``encode_json``.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Encode content as compact UTF-8 JSON."""
+        return encode_json(content)
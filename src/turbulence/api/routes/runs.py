@@ -1,18 +1,44 @@
 """Routes for run management."""
 
-from dataclasses import asdict
-from typing import Any
+from collections.abc import Iterator
 
-from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
+from turbulence.api.responses import ArtifactJSONResponse, encode_json
 from turbulence.api.services.artifact_reader import ArtifactReaderService
 
 router = APIRouter(tags=["runs"])
 
+# Runs may still be in progress, so clients must revalidate on every use
+_CACHE_CONTROL = "no-cache"
+
+# Streamed NDJSON is sent in chunks of about this many bytes rather than one
+# ASGI message per row
+_STREAM_CHUNK_SIZE = 64 * 1024
 
 def get_reader(request: Request) -> ArtifactReaderService:
-    """Get artifact reader from app state."""
-    return ArtifactReaderService(request.app.state.runs_dir)
+    """Get the shared artifact reader from app state."""
+    reader: ArtifactReaderService = request.app.state.reader
+    return reader
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def _cache_headers(etag: str | None) -> dict[str, str]:
+    """Build caching headers for a response with an optional ETag."""
+    if etag is None:
+        return {}
+    return {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
 
 
 @router.get("/runs")
@@ -22,7 +48,7 @@ def list_runs(
     query: str | None = Query(default=None),
     status: str | None = Query(default=None, pattern="^(passed|failed)$"),
     slow_threshold: float | None = Query(default=None),
-) -> dict[str, Any]:
+) -> ArtifactJSONResponse:
     """List all available runs.
 
     Args:
@@ -42,11 +68,11 @@ def list_runs(
         status=status,
         slow_threshold=slow_threshold
     )
-    return {"runs": [asdict(run) for run in runs]}
+    return ArtifactJSONResponse({"runs": [run.to_dict() for run in runs]})
 
 
 @router.get("/runs/{run_id}")
-def get_run(request: Request, run_id: str) -> dict[str, Any]:
+def get_run(request: Request, run_id: str) -> Response:
     """Get details for a specific run.
 
     Args:
@@ -60,10 +86,16 @@ def get_run(request: Request, run_id: str) -> dict[str, Any]:
         HTTPException: If run not found.
     """
     reader = get_reader(request)
+
+    # Stat the artifacts before reading them, so the tag never outruns the body
+    etag = reader.run_etag(run_id)
+    if etag is not None and _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=_cache_headers(etag))
+
     run = reader.get_run(run_id)
     if run is None:
         raise HTTPException(status_code=404, detail=f"Run '{run_id}' not found")
-    return asdict(run)
+    return ArtifactJSONResponse(run.to_dict(), headers=_cache_headers(etag))
 
 
 @router.get("/runs/{run_id}/instances")
@@ -73,7 +105,7 @@ def list_instances(
     status: str | None = Query(default=None, pattern="^(passed|failed|errors)$"),
     page: int = Query(default=1, ge=1),
     limit: int = Query(default=50, ge=1, le=100),
-) -> dict[str, Any]:
+) -> ArtifactJSONResponse:
     """List instances for a run.
 
     Args:
@@ -88,11 +120,50 @@ def list_instances(
     """
     reader = get_reader(request)
     instances = reader.list_instances(run_id, status=status, page=page, limit=limit)
-    return {"instances": [asdict(inst) for inst in instances]}
+    return ArtifactJSONResponse({"instances": [inst.to_dict() for inst in instances]})
+
+
+# Declared before the instance detail route so "stream" is not taken as an ID
+@router.get("/runs/{run_id}/instances/stream")
+def stream_instances(
+    request: Request,
+    run_id: str,
+    status: str | None = Query(default=None, pattern="^(passed|failed|errors)$"),
+) -> StreamingResponse:
+    """Stream all instances for a run as newline-delimited JSON.
+
+    Unlike the paginated listing, instances are read and encoded one at a
+    time, so memory use does not grow with the size of the run.
+
+    Args:
+        request: FastAPI request object.
+        run_id: The run ID.
+        status: Optional filter (passed, failed, errors).
+
+    Returns:
+        Streaming response with one JSON instance per line.
+    """
+    reader = get_reader(request)
+
+    def generate() -> Iterator[bytes]:
+        chunk: list[bytes] = []
+        size = 0
+        for inst in reader.iter_instances(run_id, status=status):
+            line = encode_json(inst.to_dict())
+            chunk.append(line)
+            size += len(line) + 1
+            if size >= _STREAM_CHUNK_SIZE:
+                yield b"\n".join(chunk) + b"\n"
+                chunk.clear()
+                size = 0
+        if chunk:
+            yield b"\n".join(chunk) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @router.get("/runs/{run_id}/instances/{instance_id}")
-def get_instance(request: Request, run_id: str, instance_id: str) -> dict[str, Any]:
+def get_instance(request: Request, run_id: str, instance_id: str) -> Response:
     """Get detailed information for a specific instance.
 
     Args:
@@ -107,6 +178,12 @@ def get_instance(request: Request, run_id: str, instance_id: str) -> dict[str, A
         HTTPException: If instance not found.
     """
     reader = get_reader(request)
+
+    # Stat the artifacts before reading them, so the tag never outruns the body
+    etag = reader.instance_etag(run_id, instance_id)
+    if etag is not None and _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=_cache_headers(etag))
+
     instance = reader.get_instance(run_id, instance_id)
     if instance is None:
         raise HTTPException(
@@ -114,6 +191,4 @@ def get_instance(request: Request, run_id: str, instance_id: str) -> dict[str, A
             detail=f"Instance '{instance_id}' not found in run '{run_id}'",
         )
 
-    # Convert dataclasses to dict, handling nested structures
-    result = asdict(instance)
-    return result
+    return ArtifactJSONResponse(instance.to_dict(), headers=_cache_headers(etag))
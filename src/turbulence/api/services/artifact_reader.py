@@ -1,13 +1,76 @@
 """Artifact reader service for accessing run data."""
 
+import hashlib
+import heapq
 import json
-from dataclasses import dataclass
+import os
+import re
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
+try:
+    import orjson
 
-@dataclass
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # type: ignore[assignment]
+
+# Artifact files each response is built from, used to derive its ETag
+_RUN_FILES = ("manifest.json", "instances.jsonl", "summary.json")
+_INSTANCE_FILES = ("instances.jsonl", "steps.jsonl")
+
+# Number of decoded artifact files (scans and step indexes) kept in memory
+_FILE_CACHE_SIZE = 16
+
+# Number of run summaries kept in memory, enough for a few pages of list_runs
+_SUMMARY_CACHE_SIZE = 256
+
+# Threads reading run summaries concurrently in list_runs; the work is mostly
+# file IO, which releases the GIL
+_LIST_WORKERS = 8
+
+# Size and mtime of each artifact file that exists, used as a cache key
+_FileStats = tuple[tuple[str, int, int], ...]
+
+# Step records are written with instance_id as their first key, so the index
+# can usually read it without decoding the line. IDs containing escapes or
+# non-ASCII bytes fall back to a full decode.
+_LEADING_INSTANCE_ID = re.compile(rb'\{"instance_id": ?"([^"\\\x80-\xff]*)"')
+
+_T = TypeVar("_T")
+
+
+def _loads(data: bytes) -> Any:
+    """Decode one JSON document from bytes, using orjson when it is installed.
+
+    Documents orjson rejects but the stdlib accepts (such as NaN literals or
+    integers beyond 64 bits) are retried with ``json.loads``, so results and
+    the ``json.JSONDecodeError`` raised for invalid lines match the stdlib.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse a manifest timestamp, caching the result per string."""
+    return datetime.fromisoformat(value)
+
+
+@dataclass(slots=True)
 class RunStats:
     """Aggregated statistics for a run."""
 
@@ -19,8 +82,20 @@ class RunStats:
     duration_ms: float
     p95_latency_ms: float = 0.0
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return the stats as a JSON-ready dictionary."""
+        return {
+            "total": self.total,
+            "passed": self.passed,
+            "failed": self.failed,
+            "errors": self.errors,
+            "pass_rate": self.pass_rate,
+            "duration_ms": self.duration_ms,
+            "p95_latency_ms": self.p95_latency_ms,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class FailurePattern:
     """Represents a common failure pattern in a run."""
 
@@ -28,8 +103,16 @@ class FailurePattern:
     count: int
     percentage: float
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return the failure pattern as a JSON-ready dictionary."""
+        return {
+            "message": self.message,
+            "count": self.count,
+            "percentage": self.percentage,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class RunSummary:
     """Summary information for a run."""
 
@@ -41,8 +124,24 @@ class RunSummary:
     stats: RunStats
     failures: list[FailurePattern] | None = None
 
-
-@dataclass
+    def to_dict(self) -> dict[str, Any]:
+        """Return the run summary as a dictionary (datetimes left as is)."""
+        return {
+            "id": self.id,
+            "sut_name": self.sut_name,
+            "scenarios": self.scenarios,
+            "started_at": self.started_at,
+            "completed_at": self.completed_at,
+            "stats": self.stats.to_dict(),
+            "failures": (
+                None
+                if self.failures is None
+                else [failure.to_dict() for failure in self.failures]
+            ),
+        }
+
+
+@dataclass(slots=True)
 class InstanceSummary:
     """Summary information for an instance."""
 
@@ -53,8 +152,19 @@ class InstanceSummary:
     duration_ms: float
     error: str | None
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return the instance summary as a JSON-ready dictionary."""
+        return {
+            "instance_id": self.instance_id,
+            "correlation_id": self.correlation_id,
+            "scenario_id": self.scenario_id,
+            "passed": self.passed,
+            "duration_ms": self.duration_ms,
+            "error": self.error,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class StepObservation:
     """Observation data for a step."""
 
@@ -66,8 +176,20 @@ class StepObservation:
     errors: list[str]
     turbulence: dict[str, Any] | None = None
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return the observation as a JSON-ready dictionary."""
+        return {
+            "ok": self.ok,
+            "status_code": self.status_code,
+            "latency_ms": self.latency_ms,
+            "headers": self.headers,
+            "body": self.body,
+            "errors": self.errors,
+            "turbulence": self.turbulence,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class Step:
     """Step data for an instance."""
 
@@ -76,8 +198,17 @@ class Step:
     type: str
     observation: StepObservation
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return the step as a JSON-ready dictionary."""
+        return {
+            "index": self.index,
+            "name": self.name,
+            "type": self.type,
+            "observation": self.observation.to_dict(),
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class InstanceDetail:
     """Detailed information for an instance."""
 
@@ -89,9 +220,104 @@ class InstanceDetail:
     entry: dict[str, Any]
     steps: list[Step]
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return the instance detail as a JSON-ready dictionary."""
+        return {
+            "instance_id": self.instance_id,
+            "correlation_id": self.correlation_id,
+            "scenario_id": self.scenario_id,
+            "passed": self.passed,
+            "duration_ms": self.duration_ms,
+            "entry": self.entry,
+            "steps": [step.to_dict() for step in self.steps],
+        }
+
+
+def _iter_records(lines: Iterable[bytes]) -> Iterator[Any]:
+    """Decode JSONL lines, skipping blank and malformed ones."""
+    for line in lines:
+        if not line or line.isspace():
+            continue
+        try:
+            yield _loads(line)
+        except json.JSONDecodeError:
+            continue
+
+
+def _instance_summary(data: dict[str, Any]) -> InstanceSummary:
+    """Build an instance summary from an instances.jsonl record."""
+    return InstanceSummary(
+        instance_id=data.get("instance_id", ""),
+        correlation_id=data.get("correlation_id", ""),
+        scenario_id=data.get("scenario_id", ""),
+        passed=data.get("passed"),
+        duration_ms=data.get("duration_ms", 0),
+        error=data.get("error"),
+    )
+
+
+def _matches_status(data: dict[str, Any], status: str | None) -> bool:
+    """Check an instances.jsonl record against a status filter.
+
+    Works on the raw record so that rows filtered out never get an
+    InstanceSummary built for them.
+    """
+    if status == "passed":
+        return bool(data.get("passed"))
+    if status == "failed":
+        return not data.get("passed")
+    if status == "errors":
+        return bool(data.get("error"))
+    return True
+
+
+@dataclass(slots=True)
+class _ScanResult:
+    """Everything read from one pass over a run's instances.jsonl.
+
+    Shared between requests through the scan cache, so it is never mutated
+    once built.
+    """
+
+    total: int = 0
+    passed: int = 0
+    failed: int = 0
+    errors: int = 0
+    total_duration: float = 0.0
+    failures: list[FailurePattern] = field(default_factory=list)
+    records: list[dict[str, Any]] = field(default_factory=list)
+    by_id: dict[str, dict[str, Any]] = field(default_factory=dict)
+    by_status: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class _StepIndex:
+    """Byte offset and length of each steps.jsonl line, grouped by instance ID.
+
+    ``end`` is the offset just past the last line indexed, so the index of a
+    file that has only been appended to can be extended from there rather
+    than rebuilt. Like ``_ScanResult`` it is shared through the cache and
+    never mutated once built.
+    """
+
+    inode: int
+    end: int = 0
+    ranges: dict[str, list[tuple[int, int]]] = field(default_factory=dict)
+
 
 class ArtifactReaderService:
-    """Service for reading Turbulence run artifacts."""
+    """Service for reading Turbulence run artifacts.
+
+    The API creates one instance per app and shares it across requests, which
+    sync routes serve from a thread pool. Methods only read from disk, but
+    the reader keeps two LRU caches keyed by path and the files' stat
+    results: decoded artifact files (instance scans and step indexes) in
+    ``_file_cache``, and run summaries in ``_summary_cache``. Both are only
+    touched while holding ``_file_cache_lock``. Files are decoded outside the
+    lock, so concurrent misses may read the same file twice, and the last
+    result stored wins. Cached values are never mutated once built, so they
+    are safe to share between threads.
+    """
 
     def __init__(self, runs_dir: Path) -> None:
         """Initialize the artifact reader.
@@ -100,6 +326,13 @@ class ArtifactReaderService:
             runs_dir: Directory containing run artifacts.
         """
         self.runs_dir = runs_dir
+        self._file_cache: OrderedDict[Path, tuple[tuple[int, int], Any]] = (
+            OrderedDict()
+        )
+        self._file_cache_lock = threading.Lock()
+        self._summary_cache: OrderedDict[Path, tuple[_FileStats, RunSummary]] = (
+            OrderedDict()
+        )
 
     def list_runs(
         self,
@@ -121,45 +354,53 @@ class ArtifactReaderService:
         """
         runs: list[RunSummary] = []
 
-        if not self.runs_dir.exists():
+        try:
+            # scandir reports entry types from the directory listing itself,
+            # so only names are materialized and no per-entry stat is needed
+            with os.scandir(self.runs_dir) as entries:
+                run_names = [entry.name for entry in entries if entry.is_dir()]
+        except (FileNotFoundError, NotADirectoryError):
             return runs
 
-        for run_path in sorted(self.runs_dir.iterdir(), reverse=True):
-            if not run_path.is_dir():
-                continue
-
-            manifest_path = run_path / "manifest.json"
-            if not manifest_path.exists():
-                continue
-
-            try:
-                summary = self._read_run_summary(run_path)
-
-                # Apply filters
-                if query:
-                    q = query.lower()
-                    matches = (
-                        q in summary.id.lower() or
-                        q in summary.sut_name.lower() or
-                        any(q in s.lower() for s in summary.scenarios)
-                    )
-                    if not matches:
+        run_names.sort(reverse=True)
+        next_index = 0
+        with ThreadPoolExecutor(max_workers=_LIST_WORKERS) as pool:
+            while next_index < len(run_names) and len(runs) < limit:
+                # Read the next batch of summaries concurrently, then filter
+                # them in order so results match a sequential scan
+                batch_size = max(limit - len(runs), _LIST_WORKERS)
+                batch = run_names[next_index : next_index + batch_size]
+                next_index += len(batch)
+
+                for summary in pool.map(self._try_read_run_summary, batch):
+                    if summary is None:
                         continue
 
-                if status == "passed" and summary.stats.failed > 0:
-                    continue
-                if status == "failed" and summary.stats.failed == 0:
-                    continue
+                    # Apply filters
+                    if query:
+                        q = query.lower()
+                        matches = (
+                            q in summary.id.lower() or
+                            q in summary.sut_name.lower() or
+                            any(q in s.lower() for s in summary.scenarios)
+                        )
+                        if not matches:
+                            continue
 
-                if slow_threshold is not None and summary.stats.p95_latency_ms <= slow_threshold:
-                    continue
+                    if status == "passed" and summary.stats.failed > 0:
+                        continue
+                    if status == "failed" and summary.stats.failed == 0:
+                        continue
 
-                runs.append(summary)
-            except (json.JSONDecodeError, KeyError, ValueError):
-                continue
+                    if (
+                        slow_threshold is not None
+                        and summary.stats.p95_latency_ms <= slow_threshold
+                    ):
+                        continue
 
-            if len(runs) >= limit:
-                break
+                    runs.append(summary)
+                    if len(runs) >= limit:
+                        break
 
         return runs
 
@@ -172,13 +413,9 @@ class ArtifactReaderService:
         Returns:
             Run summary or None if not found.
         """
-        run_path = self.runs_dir / run_id
-        if not run_path.exists():
-            return None
-
         try:
-            return self._read_run_summary(run_path)
-        except (json.JSONDecodeError, KeyError, ValueError):
+            return self._read_run_summary(self.runs_dir / run_id)
+        except (OSError, json.JSONDecodeError, KeyError, ValueError):
             return None
 
     def list_instances(
@@ -199,46 +436,44 @@ class ArtifactReaderService:
         Returns:
             List of instance summaries.
         """
-        run_path = self.runs_dir / run_id
-        instances_path = run_path / "instances.jsonl"
+        scan = self._scan_instances(self.runs_dir / run_id)
+        # The scan pre-buckets records by status filter, so any page is a
+        # direct slice; unknown filters match everything, like _matches_status
+        records = scan.by_status.get(status, scan.records) if status else scan.records
 
-        if not instances_path.exists():
-            return []
+        # Paginate, building summaries only for the rows on this page
+        start = (page - 1) * limit
+        end = start + limit
+        return [_instance_summary(data) for data in records[start:end]]
 
-        instances: list[InstanceSummary] = []
+    def iter_instances(
+        self,
+        run_id: str,
+        status: str | None = None,
+    ) -> Iterator[InstanceSummary]:
+        """Iterate over instances for a run, reading instances.jsonl lazily.
 
-        with instances_path.open() as f:
-            for line in f:
-                if not line.strip():
-                    continue
-
-                try:
-                    data = json.loads(line)
-                    instance = InstanceSummary(
-                        instance_id=data.get("instance_id", ""),
-                        correlation_id=data.get("correlation_id", ""),
-                        scenario_id=data.get("scenario_id", ""),
-                        passed=data.get("passed"),
-                        duration_ms=data.get("duration_ms", 0),
-                        error=data.get("error"),
-                    )
+        Unlike list_instances this does not use the scan cache, so memory use
+        stays constant however large the run is.
 
-                    # Apply filter
-                    if status == "passed" and not instance.passed:
-                        continue
-                    if status == "failed" and instance.passed:
-                        continue
-                    if status == "errors" and not instance.error:
-                        continue
+        Args:
+            run_id: The run ID.
+            status: Optional filter (passed, failed, errors).
 
-                    instances.append(instance)
-                except (json.JSONDecodeError, KeyError):
-                    continue
+        Yields:
+            Instance summaries in file order.
+        """
+        instances_path = self.runs_dir / run_id / "instances.jsonl"
 
-        # Paginate
-        start = (page - 1) * limit
-        end = start + limit
-        return instances[start:end]
+        try:
+            f = instances_path.open("rb")
+        except (FileNotFoundError, NotADirectoryError):
+            return
+
+        with f:
+            for data in _iter_records(f):
+                if _matches_status(data, status):
+                    yield _instance_summary(data)
 
     def get_instance(self, run_id: str, instance_id: str) -> InstanceDetail | None:
         """Get detailed information for a specific instance.
@@ -252,59 +487,52 @@ class ArtifactReaderService:
         """
         run_path = self.runs_dir / run_id
 
-        # Find instance in instances.jsonl
-        instances_path = run_path / "instances.jsonl"
-        instance_data: dict[str, Any] | None = None
-
-        if instances_path.exists():
-            with instances_path.open() as f:
-                for line in f:
-                    if not line.strip():
-                        continue
-                    try:
-                        data = json.loads(line)
-                        if data.get("instance_id") == instance_id:
-                            instance_data = data
-                            break
-                    except json.JSONDecodeError:
-                        continue
-
+        # Find instance via the cached instances.jsonl scan
+        instance_data = self._scan_instances(run_path).by_id.get(instance_id)
         if instance_data is None:
             return None
 
-        # Load steps from steps.jsonl
+        # Read only this instance's lines from steps.jsonl, via the step index
         steps_path = run_path / "steps.jsonl"
         steps: list[Step] = []
+        step_index = self._cached_read(
+            steps_path, self._index_steps, update=self._index_steps
+        )
 
-        if steps_path.exists():
-            with steps_path.open() as f:
-                step_index = 0
-                for line in f:
-                    if not line.strip():
-                        continue
+        if step_index is not None and instance_id in step_index.ranges:
+            steps_append = steps.append
+            with steps_path.open("rb") as f:
+                for offset, length in step_index.ranges[instance_id]:
+                    f.seek(offset)
                     try:
-                        data = json.loads(line)
-                        if data.get("instance_id") == instance_id:
-                            obs_data = data.get("observation", {})
-                            observation = StepObservation(
-                                ok=obs_data.get("ok", False),
-                                status_code=obs_data.get("status_code"),
-                                latency_ms=obs_data.get("latency_ms", 0),
-                                headers=obs_data.get("headers", {}),
-                                body=obs_data.get("body"),
-                                errors=obs_data.get("errors", []),
-                                turbulence=obs_data.get("turbulence"),
-                            )
-                            step = Step(
-                                index=step_index,
-                                name=data.get("action_name", f"step_{step_index}"),
-                                type=data.get("action_type", "unknown"),
-                                observation=observation,
-                            )
-                            steps.append(step)
-                            step_index += 1
-                    except (json.JSONDecodeError, KeyError):
+                        data = _loads(f.read(length))
+                    except json.JSONDecodeError:
                         continue
+                    index = len(steps)
+                    # Only format a fallback name for steps recorded without one
+                    name = (
+                        data["action_name"]
+                        if "action_name" in data
+                        else f"step_{index}"
+                    )
+                    obs_data = data.get("observation", {})
+                    observation = StepObservation(
+                        ok=obs_data.get("ok", False),
+                        status_code=obs_data.get("status_code"),
+                        latency_ms=obs_data.get("latency_ms", 0),
+                        headers=obs_data.get("headers", {}),
+                        body=obs_data.get("body"),
+                        errors=obs_data.get("errors", []),
+                        turbulence=obs_data.get("turbulence"),
+                    )
+                    steps_append(
+                        Step(
+                            index=index,
+                            name=name,
+                            type=data.get("action_type", "unknown"),
+                            observation=observation,
+                        )
+                    )
 
         return InstanceDetail(
             instance_id=instance_data.get("instance_id", ""),
@@ -316,7 +544,103 @@ class ArtifactReaderService:
             steps=steps,
         )
 
+    def run_etag(self, run_id: str) -> str | None:
+        """Get an ETag for the run summary returned by get_run.
+
+        Args:
+            run_id: The run ID.
+
+        Returns:
+            Quoted ETag, or None if none of the run's files exist.
+        """
+        return self._artifact_etag(self.runs_dir / run_id, _RUN_FILES)
+
+    def instance_etag(self, run_id: str, instance_id: str) -> str | None:
+        """Get an ETag for instance details returned by get_instance.
+
+        Args:
+            run_id: The run ID.
+            instance_id: The instance ID.
+
+        Returns:
+            Quoted ETag, or None if none of the run's instance files exist.
+        """
+        return self._artifact_etag(
+            self.runs_dir / run_id, _INSTANCE_FILES, scope=instance_id
+        )
+
+    def _artifact_etag(
+        self,
+        run_path: Path,
+        file_names: tuple[str, ...],
+        scope: str = "",
+    ) -> str | None:
+        """Derive an ETag from the size and mtime of a run's artifact files.
+
+        Only the files are stat-ed, so the tag is cheap to compute and changes
+        whenever an in-progress run appends to any of them. ``scope`` keeps
+        tags distinct for different resources built from the same files.
+        """
+        stats = self._file_stats(run_path, file_names)
+        if not stats:
+            return None
+
+        parts = [scope, *(f"{name}:{mtime}:{size}" for name, mtime, size in stats)]
+        digest = hashlib.blake2b("|".join(parts).encode(), digest_size=16)
+        return f'"{digest.hexdigest()}"'
+
+    def _try_read_run_summary(self, run_name: str) -> RunSummary | None:
+        """Read a run summary for list_runs, or None if it is not a valid run."""
+        try:
+            return self._read_run_summary(self.runs_dir / run_name)
+        except (OSError, json.JSONDecodeError, KeyError, ValueError):
+            # Directories without a readable manifest are not runs
+            return None
+
+    def _file_stats(self, run_path: Path, file_names: tuple[str, ...]) -> _FileStats:
+        """Stat a run's artifact files, skipping those that do not exist."""
+        stats: list[tuple[str, int, int]] = []
+        for name in file_names:
+            try:
+                stat = (run_path / name).stat()
+            except OSError:
+                continue
+            stats.append((name, stat.st_mtime_ns, stat.st_size))
+        return tuple(stats)
+
     def _read_run_summary(self, run_path: Path) -> RunSummary:
+        """Read a run summary, reusing it while the run's files are unchanged.
+
+        Summaries are cached per run in an LRU sized for list_runs pages, so
+        polling the run list only stats each run's files once the summaries
+        are built. The files are stat-ed before reading, so a change made
+        during the read is picked up by the next call.
+
+        Args:
+            run_path: Path to the run directory.
+
+        Returns:
+            Run summary with computed stats; must not be mutated.
+        """
+        key = self._file_stats(run_path, _RUN_FILES)
+
+        with self._file_cache_lock:
+            cached = self._summary_cache.get(run_path)
+            if cached is not None and cached[0] == key:
+                self._summary_cache.move_to_end(run_path)
+                return cached[1]
+
+        summary = self._build_run_summary(run_path)
+
+        with self._file_cache_lock:
+            self._summary_cache[run_path] = (key, summary)
+            self._summary_cache.move_to_end(run_path)
+            while len(self._summary_cache) > _SUMMARY_CACHE_SIZE:
+                self._summary_cache.popitem(last=False)
+
+        return summary
+
+    def _build_run_summary(self, run_path: Path) -> RunSummary:
         """Read run summary from manifest and compute stats.
 
         Args:
@@ -331,85 +655,37 @@ class ArtifactReaderService:
             manifest = json.load(f)
 
         # Compute stats from instances
-        instances_path = run_path / "instances.jsonl"
-        total = 0
-        passed = 0
-        failed = 0
-        errors = 0
-        total_duration = 0.0
-
-        if instances_path.exists():
-            with instances_path.open() as f:
-                failure_messages: dict[str, int] = {}
-                for line in f:
-                    if not line.strip():
-                        continue
-                    try:
-                        data = json.loads(line)
-                        total += 1
-                        total_duration += data.get("duration_ms", 0)
-
-                        error_msg = data.get("error")
-                        if error_msg:
-                            errors += 1
-                            failure_messages[error_msg] = (
-                                failure_messages.get(error_msg, 0) + 1
-                            )
-                        elif not data.get("passed"):
-                            failed += 1
-                            # Group by scenario if no error msg
-                            msg = f"Failed: {data.get('scenario_id')}"
-                            failure_messages[msg] = failure_messages.get(msg, 0) + 1
-                        else:
-                            passed += 1
-                    except json.JSONDecodeError:
-                        continue
-
-                # Convert failure messages to sorted patterns
-                failures = []
-                sorted_failures = sorted(
-                    failure_messages.items(), key=lambda x: x[1], reverse=True
-                )
-                for msg, count in sorted_failures:
-                    failures.append(
-                        FailurePattern(
-                            message=msg,
-                            count=count,
-                            percentage=(count / total * 100) if total > 0 else 0,
-                        )
-                    )
-                # Top 5 failures
-                top_failures = failures[:5]
+        scan = self._scan_instances(run_path)
+        total = scan.total
+        passed = scan.passed
 
         pass_rate = (passed / total * 100) if total > 0 else 0.0
 
         # Try to load p95 from summary.json
         summary_path = run_path / "summary.json"
         p95 = 0.0
-        if summary_path.exists():
-            try:
-                summary_data = json.loads(summary_path.read_text())
-                p95 = summary_data.get("p95_latency_ms", 0.0)
-            except:
-                pass
+        try:
+            summary_data = json.loads(summary_path.read_text())
+            p95 = summary_data.get("p95_latency_ms", 0.0)
+        except (OSError, ValueError, AttributeError):
+            pass
 
         stats = RunStats(
             total=total,
             passed=passed,
-            failed=failed,
-            errors=errors,
+            failed=scan.failed,
+            errors=scan.errors,
             pass_rate=pass_rate,
-            duration_ms=total_duration,
+            duration_ms=scan.total_duration,
             p95_latency_ms=p95,
         )
 
-        started_at = datetime.fromisoformat(
-            manifest.get("started_at", datetime.now().isoformat())
+        started_at_str = manifest.get("started_at")
+        started_at = (
+            _parse_iso(started_at_str) if started_at_str is not None else datetime.now()
         )
         completed_at_str = manifest.get("completed_at")
-        completed_at = (
-            datetime.fromisoformat(completed_at_str) if completed_at_str else None
-        )
+        completed_at = _parse_iso(completed_at_str) if completed_at_str else None
 
         return RunSummary(
             id=run_path.name,
@@ -418,5 +694,193 @@ class ArtifactReaderService:
             started_at=started_at,
             completed_at=completed_at,
             stats=stats,
-            failures=top_failures,
+            failures=scan.failures,
+        )
+
+    def _scan_instances(self, run_path: Path) -> _ScanResult:
+        """Scan a run's instances.jsonl once, reusing the result while unchanged.
+
+        Results are cached per file and reused while its mtime and size are
+        unchanged, so the summary and instance listing of a run share a
+        single decode pass.
+
+        Args:
+            run_path: Path to the run directory.
+
+        Returns:
+            Aggregates and records for the run (empty if there is no file).
+        """
+        scan = self._cached_read(run_path / "instances.jsonl", self._read_instances)
+        return scan if scan is not None else _ScanResult()
+
+    def _cached_read(
+        self,
+        path: Path,
+        read: Callable[[Path], _T],
+        update: Callable[[Path, _T], _T] | None = None,
+    ) -> _T | None:
+        """Read and decode an artifact file, reusing the result while unchanged.
+
+        Results are cached per file in a small LRU and reused while the
+        file's mtime and size are unchanged. When the file changes (such as
+        appends by an in-progress run), the stale result is passed to
+        ``update`` if given, otherwise the file is read afresh.
+
+        Args:
+            path: Artifact file to read.
+            read: Function decoding the file; its result must not be mutated.
+            update: Optional function deriving a new result from the file and
+                the stale one, without mutating the stale result.
+
+        Returns:
+            The decoded result, or None if the file does not exist.
+        """
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        key = (stat.st_mtime_ns, stat.st_size)
+
+        with self._file_cache_lock:
+            cached = self._file_cache.get(path)
+            if cached is not None and cached[0] == key:
+                self._file_cache.move_to_end(path)
+                result: _T = cached[1]
+                return result
+
+        if cached is not None and update is not None:
+            result = update(path, cached[1])
+        else:
+            result = read(path)
+
+        with self._file_cache_lock:
+            self._file_cache[path] = (key, result)
+            self._file_cache.move_to_end(path)
+            while len(self._file_cache) > _FILE_CACHE_SIZE:
+                self._file_cache.popitem(last=False)
+
+        return result
+
+    def _index_steps(
+        self, steps_path: Path, previous: _StepIndex | None = None
+    ) -> _StepIndex:
+        """Map each instance ID to the byte ranges of its steps.jsonl lines.
+
+        Args:
+            steps_path: The steps.jsonl file to index.
+            previous: An earlier index of the same file. If the file has only
+                grown since, indexing resumes where it left off.
+
+        Returns:
+            The step index for the file's current contents.
+        """
+        with steps_path.open("rb") as f:
+            stat = os.fstat(f.fileno())
+            if (
+                previous is not None
+                and previous.inode == stat.st_ino
+                and previous.end <= stat.st_size
+            ):
+                ranges = dict(previous.ranges)
+                offset = previous.end
+                f.seek(offset)
+            else:
+                ranges = {}
+                offset = 0
+
+            # Lists shared with the previous index are copied before appending
+            copied: set[str] = set()
+            for line in f:
+                length = len(line)
+                match = _LEADING_INSTANCE_ID.match(line)
+                if match is not None and line.endswith(b"\n"):
+                    instance_id: Any = match.group(1).decode("ascii")
+                elif line.strip():
+                    try:
+                        instance_id = _loads(line).get("instance_id")
+                    except json.JSONDecodeError:
+                        if not line.endswith(b"\n"):
+                            # A line still being written; resume from it next time
+                            break
+                        instance_id = None
+                else:
+                    instance_id = None
+
+                if isinstance(instance_id, str):
+                    if instance_id not in copied:
+                        ranges[instance_id] = list(ranges.get(instance_id, ()))
+                        copied.add(instance_id)
+                    ranges[instance_id].append((offset, length))
+                offset += length
+
+        return _StepIndex(inode=stat.st_ino, end=offset, ranges=ranges)
+
+    def _read_instances(self, instances_path: Path) -> _ScanResult:
+        """Decode instances.jsonl into aggregates and per-instance records."""
+        # The whole scan is cached in memory anyway, so read the file in one
+        # call and split it rather than iterating line by line
+        records = list(_iter_records(instances_path.read_bytes().splitlines()))
+
+        # Aggregate in locals rather than incrementing dataclass attributes
+        # per row; this loop dominates the cost of a large run's summary
+        by_id: dict[str, dict[str, Any]] = {}
+        by_status: dict[str, list[dict[str, Any]]] = {
+            "passed": [],
+            "failed": [],
+            "errors": [],
+        }
+        failure_messages: dict[str, int] = {}
+        errors = failed = 0
+        for data in records:
+            instance_id = data.get("instance_id")
+            if isinstance(instance_id, str) and instance_id not in by_id:
+                by_id[instance_id] = data
+
+            # Scenario IDs and error messages repeat across most rows; intern
+            # them so the cached records share one copy of each
+            scenario_id = data.get("scenario_id")
+            if isinstance(scenario_id, str):
+                data["scenario_id"] = sys.intern(scenario_id)
+            error_msg = data.get("error")
+            if isinstance(error_msg, str):
+                data["error"] = error_msg = sys.intern(error_msg)
+
+            # Same buckets as _matches_status, which differs from the
+            # aggregate counts below in that an errored row may still pass
+            by_status["passed" if data.get("passed") else "failed"].append(data)
+            if error_msg:
+                by_status["errors"].append(data)
+
+            if error_msg:
+                errors += 1
+                failure_messages[error_msg] = failure_messages.get(error_msg, 0) + 1
+            elif not data.get("passed"):
+                failed += 1
+                # Group by scenario if no error msg
+                msg = f"Failed: {data.get('scenario_id')}"
+                failure_messages[msg] = failure_messages.get(msg, 0) + 1
+
+        total = len(records)
+        scan = _ScanResult(
+            total=total,
+            passed=total - errors - failed,
+            failed=failed,
+            errors=errors,
+            total_duration=sum(data.get("duration_ms", 0) for data in records),
+            records=records,
+            by_id=by_id,
+            by_status=by_status,
         )
+
+        # Convert the top 5 failure messages to patterns; nlargest keeps the
+        # same order as a stable descending sort without sorting every message
+        top_failures = heapq.nlargest(5, failure_messages.items(), key=lambda x: x[1])
+        scan.failures = [
+            FailurePattern(
+                message=msg,
+                count=count,
+                percentage=(count / total * 100) if total > 0 else 0,
+            )
+            for msg, count in top_failures
+        ]
+        return scan
@@ -9,7 +9,6 @@ from typing import Annotated
 
 import typer
 from rich.console import Console
-from rich.markdown import Markdown
 
 console = Console()
 
@@ -64,6 +63,8 @@ async def _analyze_async(
     """
     import os
 
+    from rich.markdown import Markdown
+
     from turbulence.llm.prompts import ANALYSIS_PROMPT, ANALYSIS_SYSTEM
 
     # Check for API key
@@ -7,14 +7,6 @@ import typer
 from rich.console import Console
 from rich.progress import Progress
 
-from turbulence.models.manifest import (
-    AssertionRecord,
-    InstanceRecord,
-    RunManifest,
-    StepRecord,
-)
-from turbulence.storage.sqlite import SQLiteStorageWriter
-
 console = Console()
 
 
@@ -33,6 +25,14 @@ def migrate(
     Reads instances.jsonl, steps.jsonl, and assertions.jsonl from the run
     directory and populates a turbulence.db file.
     """
+    from turbulence.models.manifest import (
+        AssertionRecord,
+        InstanceRecord,
+        RunManifest,
+        StepRecord,
+    )
+    from turbulence.storage.sqlite import SQLiteStorageWriter
+
     manifest_path = run_path / "manifest.json"
     if not manifest_path.exists():
         console.print(f"[red]Error:[/red] Manifest not found at {manifest_path}")
@@ -6,8 +6,6 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
-from turbulence.config.loader import load_sut
-
 console = Console()
 
 
@@ -24,6 +22,8 @@ def profiles(
     ),
 ) -> None:
     """List available environment profiles in a SUT configuration."""
+    from turbulence.config.loader import load_sut
+
     try:
         # Load raw config to see all profiles, ignoring profile resolution errors
         config = load_sut(sut)
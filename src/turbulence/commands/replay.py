@@ -1,7 +1,10 @@
 """Replay command for re-executing specific workflow instances."""
 
+from __future__ import annotations
+
 import asyncio
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 import yaml
@@ -9,13 +12,9 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from turbulence.config.sut import SUTConfig
-from turbulence.engine.replay import (
-    InstanceNotFoundError,
-    ReplayEngine,
-    ReplayResult,
-    StepResult,
-)
+if TYPE_CHECKING:
+    from turbulence.config.sut import SUTConfig
+    from turbulence.engine.replay import ReplayResult, StepResult
 
 console = Console()
 
@@ -29,6 +28,8 @@ def _load_sut_config(sut_path: Path) -> SUTConfig:
     Returns:
         SUTConfig object.
     """
+    from turbulence.config.sut import SUTConfig
+
     with sut_path.open() as f:
         data = yaml.safe_load(f)
     return SUTConfig(**data)
@@ -171,6 +172,9 @@ async def _run_replay(
     Returns:
         Exit code (0 for success, 1 for failure).
     """
+    from turbulence.engine.replay import InstanceNotFoundError, ReplayEngine
+    from turbulence.storage.base import RunNotFoundError
+
     # Load SUT config if provided
     sut_config = None
     if sut_path is not None and sut_path.exists():
@@ -200,6 +204,9 @@ async def _run_replay(
         console.print(f"  Correlation ID: [cyan]{instance_data.correlation_id}[/cyan]")
         console.print(f"  Scenario: [cyan]{instance_data.scenario_id}[/cyan]")
         console.print()
+    except RunNotFoundError:
+        console.print(f"[red]Error: Run '{run_id}' not found in {runs_dir}[/red]")
+        return 1
     except InstanceNotFoundError as e:
         console.print(f"[red]Error: {e}[/red]")
         return 1
@@ -301,11 +308,6 @@ def replay(
         turbulence replay --run-id run_20240115_001 --instance-id inst_042
         turbulence replay -r run_001 -i inst_042 --sut sut.yaml --scenarios scenarios/
     """
-    run_path = runs_dir / run_id
-    if not run_path.exists():
-        console.print(f"[red]Error: Run '{run_id}' not found in {runs_dir}[/red]")
-        raise typer.Exit(code=1)
-
     exit_code = asyncio.run(
         _run_replay(
             run_id=run_id,
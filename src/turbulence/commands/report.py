@@ -5,8 +5,6 @@ from pathlib import Path
 import typer
 from rich.console import Console
 
-from turbulence.report import HTMLReportGenerator
-
 console = Console()
 
 
@@ -44,10 +42,6 @@ def report(
         turbulence report --run-id run_20240115_001
     """
     run_path = runs_dir / run_id
-    if not run_path.exists():
-        console.print(f"[red]Error: Run '{run_id}' not found in {runs_dir}[/red]")
-        raise typer.Exit(code=1)
-
     output_path = output or (run_path / "report.html")
 
     console.print("[bold blue]Turbulence Report[/bold blue]")
@@ -56,10 +50,16 @@ def report(
     console.print(f"  Output: {output_path}")
     console.print()
 
+    from turbulence.report import HTMLReportGenerator
+    from turbulence.storage.base import RunNotFoundError
+
     try:
         generator = HTMLReportGenerator(run_path)
         result_path = generator.generate(output_path)
         console.print(f"[green]Report generated successfully: {result_path}[/green]")
+    except RunNotFoundError:
+        console.print(f"[red]Error: Run '{run_id}' not found in {runs_dir}[/red]")
+        raise typer.Exit(code=1) from None
     except Exception as e:
         console.print(f"[red]Error generating report: {e}[/red]")
         raise typer.Exit(code=1) from None
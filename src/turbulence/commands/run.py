@@ -1,42 +1,25 @@
 """Run command for executing workflow simulations."""
 
+from __future__ import annotations
+
 import asyncio
 import random
 import time
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import typer
 from rich.console import Console
 
-import yaml
-
-from turbulence.actions.assert_ import AssertActionRunner
-from turbulence.actors.policy import Policy, PolicyConfig
-from turbulence.config.loader import load_scenario, load_scenarios, load_sut
-from turbulence.config.scenario import (
-    AssertAction,
-    Assertion,
-    Scenario,
-)
-from turbulence.engine.client_pool import ClientPool
-from turbulence.engine.context import WorkflowContext
-from turbulence.engine.executor import (
-    DEFAULT_PARALLELISM,
-    InstanceResult,
-    ParallelExecutor,
-)
-from turbulence.engine.scenario_runner import ScenarioRunner
-from turbulence.engine.template import TemplateEngine
-from turbulence.gating import Threshold, ThresholdError
-from turbulence.models.assertion_result import AssertionResult
-from turbulence.models.manifest import RunConfig
-from turbulence.models.observation import Observation
-from turbulence.pressure.engine import TurbulenceEngine
-from turbulence.storage.artifact import ArtifactStore
-from turbulence.variation.engine import VariationEngine
+from turbulence.engine.executor import DEFAULT_PARALLELISM
+
+if TYPE_CHECKING:
+    from turbulence.config.scenario import Scenario
+    from turbulence.models.manifest import AssertionRecord, StepRecord
+    from turbulence.storage.artifact import ArtifactStore
 
 console = Console()
 
@@ -49,6 +32,8 @@ def generate_run_id(now: datetime | None = None) -> str:
 
 def load_scenarios_from_paths(scenario_paths: Sequence[Path]) -> list[Scenario]:
     """Load and validate scenarios from explicit file paths."""
+    from turbulence.config.loader import load_scenario
+
     scenarios: list[Scenario] = []
     for path in scenario_paths:
         scenarios.append(load_scenario(path))
@@ -181,6 +166,24 @@ async def _run_instances(
     run_id: str | None = None,
     policies_path: Path | None = None,
 ) -> int:
+    # Execution dependencies are imported here rather than at module level so
+    # that building the CLI (and running other commands) stays fast.
+    import yaml
+
+    from turbulence.actors.policy import Policy, PolicyConfig
+    from turbulence.config.loader import load_scenarios, load_sut
+    from turbulence.config.scenario import AssertAction
+    from turbulence.engine.client_pool import ClientPool
+    from turbulence.engine.context import WorkflowContext
+    from turbulence.engine.executor import InstanceResult, ParallelExecutor
+    from turbulence.engine.scenario_runner import ScenarioRunner, prepare_scenario
+    from turbulence.engine.template import TemplateEngine
+    from turbulence.gating import Threshold, ThresholdError
+    from turbulence.models.manifest import RunConfig
+    from turbulence.pressure.engine import TurbulenceEngine
+    from turbulence.storage.artifact import ArtifactStore
+    from turbulence.variation.engine import VariationEngine
+
     # Parse thresholds early to fail fast
     thresholds: list[Threshold] = []
     if fail_on:
@@ -243,23 +246,48 @@ async def _run_instances(
     ).initialize()
 
     template_engine = TemplateEngine()
-    client_pool = ClientPool(sut_config)
+    client_pool = ClientPool(sut_config, parallelism=parallelism)
     executor = ParallelExecutor(parallelism=parallelism, console=console)
 
+    # Artifact writes run on one background thread so file I/O never stalls
+    # the event loop; a single worker also keeps each file's write order
+    loop = asyncio.get_running_loop()
+    artifact_writer = ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="artifact-writer"
+    )
+
+    scenario_assignments = _assign_scenarios(scenario_list, seed_value, instances)
+    # Turbulence engines are stateless, so instances of a scenario share one
+    turbulence_engines = {
+        scenario.id: TurbulenceEngine(scenario.turbulence, seed_value)
+        for scenario in scenario_list
+    }
+
+    # Entry blocks are the same for every instance of a scenario, so each is
+    # dumped once; instances share the dict and must not modify it in place
+    entry_data_by_scenario = {
+        scenario.id: scenario.entry.model_dump() for scenario in scenario_list
+    }
+
     async def execute_instance(instance_index: int) -> InstanceResult:
-        scenario = _pick_scenario(scenario_list, seed_value, instance_index)
-        entry_data = scenario.entry.model_dump()
+        scenario = scenario_assignments[instance_index]
+        entry_data = entry_data_by_scenario[scenario.id]
 
-        # Apply variations if configured
-        variations_applied = {}
+        # Apply variations if configured; they are recorded with the instance
+        # as part of its entry data
         if scenario.variation:
             variation_engine = VariationEngine(scenario.variation, seed_value)
             variations_applied = variation_engine.apply(instance_index)
 
-            # Inject into entry seed_data under 'variation' namespace
-            if "seed_data" not in entry_data:
-                entry_data["seed_data"] = {}
-            entry_data["seed_data"]["variation"] = variations_applied
+            # Inject into entry seed_data under 'variation' namespace, copying
+            # only the shared levels that change
+            entry_data = {
+                **entry_data,
+                "seed_data": {
+                    **entry_data.get("seed_data", {}),
+                    "variation": variations_applied,
+                },
+            }
 
         ctx = WorkflowContext.from_scenario_entry(entry_data, run_id=run_id)
         context_dict = ctx.to_dict()
@@ -267,17 +295,16 @@ async def _run_instances(
         if scenario.source_path is not None:
             context_dict["_scenario_path"] = scenario.source_path
 
-        # Log applied variations to artifact store
-        if variations_applied:
-            artifact_store.write_instance_artifact(
-                instance_id=ctx.instance_id,
-                filename="variation.json",
-                data=variations_applied,
-            )
-
-        instance_sut = sut_config.model_copy(deep=True)
-        instance_sut.default_headers["X-Correlation-ID"] = ctx.correlation_id
-        turbulence_engine = TurbulenceEngine(scenario.turbulence, seed_value)
+        # Shallow copy: only the headers differ per instance, services are shared
+        instance_sut = sut_config.model_copy(
+            update={
+                "default_headers": {
+                    **sut_config.default_headers,
+                    "X-Correlation-ID": ctx.correlation_id,
+                }
+            }
+        )
+        turbulence_engine = turbulence_engines[scenario.id]
 
         start_time = time.perf_counter()
         started_at = datetime.now(timezone.utc)
@@ -293,26 +320,36 @@ async def _run_instances(
             seed=seed_value + instance_index,  # Unique seed per instance
         )
 
+        # Records are buffered and written with the instance record, so each
+        # instance costs one write per file instead of one per step
+        step_records: list[StepRecord] = []
+        assertion_records: list[AssertionRecord] = []
+
         try:
             async for step_index, action, observation, context_dict in scenario_runner.execute_flow(
                 scenario, context_dict
             ):
-                artifact_store.write_step(
-                    instance_id=ctx.instance_id,
-                    correlation_id=ctx.correlation_id,
-                    step_index=step_index,
-                    step_name=action.name,
-                    step_type=action.type,
-                    observation=observation,
+                step_records.append(
+                    artifact_store.build_step_record(
+                        instance_id=ctx.instance_id,
+                        correlation_id=ctx.correlation_id,
+                        step_index=step_index,
+                        step_name=action.name,
+                        step_type=action.type,
+                        observation=observation,
+                    )
                 )
 
                 if isinstance(action, AssertAction):
-                    _write_assertion(
+                    _buffer_assertion(
+                        assertion_records,
                         artifact_store,
                         ctx.instance_id,
                         ctx.correlation_id,
                         step_index,
                         context_dict,
+                        # The assertion ran within this step; reuse its clock read
+                        timestamp=step_records[-1].timestamp,
                     )
 
                 if not observation.ok:
@@ -320,13 +357,12 @@ async def _run_instances(
 
             final_offset = len(scenario.flow)
             for assertion_index, assertion in enumerate(scenario.assertions):
-                observation, context_dict = await _execute_assertion(
-                    assertion=assertion,
-                    context=context_dict,
-                    template_engine=template_engine,
+                observation = await scenario_runner.execute_assertion(
+                    assertion, context_dict
                 )
 
-                _write_assertion(
+                _buffer_assertion(
+                    assertion_records,
                     artifact_store,
                     ctx.instance_id,
                     ctx.correlation_id,
@@ -348,17 +384,22 @@ async def _run_instances(
         completed_at = datetime.now(timezone.utc)
         duration_ms = (time.perf_counter() - start_time) * 1000
 
-        artifact_store.write_instance(
-            instance_id=ctx.instance_id,
-            correlation_id=ctx.correlation_id,
-            scenario_id=scenario.id,
-            started_at=started_at,
-            completed_at=completed_at,
-            duration_ms=duration_ms,
-            passed=passed,
-            entry_data=entry_data,
-            error=error,
-        )
+        def write_records() -> None:
+            artifact_store.write_step_batch(step_records)
+            artifact_store.write_assertion_batch(assertion_records)
+            artifact_store.write_instance(
+                instance_id=ctx.instance_id,
+                correlation_id=ctx.correlation_id,
+                scenario_id=scenario.id,
+                started_at=started_at,
+                completed_at=completed_at,
+                duration_ms=duration_ms,
+                passed=passed,
+                entry_data=entry_data,
+                error=error,
+            )
+
+        await loop.run_in_executor(artifact_writer, write_records)
 
         return InstanceResult(
             instance_id=ctx.instance_id,
@@ -372,9 +413,16 @@ async def _run_instances(
         )
 
     try:
+        # Compile templates and open clients before timing starts, so the
+        # first instances do not absorb one-time setup costs
+        for scenario in scenario_list:
+            prepare_scenario(scenario, template_engine)
+        await client_pool.warm_up()
+
         await executor.execute(instances, execute_instance)
     finally:
         await client_pool.close_all()
+        artifact_writer.shutdown(wait=True)
         summary = artifact_store.finalize()
 
     executor.print_summary()
@@ -399,55 +447,40 @@ async def _run_instances(
     return 0
 
 
-def _pick_scenario(
+def _assign_scenarios(
     scenarios: list[Scenario],
     seed_value: int,
-    instance_index: int,
-) -> Scenario:
+    instances: int,
+) -> list[Scenario]:
+    """Pick the scenario for every instance up front from one seeded stream."""
     if len(scenarios) == 1:
-        return scenarios[0]
-    rng = random.Random(seed_value + instance_index)  # noqa: S311
-    return rng.choice(scenarios)
-
+        return scenarios * instances
+    rng = random.Random(seed_value)  # noqa: S311
+    return rng.choices(scenarios, k=instances)
 
 
-
-async def _execute_assertion(
-    *,
-    assertion: Assertion,
-    context: dict[str, Any],
-    template_engine: TemplateEngine,
-) -> tuple[Observation, dict[str, Any]]:
-    """Execute a final assertion (not part of the flow)."""
-    assert_action = AssertAction(
-        name=assertion.name,
-        type="assert",
-        expect=assertion.expect,
-    )
-    # Render templates inline
-    action_dict = assert_action.model_dump()
-    rendered_dict = template_engine.render_dict(action_dict, context)
-    rendered_action = AssertAction(**rendered_dict)
-
-    runner = AssertActionRunner(action=rendered_action)
-    return await runner.execute(context)
-
-
-def _write_assertion(
+def _buffer_assertion(
+    records: list[AssertionRecord],
     artifact_store: ArtifactStore,
     instance_id: str,
     correlation_id: str,
     step_index: int,
     context: dict[str, Any],
+    timestamp: datetime | None = None,
 ) -> None:
     last_assertion = context.get("_last_assertion")
     if not last_assertion:
         return
 
+    from turbulence.models.assertion_result import AssertionResult
+
     assertion_result = AssertionResult.model_validate(last_assertion)
-    artifact_store.write_assertion(
-        instance_id=instance_id,
-        correlation_id=correlation_id,
-        step_index=step_index,
-        assertion_result=assertion_result,
+    records.append(
+        artifact_store.build_assertion_record(
+            instance_id=instance_id,
+            correlation_id=correlation_id,
+            step_index=step_index,
+            assertion_result=assertion_result,
+            timestamp=timestamp,
+        )
     )
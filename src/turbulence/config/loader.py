@@ -1,13 +1,33 @@
 """Configuration loaders for SUT and scenario files."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import yaml
+from jsonpath_ng.exceptions import JSONPathError
 from pydantic import ValidationError
 
 from turbulence.config.env import EnvVarError, resolve_env_vars
-from turbulence.config.scenario import Scenario
+from turbulence.config.scenario import (
+    Action,
+    AssertAction,
+    BranchAction,
+    GrpcAction,
+    HttpAction,
+    Scenario,
+    WaitAction,
+)
 from turbulence.config.sut import HttpServiceConfig, SUTConfig
+from turbulence.utils.jsonpath import compile_jsonpath
+
+# Threads used by load_scenarios to read scenario files concurrently
+_LOAD_WORKERS = 8
+
+# LibYAML's C parser is several times faster; PyYAML wheels normally bundle it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without LibYAML
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment, unused-ignore]
 
 
 class ConfigLoadError(Exception):
@@ -22,6 +42,18 @@ class ConfigLoadError(Exception):
         super().__init__(full_message)
 
 
+def _format_validation_errors(error: ValidationError) -> str:
+    """Format pydantic validation errors as one indented line per error."""
+    # Only location and message are shown, so skip building URLs, context
+    # and input values for each error
+    return "\n".join(
+        f"  - {'.'.join(map(str, item['loc']))}: {item['msg']}"
+        for item in error.errors(
+            include_url=False, include_context=False, include_input=False
+        )
+    )
+
+
 def load_sut(path: Path, profile: str | None = None) -> SUTConfig:
     """Load and validate a SUT configuration from a YAML file.
 
@@ -43,7 +75,7 @@ def load_sut(path: Path, profile: str | None = None) -> SUTConfig:
 
     try:
         with path.open() as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_SafeLoader)  # noqa: S506
     except yaml.YAMLError as e:
         raise ConfigLoadError("Invalid YAML syntax", path, str(e)) from e
 
@@ -58,16 +90,10 @@ def load_sut(path: Path, profile: str | None = None) -> SUTConfig:
     try:
         config = SUTConfig.model_validate(data)
     except ValidationError as e:
-        # Format validation errors nicely
-        errors = []
-        for error in e.errors():
-            loc = ".".join(str(x) for x in error["loc"])
-            msg = error["msg"]
-            errors.append(f"  - {loc}: {msg}")
         raise ConfigLoadError(
             "SUT config validation failed",
             path,
-            "\n".join(errors),
+            _format_validation_errors(e),
         ) from e
 
     # Determine which profile to use
@@ -169,7 +195,7 @@ def load_scenario(path: Path) -> Scenario:
 
     try:
         with path.open() as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_SafeLoader)  # noqa: S506
     except yaml.YAMLError as e:
         raise ConfigLoadError("Invalid YAML syntax", path, str(e)) from e
 
@@ -184,19 +210,81 @@ def load_scenario(path: Path) -> Scenario:
     try:
         scenario = Scenario.model_validate(data)
         scenario._source_path = path
-        return scenario
     except ValidationError as e:
-        errors = []
-        for error in e.errors():
-            loc = ".".join(str(x) for x in error["loc"])
-            msg = error["msg"]
-            errors.append(f"  - {loc}: {msg}")
         raise ConfigLoadError(
             "Scenario validation failed",
             path,
-            "\n".join(errors),
+            _format_validation_errors(e),
         ) from e
 
+    jsonpath_errors = _collect_jsonpath_errors(scenario)
+    if jsonpath_errors:
+        raise ConfigLoadError(
+            "Scenario validation failed",
+            path,
+            "\n".join(jsonpath_errors),
+        )
+    return scenario
+
+
+def _collect_jsonpath_errors(scenario: Scenario) -> list[str]:
+    """Report malformed JSONPath expressions anywhere in a scenario.
+
+    Expectations and HTTP extractions compile their JSONPaths when the model
+    is built; this surfaces the failures at load time instead of on the first
+    execution. Expressions containing templates are only known once rendered
+    and are skipped.
+    """
+    errors: list[str] = []
+
+    def check(loc: str, expression: str, error: str | None) -> None:
+        if error is not None and "{{" not in expression:
+            errors.append(f"  - {loc}: invalid JSONPath '{expression}': {error}")
+
+    def collect(actions: list[Action], prefix: str) -> None:
+        for index, action in enumerate(actions):
+            loc = f"{prefix}.{index}"
+            if isinstance(action, HttpAction):
+                for var_name, error in action._extract_errors.items():
+                    check(f"{loc}.extract.{var_name}", action.extract[var_name], error)
+            elif isinstance(action, GrpcAction):
+                for var_name, expression in action.extract.items():
+                    try:
+                        compile_jsonpath(expression)
+                    except JSONPathError as e:
+                        check(f"{loc}.extract.{var_name}", expression, str(e))
+            elif isinstance(action, (WaitAction, AssertAction)):
+                expect = action.expect
+                if expect.jsonpath is not None:
+                    check(
+                        f"{loc}.expect.jsonpath",
+                        expect.jsonpath,
+                        expect._jsonpath_error,
+                    )
+            elif isinstance(action, BranchAction):
+                collect(action.if_true, f"{loc}.if_true")
+                collect(action.if_false, f"{loc}.if_false")
+
+    collect(scenario.flow, "flow")
+    for index, assertion in enumerate(scenario.assertions):
+        expect = assertion.expect
+        if expect.jsonpath is not None:
+            check(
+                f"assertions.{index}.expect.jsonpath",
+                expect.jsonpath,
+                expect._jsonpath_error,
+            )
+
+    return errors
+
+
+def _try_load_scenario(path: Path) -> Scenario | ConfigLoadError:
+    """Load a scenario, returning the load error instead of raising it."""
+    try:
+        return load_scenario(path)
+    except ConfigLoadError as e:
+        return e
+
 
 def load_scenarios(directory: Path) -> list[Scenario]:
     """Load all scenarios from a directory.
@@ -224,12 +312,16 @@ def load_scenarios(directory: Path) -> list[Scenario]:
     scenarios = []
     errors = []
 
-    for path in scenario_files:
-        try:
-            scenario = load_scenario(path)
-            scenarios.append(scenario)
-        except ConfigLoadError as e:
-            errors.append(str(e))
+    # Files are read on a small pool so slow (e.g. network) storage overlaps;
+    # map() keeps results in file order for deterministic scenario lists
+    workers = min(_LOAD_WORKERS, len(scenario_files))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(_try_load_scenario, scenario_files)
+        for result in results:
+            if isinstance(result, ConfigLoadError):
+                errors.append(str(result))
+            else:
+                scenarios.append(result)
 
     if errors:
         raise ConfigLoadError(
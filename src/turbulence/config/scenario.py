@@ -1,14 +1,35 @@
 """Scenario configuration models for workflow definitions."""
 
+from collections.abc import Callable
+from functools import partial
 from pathlib import Path
 from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from jsonpath_ng.exceptions import JSONPathError
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
 from turbulence.pressure.config import TurbulenceConfig
+from turbulence.utils.jsonpath import JSONPathMatcher, compile_matcher
 from turbulence.variation.config import VariationConfig
 
 
+def _equals_value(expected: Any, actual: Any) -> bool:
+    """Return True if the actual value equals the expected value."""
+    return bool(actual == expected)
+
+
+def _contains_value(expected: Any, expected_str: str, actual: Any) -> bool:
+    """Return True if the actual string or collection contains the expected value."""
+    try:
+        if isinstance(actual, str):
+            return expected_str in actual
+        if isinstance(actual, (list, tuple, dict)):
+            return expected in actual
+    except TypeError:
+        return False
+    return False
+
+
 class Expectation(BaseModel):
     """Expectation for assertions and wait conditions."""
 
@@ -44,6 +65,44 @@ class Expectation(BaseModel):
         description="Python expression to evaluate against response/context",
     )
 
+    _compiled_jsonpath: JSONPathMatcher | None = PrivateAttr(default=None)
+    _jsonpath_error: str | None = PrivateAttr(default=None)
+    _has_equals: bool = PrivateAttr(default=False)
+    _has_contains: bool = PrivateAttr(default=False)
+    _compare: Callable[[Any], bool] | None = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def record_comparisons(self) -> "Expectation":
+        """Record which comparisons were explicitly set (even to None).
+
+        Also binds the comparator for the chosen comparison, with equals
+        taking precedence over contains, so evaluation is a single call.
+        """
+        fields_set = self.model_fields_set
+        self._has_equals = "equals" in fields_set
+        self._has_contains = "contains" in fields_set
+        if self._has_equals:
+            self._compare = partial(_equals_value, self.equals)
+        elif self._has_contains:
+            self._compare = partial(
+                _contains_value, self.contains, str(self.contains)
+            )
+        return self
+
+    @model_validator(mode="after")
+    def compile_jsonpath(self) -> "Expectation":
+        """Compile the JSONPath once so runners can evaluate it directly.
+
+        A malformed expression is recorded rather than raised, so runners can
+        report it as a failed expectation; scenario loading rejects it.
+        """
+        if self.jsonpath is not None:
+            try:
+                self._compiled_jsonpath = compile_matcher(self.jsonpath)
+            except JSONPathError as e:
+                self._jsonpath_error = str(e)
+        return self
+
 
 class RetryConfig(BaseModel):
     """Configuration for automatic action retries."""
@@ -124,6 +183,23 @@ class HttpAction(BaseModel):
         description="Skip this step if condition evaluates to false",
     )
 
+    _compiled_extract: dict[str, JSONPathMatcher] = PrivateAttr(default_factory=dict)
+    _extract_errors: dict[str, str] = PrivateAttr(default_factory=dict)
+
+    @model_validator(mode="after")
+    def compile_extract(self) -> "HttpAction":
+        """Compile extraction JSONPaths once so runners can evaluate them directly.
+
+        Malformed expressions are recorded in ``_extract_errors`` and left out
+        of ``_compiled_extract``; scenario loading rejects them.
+        """
+        for var_name, expression in self.extract.items():
+            try:
+                self._compiled_extract[var_name] = compile_matcher(expression)
+            except JSONPathError as e:
+                self._extract_errors[var_name] = str(e)
+        return self
+
 
 class WaitAction(BaseModel):
     """Wait action configuration for polling until a condition is met."""
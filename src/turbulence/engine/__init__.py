@@ -1,24 +1,67 @@
-"""Turbulence execution engine."""
-
-from turbulence.engine.context import WorkflowContext
-from turbulence.engine.executor import (
-    DEFAULT_PARALLELISM,
-    ExecutionStats,
-    InstanceResult,
-    ParallelExecutor,
-    run_parallel,
-)
-from turbulence.engine.replay import (
-    InstanceData,
-    InstanceNotFoundError,
-    ReplayEngine,
-    ReplayResult,
-    ScenarioNotFoundError,
-    StepResult,
-)
-from turbulence.engine.template import TemplateEngine, TemplateError
+"""Turbulence execution engine.
+
+Submodules are imported on first attribute access so that lightweight
+consumers (such as the CLI reading ``DEFAULT_PARALLELISM``) do not pay for
+the replay and scenario runner import graph.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from turbulence.engine.context import WorkflowContext
+    from turbulence.engine.executor import (
+        DEFAULT_PARALLELISM,
+        ExecutionStats,
+        InstanceResult,
+        ParallelExecutor,
+        run_parallel,
+    )
+    from turbulence.engine.replay import (
+        InstanceData,
+        InstanceNotFoundError,
+        ReplayEngine,
+        ReplayResult,
+        ScenarioNotFoundError,
+        StepResult,
+    )
+    from turbulence.engine.template import (
+        CompiledTemplate,
+        TemplateEngine,
+        TemplateError,
+    )
+
+_EXPORTS = {
+    "CompiledTemplate": "turbulence.engine.template",
+    "DEFAULT_PARALLELISM": "turbulence.engine.executor",
+    "ExecutionStats": "turbulence.engine.executor",
+    "InstanceData": "turbulence.engine.replay",
+    "InstanceNotFoundError": "turbulence.engine.replay",
+    "InstanceResult": "turbulence.engine.executor",
+    "ParallelExecutor": "turbulence.engine.executor",
+    "ReplayEngine": "turbulence.engine.replay",
+    "ReplayResult": "turbulence.engine.replay",
+    "ScenarioNotFoundError": "turbulence.engine.replay",
+    "StepResult": "turbulence.engine.replay",
+    "TemplateEngine": "turbulence.engine.template",
+    "TemplateError": "turbulence.engine.template",
+    "WorkflowContext": "turbulence.engine.context",
+    "run_parallel": "turbulence.engine.executor",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import exported names from their submodule on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
+    "CompiledTemplate",
     "DEFAULT_PARALLELISM",
     "ExecutionStats",
     "InstanceData",
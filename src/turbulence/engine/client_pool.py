@@ -18,13 +18,26 @@ class ClientPool:
     instances and properly cleaned up when the simulation completes.
     """
 
-    def __init__(self, sut_config: SUTConfig) -> None:
+    def __init__(self, sut_config: SUTConfig, parallelism: int | None = None) -> None:
         """Initialize the client pool.
 
         Args:
             sut_config: The system under test configuration.
+            parallelism: Expected number of concurrent workflow instances. When
+                set, HTTP connection limits are sized so every instance can
+                keep a warm connection to each service instead of falling
+                back to httpx's default of 20 keep-alive sockets.
         """
         self.sut_config = sut_config
+        self._http_limits = (
+            httpx.Limits(
+                max_connections=parallelism * 2,
+                max_keepalive_connections=parallelism,
+                keepalive_expiry=30.0,
+            )
+            if parallelism
+            else httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        )
         self._http_clients: dict[str, httpx.AsyncClient] = {}
         self._grpc_channels: dict[str, grpc.aio.Channel] = {}
         # Kafka producers will be added in a future ticket
@@ -39,6 +52,12 @@ class ClientPool:
         Returns:
             An httpx.AsyncClient instance.
         """
+        # Lock-free fast path: every HTTP action asks for its client, but
+        # one is only created the first time a service is used
+        client = self._http_clients.get(service_name)
+        if client is not None:
+            return client
+
         async with self._lock:
             if service_name not in self._http_clients:
                 service = self.sut_config.get_service(service_name)
@@ -61,6 +80,7 @@ class ClientPool:
                 self._http_clients[service_name] = httpx.AsyncClient(
                     base_url=base_url,
                     timeout=service.timeout_seconds,
+                    limits=self._http_limits,
                 )
                 logger.debug(f"Created new HTTP client for service '{service_name}'")
 
@@ -75,6 +95,10 @@ class ClientPool:
         Returns:
             A grpc.aio.Channel instance.
         """
+        channel = self._grpc_channels.get(service_name)
+        if channel is not None:
+            return channel
+
         async with self._lock:
             if service_name not in self._grpc_channels:
                 service = self.sut_config.get_service(service_name)
@@ -94,6 +118,19 @@ class ClientPool:
 
             return self._grpc_channels[service_name]
 
+    async def warm_up(self) -> None:
+        """Create the client or channel for every HTTP and gRPC service.
+
+        Building an HTTP client loads TLS certificates, which takes tens of
+        milliseconds; doing it before a run keeps that cost (and the lock
+        held while it runs) out of the first instances.
+        """
+        for name, service in self.sut_config.services.items():
+            if service.protocol == "http":
+                await self.get_http_client(name)
+            elif service.protocol == "grpc":
+                await self.get_grpc_channel(name)
+
     async def close_all(self) -> None:
         """Close all pooled clients and channels."""
         async with self._lock:
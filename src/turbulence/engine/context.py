@@ -1,9 +1,19 @@
 """Workflow context management for instance execution."""
 
-from typing import Any
-from uuid import uuid4
+import os
+from typing import Any, ClassVar
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
+
+
+def _gen_ids() -> tuple[str, str, str]:
+    """Generate run, instance, and correlation IDs from one random read.
+
+    Each ID takes its own 12 hex digits (48 random bits). A uuid4 has too
+    few random digits for this: its version and variant nibbles are fixed.
+    """
+    h = os.urandom(18).hex()
+    return f"run_{h[:12]}", f"inst_{h[12:24]}", f"corr_{h[24:]}"
 
 
 class WorkflowContext(BaseModel):
@@ -18,27 +28,45 @@ class WorkflowContext(BaseModel):
     model_config = ConfigDict(extra="allow")
 
     run_id: str = Field(
-        default_factory=lambda: f"run_{uuid4().hex[:12]}",
+        default="",
         description="Unique identifier for the run",
     )
     instance_id: str = Field(
-        default_factory=lambda: f"inst_{uuid4().hex[:12]}",
+        default="",
         description="Unique identifier for this workflow instance",
     )
     correlation_id: str = Field(
-        default_factory=lambda: f"corr_{uuid4().hex[:12]}",
+        default="",
         description="Correlation ID for request tracing",
     )
     entry: dict[str, Any] = Field(
         default_factory=dict,
         description="Entry context from scenario definition",
     )
-    _extracted: dict[str, Any] = {}
+    _extracted: dict[str, Any] = PrivateAttr(default_factory=dict)
 
-    def __init__(self, **data: Any) -> None:
-        """Initialize workflow context."""
-        super().__init__(**data)
-        self._extracted = {}
+    _FIELD_NAMES: ClassVar[frozenset[str]] = frozenset(
+        {"run_id", "instance_id", "correlation_id", "entry"}
+    )
+
+    @model_validator(mode="before")
+    @classmethod
+    def _fill_ids(cls, data: Any) -> Any:
+        """Generate any identifiers not provided by the caller.
+
+        The empty field defaults only apply when validation is bypassed.
+        """
+        if isinstance(data, dict) and not (
+            "run_id" in data and "instance_id" in data and "correlation_id" in data
+        ):
+            run_id, instance_id, correlation_id = _gen_ids()
+            data = {
+                "run_id": run_id,
+                "instance_id": instance_id,
+                "correlation_id": correlation_id,
+                **data,
+            }
+        return data
 
     def set_entry(self, entry_data: dict[str, Any]) -> None:
         """Set the entry context from scenario definition.
@@ -68,7 +96,8 @@ class WorkflowContext(BaseModel):
     def get(self, key: str, default: Any = None) -> Any:
         """Get a value from context.
 
-        Searches in order: extracted values, entry data, model fields.
+        Searches in order: extracted values, entry data, model fields,
+        then any extra fields passed at construction.
 
         Args:
             key: The key to look up
@@ -81,8 +110,11 @@ class WorkflowContext(BaseModel):
             return self._extracted[key]
         if key in self.entry:
             return self.entry[key]
-        if hasattr(self, key):
+        if key in self._FIELD_NAMES:
             return getattr(self, key)
+        extra = self.__pydantic_extra__
+        if extra and key in extra:
+            return extra[key]
         return default
 
     def to_dict(self) -> dict[str, Any]:
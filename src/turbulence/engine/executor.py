@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import signal
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
@@ -25,6 +26,8 @@ from rich.progress import (
 if TYPE_CHECKING:
     from turbulence.storage.artifact import ArtifactStore
 
+logger = logging.getLogger(__name__)
+
 # Default parallelism if not specified
 DEFAULT_PARALLELISM = 10
 
@@ -82,7 +85,7 @@ class ParallelExecutor:
     """Executes workflow instances in parallel with configurable concurrency.
 
     This executor manages the parallel execution of workflow instances using
-    asyncio semaphores for concurrency control. It provides:
+    a fixed pool of asyncio worker tasks for concurrency control. It provides:
     - Configurable parallelism via --parallel flag
     - Rich progress display with completion %, current/total, and ETA
     - Graceful Ctrl+C handling that completes in-flight instances
@@ -107,7 +110,6 @@ class ParallelExecutor:
         self._artifact_store = artifact_store
 
         # Execution state
-        self._semaphore: asyncio.Semaphore | None = None
         self._cancel_requested = False
         self._results: list[InstanceResult] = []
         self._stats = ExecutionStats()
@@ -220,24 +222,41 @@ class ParallelExecutor:
                 total=total_instances,
             )
 
-            # Create tasks for all instances
-            tasks = []
-            for i in range(total_instances):
-                task = asyncio.create_task(self._execute_instance(i, workflow_executor))
-                tasks.append(task)
+            # A fixed pool of workers pulls instance indices from a shared
+            # iterator, so only `parallelism` instances are ever in memory
+            # regardless of the total instance count
+            indices = iter(range(total_instances))
+            workers = [
+                asyncio.create_task(self._worker(indices, workflow_executor))
+                for _ in range(min(self._parallelism, total_instances))
+            ]
 
-            # Wait for all tasks to complete
-            await asyncio.gather(*tasks, return_exceptions=True)
+            # Wait for all workers to drain the indices
+            await asyncio.gather(*workers, return_exceptions=True)
 
         self._progress = None
         self._task_id = None
 
+    async def _worker(
+        self,
+        indices: Iterator[int],
+        workflow_executor: WorkflowExecutor,
+    ) -> None:
+        """Execute instances one at a time until no indices remain.
+
+        Args:
+            indices: Shared iterator of instance indices still to run.
+            workflow_executor: Async function that executes an instance.
+        """
+        for instance_index in indices:
+            await self._execute_instance(instance_index, workflow_executor)
+
     async def _execute_instance(
         self,
         instance_index: int,
         workflow_executor: WorkflowExecutor,
     ) -> InstanceResult | None:
-        """Execute a single instance with semaphore control.
+        """Execute a single instance on the calling worker.
 
         Args:
             instance_index: Zero-based index of the instance.
@@ -246,7 +265,7 @@ class ParallelExecutor:
         Returns:
             InstanceResult or None if cancelled before starting.
         """
-        # Check for cancellation before acquiring semaphore
+        # Instances not yet started when cancellation is requested are skipped
         if self._cancel_requested:
             async with self._lock:
                 self._stats.cancelled += 1
@@ -254,41 +273,28 @@ class ParallelExecutor:
                     self._progress.update(self._task_id, advance=1)
             return None
 
-        # Acquire semaphore to limit concurrency
-        semaphore = self._semaphore
-        if semaphore is None:
-            return None
-
-        async with semaphore:
-            # Check again after acquiring (in case cancelled while waiting)
-            if self._cancel_requested:  # noqa: SIM102
-                async with self._lock:  # type: ignore[unreachable]
-                    self._stats.cancelled += 1
-                    if self._progress and self._task_id is not None:
-                        self._progress.update(self._task_id, advance=1)
-                return None
+        try:
+            result = await workflow_executor(instance_index)
+            await self._record_result(result)
+            return result
+        except Exception as e:
+            logger.debug(
+                "Unexpected exception in instance %d", instance_index, exc_info=True
+            )
 
-            try:
-                result = await workflow_executor(instance_index)
-                await self._record_result(result)
-                return result
-            except Exception as e:
-                import traceback
-                logger.debug(f"Unexpected exception in instance {instance_index}: {traceback.format_exc()}")
-
-                # Create error result for unexpected exceptions
-                error_result = InstanceResult(
-                    instance_id=f"error_{instance_index}",
-                    correlation_id=f"corr_{instance_index}",
-                    scenario_id="unknown",
-                    started_at=datetime.now(timezone.utc),
-                    completed_at=datetime.now(timezone.utc),
-                    duration_ms=0.0,
-                    passed=False,
-                    error=str(e),
-                )
-                await self._record_result(error_result)
-                return error_result
+            # Create error result for unexpected exceptions
+            error_result = InstanceResult(
+                instance_id=f"error_{instance_index}",
+                correlation_id=f"corr_{instance_index}",
+                scenario_id="unknown",
+                started_at=datetime.now(timezone.utc),
+                completed_at=datetime.now(timezone.utc),
+                duration_ms=0.0,
+                passed=False,
+                error=str(e),
+            )
+            await self._record_result(error_result)
+            return error_result
 
     async def _record_result(self, result: InstanceResult) -> None:
         """Record an instance result and update statistics.
@@ -336,7 +342,6 @@ class ParallelExecutor:
             total_instances=total_instances,
             started_at=datetime.now(timezone.utc),
         )
-        self._semaphore = asyncio.Semaphore(self._parallelism)
 
     def print_summary(self) -> None:
         """Print a summary of the execution results."""
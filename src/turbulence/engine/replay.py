@@ -14,6 +14,21 @@ from turbulence.engine.context import WorkflowContext
 from turbulence.engine.scenario_runner import ScenarioRunner
 from turbulence.engine.template import TemplateEngine
 from turbulence.models.observation import Observation
+from turbulence.storage.base import RunNotFoundError
+
+
+def _id_needle(value: str) -> bytes | None:
+    """Return bytes that any JSON line holding ``value`` as a string must contain.
+
+    Printable ASCII without quotes or backslashes is written verbatim by JSON
+    encoders, so lines lacking these bytes can be skipped without decoding.
+    Returns None for other values, whose encoded form may be escaped.
+    """
+    if not (value.isascii() and value.isprintable()):
+        return None
+    if '"' in value or "\\" in value:
+        return None
+    return value.encode("ascii")
 
 
 class InstanceNotFoundError(Exception):
@@ -28,6 +43,19 @@ class InstanceNotFoundError(Exception):
         )
 
 
+class ReplayRunNotFoundError(RunNotFoundError, InstanceNotFoundError):
+    """Raised when the run containing a requested instance does not exist.
+
+    Also an InstanceNotFoundError, so callers that only handle missing
+    instances keep catching it.
+    """
+
+    def __init__(self, run_id: str, instance_id: str, run_path: Path) -> None:
+        RunNotFoundError.__init__(self, run_path)
+        self.run_id = run_id
+        self.instance_id = instance_id
+
+
 class ScenarioNotFoundError(Exception):
     """Raised when a scenario cannot be found."""
 
@@ -124,16 +152,26 @@ class ReplayEngine:
             InstanceData with the stored instance information.
 
         Raises:
+            ReplayRunNotFoundError: If the run directory does not exist.
             InstanceNotFoundError: If the instance cannot be found.
         """
         run_path = self.runs_dir / run_id
         instances_file = run_path / "instances.jsonl"
 
-        if not instances_file.exists():
-            raise InstanceNotFoundError(run_id, instance_id, run_path)
+        # Lines that cannot mention the instance are skipped before decoding
+        needle = _id_needle(instance_id)
 
-        with instances_file.open() as f:
+        try:
+            f = instances_file.open("rb")
+        except (FileNotFoundError, NotADirectoryError):
+            if not run_path.is_dir():
+                raise ReplayRunNotFoundError(run_id, instance_id, run_path) from None
+            raise InstanceNotFoundError(run_id, instance_id, run_path) from None
+
+        with f:
             for line in f:
+                if needle is not None and needle not in line:
+                    continue
                 line = line.strip()
                 if not line:
                     continue
@@ -253,7 +291,7 @@ class ReplayEngine:
         # Load instance data
         try:
             instance_data = self.load_instance(run_id, instance_id)
-        except InstanceNotFoundError as e:
+        except (RunNotFoundError, InstanceNotFoundError) as e:
             return ReplayResult(
                 instance_id=instance_id,
                 correlation_id="",
@@ -6,14 +6,19 @@ the run command and replay engine.
 
 import asyncio
 import logging
+import weakref
 from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from typing import Any
 
+from jinja2 import TemplateSyntaxError
+
 from turbulence.actions import ActionRunnerFactory
 from turbulence.actors.policy import Policy
 from turbulence.config.scenario import (
     Action,
     AssertAction,
+    Assertion,
     BranchAction,
     DecideAction,
     HttpAction,
@@ -23,13 +28,106 @@ from turbulence.config.scenario import (
 from turbulence.config.sut import SUTConfig
 from turbulence.engine.client_pool import ClientPool
 from turbulence.engine.conditions import ConditionEvaluator
-from turbulence.engine.template import TemplateEngine
+from turbulence.engine.template import CompiledTemplate, TemplateEngine
 from turbulence.models.observation import Observation
 from turbulence.pressure.engine import TurbulenceEngine
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True, frozen=True)
+class _ActionPlan:
+    """Instance-independent rendering data for one flow action.
+
+    Attributes:
+        model: Action class that rendered values are validated into
+        template: The action's fields with templates pre-parsed, or None
+            when rendering cannot change it and the action can be used as is
+    """
+
+    model: type[Action]
+    template: CompiledTemplate | None
+
+
+# Plans per template engine, since engines may differ in filters and globals,
+# each keyed by id() of the flow action it was compiled from. Entries are
+# dropped when the action is garbage collected, so ids are never stale.
+_action_plans: weakref.WeakKeyDictionary[TemplateEngine, dict[int, _ActionPlan]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _compile_action(action: Action, template_engine: TemplateEngine) -> _ActionPlan:
+    """Return the engine's plan for a flow action, compiling it on first use."""
+    key = id(action)
+    try:
+        plans = _action_plans[template_engine]
+    except KeyError:
+        plans = _action_plans.setdefault(template_engine, {})
+    try:
+        return plans[key]
+    except KeyError:
+        pass
+    dump = action.model_dump()
+    plan = _ActionPlan(
+        model=type(action),
+        template=(
+            None
+            if template_engine.is_static(dump)
+            else template_engine.compile_dict(dump)
+        ),
+    )
+    plans[key] = plan
+    weakref.finalize(action, plans.pop, key, None)
+    return plan
+
+
+# Assert actions built from scenario-level assertions, keyed by id() of the
+# assertion and dropped with it like _action_plans
+_assertion_actions: dict[int, AssertAction] = {}
+
+
+def _assertion_action(assertion: Assertion) -> AssertAction:
+    """Return the assert action for a final assertion, building it once."""
+    key = id(assertion)
+    try:
+        return _assertion_actions[key]
+    except KeyError:
+        pass
+    action = AssertAction(
+        name=assertion.name,
+        type="assert",
+        expect=assertion.expect,
+    )
+    _assertion_actions[key] = action
+    weakref.finalize(assertion, _assertion_actions.pop, key, None)
+    return action
+
+
+def prepare_scenario(scenario: Scenario, template_engine: TemplateEngine) -> None:
+    """Compile the plans for every action and final assertion of a scenario.
+
+    Plans are otherwise compiled the first time an action runs, which puts
+    template parsing on the first instances of a run. Actions whose templates
+    do not parse are skipped here; they fail when an instance runs them, so
+    the error is recorded against that instance instead of aborting the run.
+    """
+    pending: list[Action] = list(scenario.flow)
+    pending.extend(_assertion_action(assertion) for assertion in scenario.assertions)
+    while pending:
+        action = pending.pop()
+        if isinstance(action, BranchAction):
+            pending.extend(action.if_true)
+            pending.extend(action.if_false)
+            continue
+        try:
+            _compile_action(action, template_engine)
+        except TemplateSyntaxError as exc:
+            logger.debug(
+                "Deferring action %r with invalid template: %s", action.name, exc
+            )
+
+
 class ScenarioRunner:
     """Executes scenario flows with context management and action execution.
 
@@ -161,21 +259,29 @@ class ScenarioRunner:
                 await asyncio.sleep(total_delay_ms / 1000.0)
 
             if isinstance(action, BranchAction):
-                # Execute BranchAction logic
-                obs, context, branch_results = await self._execute_branch(action, context, step_delay_ms, jitter_ms)
+                # Evaluate the branch condition
+                obs, branch_actions = self._execute_branch(action, context)
 
                 # Yield the branch decision observation
                 yield idx, action, obs, context
                 idx += 1
 
-                # Then yield each individual step observation from the branch
-                for b_idx, b_action, b_obs, b_context in branch_results:
+                # Then yield each nested step as it finishes, so consumers see
+                # the context as it was right after that step
+                nested = self._execute_actions_recursive(
+                    actions=branch_actions,
+                    context=context,
+                    start_index=0,
+                    step_delay_ms=step_delay_ms,
+                    jitter_ms=jitter_ms,
+                )
+                async for b_idx, b_action, b_obs, b_context in nested:
                     # Update the global context with the nested execution's result
                     context = b_context
                     yield b_idx, b_action, b_obs, context
             else:
                 # Normal action execution
-                observation, context = await self._execute_action(
+                observation = await self._execute_action(
                     action=action,
                     context=context,
                 )
@@ -187,14 +293,31 @@ class ScenarioRunner:
                 yield idx, action, observation, context
                 idx += 1
 
-    async def _execute_branch(
+    async def execute_assertion(
+        self,
+        assertion: Assertion,
+        context: dict[str, Any],
+    ) -> Observation:
+        """Execute a final assertion (not part of the flow).
+
+        Args:
+            assertion: Scenario-level assertion to evaluate
+            context: Current execution context, updated in place
+
+        Returns:
+            Observation for the assertion
+        """
+        return await self._execute_action(
+            action=_assertion_action(assertion),
+            context=context,
+        )
+
+    def _execute_branch(
         self,
         action: BranchAction,
         context: dict[str, Any],
-        step_delay_ms: int,
-        jitter_ms: int,
-    ) -> tuple[Observation, dict[str, Any], list[tuple[int, Action, Observation, dict[str, Any]]]]:
-        """Evaluate a branch condition and prepare execution results."""
+    ) -> tuple[Observation, list[Action]]:
+        """Evaluate a branch condition and select the actions to execute."""
         # Evaluate the branch condition
         decision, rendered = self.condition_evaluator.evaluate_safe(
             action.condition, context, default=False
@@ -220,34 +343,21 @@ class ScenarioRunner:
             branch_taken=branch_name,
         )
 
-        results: list[tuple[int, Action, Observation, dict[str, Any]]] = []
-        # Execute nested actions
-        async for r in self._execute_actions_recursive(
-            actions=branch_actions,
-            context=context,
-            start_index=0,
-            step_delay_ms=step_delay_ms,
-            jitter_ms=jitter_ms,
-        ):
-            results.append(r)
-            context = r[3]  # Update context for next step in branch
-
-        return obs, context, results
+        return obs, branch_actions
 
     async def _execute_action(
         self,
         action: Action,
         context: dict[str, Any],
-    ) -> tuple[Observation, dict[str, Any]]:
+    ) -> Observation:
         """Execute a single action with template rendering.
 
         Args:
             action: Action to execute
-            context: Current execution context
-            client: HTTP client for requests
+            context: Current execution context, updated in place
 
         Returns:
-            Tuple of (observation, updated_context)
+            Observation for the action
         """
         # Render templates in action
         rendered_action = self._render_action(action, context)
@@ -290,22 +400,31 @@ class ScenarioRunner:
             raise ValueError(f"Unknown action type: {type(action)}. {e}")
 
         # Apply turbulence if configured (currently only for HTTP)
+        policy = None
+        service_name = ""
         if isinstance(rendered_action, HttpAction) and self.turbulence_engine is not None:
+            service_name = rendered_action.service
             policy = self.turbulence_engine.resolve_policy(
-                service=rendered_action.service,
+                service=service_name,
                 action=rendered_action.name,
             )
-            if policy is not None:
-                return await self.turbulence_engine.apply(
-                    policy=policy,
-                    action_name=rendered_action.name,
-                    service_name=rendered_action.service,
-                    instance_id=str(context.get("instance_id", "")),
-                    context=context,
-                    execute=lambda: runner.execute(context),
-                )
+        if policy is not None and self.turbulence_engine is not None:
+            observation, updated_context = await self.turbulence_engine.apply(
+                policy=policy,
+                action_name=rendered_action.name,
+                service_name=service_name,
+                instance_id=str(context.get("instance_id", "")),
+                context=context,
+                execute=lambda: runner.execute(context),
+            )
+        else:
+            observation, updated_context = await runner.execute(context)
 
-        return await runner.execute(context)
+        # Built-in runners update the context in place; merge results from
+        # runners that return a new dict instead
+        if updated_context is not context:
+            context.update(updated_context)
+        return observation
 
     def _render_action(
         self,
@@ -319,23 +438,12 @@ class ScenarioRunner:
             context: Context for template rendering
 
         Returns:
-            Action with templates rendered
+            Action with templates rendered; static actions are returned as is
         """
-        action_dict = action.model_dump()
-        rendered_dict = self.template_engine.render_dict(action_dict, context)
-
-        if isinstance(action, HttpAction):
-            return HttpAction(**rendered_dict)
-        if isinstance(action, WaitAction):
-            return WaitAction(**rendered_dict)
-        if isinstance(action, AssertAction):
-            return AssertAction(**rendered_dict)
-        if isinstance(action, BranchAction):
-            return BranchAction(**rendered_dict)
-        if isinstance(action, DecideAction):
-            return DecideAction(**rendered_dict)
-
-        raise ValueError(f"Unknown action type for rendering: {type(action)}")
+        plan = _compile_action(action, self.template_engine)
+        if plan.template is None:
+            return action
+        return plan.model(**plan.template.render(context))
 
     def _update_last_response(
         self,
@@ -1,10 +1,61 @@
 """Template engine for variable substitution in workflows."""
 
 import re
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
 from jinja2 import Environment, StrictUndefined, UndefinedError
 
+# Distinct variable paths kept split; paths come from scenario templates
+_PATH_CACHE_SIZE = 4096
+
+# Compiled Jinja templates kept per engine; template text comes from scenario
+# configuration, so a bounded cache holds every distinct string in practice
+_TEMPLATE_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=_PATH_CACHE_SIZE)
+def _split_path(path: str) -> tuple[str, ...]:
+    """Split a dotted variable path, caching the result per path."""
+    return tuple(path.split("."))
+
+
+def _walk_path(parts: tuple[str, ...], context: dict[str, Any]) -> Any:
+    """Follow split path segments through dicts, then object attributes.
+
+    Raises:
+        KeyError: With the first segment that is not found
+    """
+    current: Any = context
+    for part in parts:
+        if isinstance(current, dict):
+            try:
+                current = current[part]
+            except KeyError:
+                raise KeyError(part) from None
+        elif hasattr(current, part):
+            current = getattr(current, part)
+        else:
+            raise KeyError(part)
+    return current
+
+
+def _is_static_scalar(value: Any) -> bool:
+    """Check whether a value is immutable and renders to itself."""
+    if isinstance(value, str):
+        return _is_static_string(value)
+    return not isinstance(value, (dict, list))
+
+
+def _is_static_string(template: str) -> bool:
+    """Check whether Jinja would render a string unchanged.
+
+    Besides ``{{``/``{%``/``{#`` syntax, Jinja normalizes carriage returns and
+    drops one trailing newline from plain text.
+    """
+    return "{" not in template and "\r" not in template and template[-1:] != "\n"
+
 
 class TemplateError(Exception):
     """Raised when template rendering fails."""
@@ -17,6 +68,34 @@ class TemplateError(Exception):
         super().__init__(message)
 
 
+class CompiledTemplate:
+    """A value whose template strings were parsed once, ready to render.
+
+    Created by ``TemplateEngine.compile_value``/``compile_dict``. Rendering
+    gives the same result as ``TemplateEngine.render_value`` on the original
+    value, without re-parsing any template text.
+    """
+
+    __slots__ = ("_render",)
+
+    def __init__(self, render: Callable[[dict[str, Any]], Any]) -> None:
+        self._render = render
+
+    def render(self, context: dict[str, Any]) -> Any:
+        """Render the compiled value with context values.
+
+        Args:
+            context: Dictionary of variable values
+
+        Returns:
+            The value with all templates rendered
+
+        Raises:
+            TemplateError: If a variable is missing
+        """
+        return self._render(context)
+
+
 class TemplateEngine:
     """Jinja2-based template engine for workflow variable substitution.
 
@@ -40,6 +119,12 @@ class TemplateEngine:
             variable_start_string="{{",
             variable_end_string="}}",
         )
+        # Parsing and compiling a template costs far more than rendering it,
+        # so each distinct template string is compiled once per engine.
+        # Syntax errors are not cached and are raised on every call.
+        self._from_string = lru_cache(maxsize=_TEMPLATE_CACHE_SIZE)(
+            self._env.from_string
+        )
 
     def render_string(self, template: str, context: dict[str, Any]) -> Any:
         """Render a template string with context values.
@@ -57,10 +142,15 @@ class TemplateEngine:
         Raises:
             TemplateError: If a variable is missing or template is invalid
         """
+        # Most config strings hold no template syntax and render unchanged
+        if _is_static_string(template):
+            return template
+
         # Check if this is purely a single variable reference
-        if self.SINGLE_VAR_PATTERN.match(template.strip()):
+        stripped = template.strip()
+        if self.SINGLE_VAR_PATTERN.match(stripped):
             # Extract the variable path
-            var_path = template.strip()[2:-2].strip()
+            var_path = stripped[2:-2].strip()
             try:
                 return self._resolve_path(var_path, context)
             except KeyError as e:
@@ -72,7 +162,7 @@ class TemplateEngine:
 
         # Otherwise, render as a string template
         try:
-            jinja_template = self._env.from_string(template)
+            jinja_template = self._from_string(template)
             return jinja_template.render(context)
         except UndefinedError as e:
             # Extract variable name from error message
@@ -96,20 +186,14 @@ class TemplateEngine:
         Raises:
             KeyError: If any part of the path is not found
         """
-        parts = path.split(".")
-        current: Any = context
-
-        for part in parts:
-            if isinstance(current, dict):
-                if part not in current:
-                    raise KeyError(part)
-                current = current[part]
-            elif hasattr(current, part):
-                current = getattr(current, part)
-            else:
-                raise KeyError(part)
+        # Top-level names such as run_id are a single dict lookup
+        if "." not in path:
+            try:
+                return context[path]
+            except KeyError:
+                raise KeyError(path) from None
 
-        return current
+        return _walk_path(_split_path(path), context)
 
     def render_dict(
         self, data: dict[str, Any], context: dict[str, Any]
@@ -160,6 +244,116 @@ class TemplateEngine:
             # Numbers, bools, None, etc. pass through unchanged
             return value
 
+    def compile_value(self, value: Any) -> CompiledTemplate:
+        """Parse all template strings in a value once for repeated rendering.
+
+        Args:
+            value: Any value that might contain templates
+
+        Returns:
+            Compiled template that renders like ``render_value(value, ...)``
+
+        Raises:
+            jinja2.TemplateSyntaxError: If a template string is malformed
+        """
+        return CompiledTemplate(self._compile(value))
+
+    def compile_dict(self, data: dict[str, Any]) -> CompiledTemplate:
+        """Parse all template strings in a dictionary once.
+
+        Args:
+            data: Dictionary potentially containing template strings
+
+        Returns:
+            Compiled template that renders like ``render_dict(data, ...)``
+        """
+        return self.compile_value(data)
+
+    def _compile(self, value: Any) -> Callable[[dict[str, Any]], Any]:
+        """Build a render function for a value, mirroring ``render_value``."""
+        if isinstance(value, str):
+            return self._compile_string(value)
+        if isinstance(value, dict):
+            # Static scalars are immutable, so each render starts from a
+            # shallow copy and only re-renders templates and nested containers
+            items = [
+                (key, self._compile(item))
+                for key, item in value.items()
+                if not _is_static_scalar(item)
+            ]
+            if not items:
+                return lambda _context: value.copy()
+
+            def render_dict(context: dict[str, Any]) -> dict[str, Any]:
+                result = value.copy()
+                for key, render in items:
+                    result[key] = render(context)
+                return result
+
+            return render_dict
+        if isinstance(value, list):
+            renders = [self._compile(item) for item in value]
+            return lambda context: [render(context) for render in renders]
+        return lambda _context: value
+
+    def _compile_string(self, template: str) -> Callable[[dict[str, Any]], Any]:
+        """Build a render function for one string, mirroring ``render_string``."""
+        stripped = template.strip()
+        if self.SINGLE_VAR_PATTERN.match(stripped):
+            var_path = stripped[2:-2].strip()
+            parts = _split_path(var_path)
+
+            def render_variable(context: dict[str, Any]) -> Any:
+                try:
+                    return _walk_path(parts, context)
+                except KeyError as e:
+                    raise TemplateError(
+                        f"Variable '{var_path}' not found in context",
+                        template,
+                        missing_var=var_path,
+                    ) from e
+
+            return render_variable
+
+        if _is_static_string(template):
+            return lambda _context: template
+
+        jinja_template = self._from_string(template)
+
+        def render_template(context: dict[str, Any]) -> Any:
+            try:
+                return jinja_template.render(context)
+            except UndefinedError as e:
+                missing = str(e).split("'")[1] if "'" in str(e) else str(e)
+                raise TemplateError(
+                    f"Variable '{missing}' not found in context",
+                    template,
+                    missing_var=missing,
+                ) from e
+
+        return render_template
+
+    @staticmethod
+    def is_static(value: Any) -> bool:
+        """Check whether rendering would return a value unchanged.
+
+        Stricter than ``has_templates``: Jinja also normalizes carriage
+        returns and drops one trailing newline from plain text.
+
+        Args:
+            value: Value to check
+
+        Returns:
+            True if no string in the value is altered by rendering
+        """
+        if isinstance(value, str):
+            return _is_static_string(value)
+        if isinstance(value, dict):
+            return all(TemplateEngine.is_static(v) for v in value.values())
+        if isinstance(value, list):
+            return all(TemplateEngine.is_static(v) for v in value)
+        return True
+
     def has_templates(self, value: Any) -> bool:
         """Check if a value contains any template variables.
 
@@ -169,10 +363,16 @@ class TemplateEngine:
         Returns:
             True if templates are found
         """
-        if isinstance(value, str):
-            return "{{" in value and "}}" in value
-        elif isinstance(value, dict):
-            return any(self.has_templates(v) for v in value.values())
-        elif isinstance(value, list):
-            return any(self.has_templates(v) for v in value)
+        # Walk with an explicit stack rather than recursing through
+        # any() generators, which dominate the cost on large static bodies
+        stack = [value]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                if "{{" in item and "}}" in item:
+                    return True
+            elif isinstance(item, dict):
+                stack.extend(item.values())
+            elif isinstance(item, list):
+                stack.extend(item)
         return False
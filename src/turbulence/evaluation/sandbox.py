@@ -3,29 +3,48 @@
 from __future__ import annotations
 
 import ast
+import logging
 import time
-from collections.abc import Callable, Generator, Iterable
+from collections.abc import Callable, Generator, Iterable, Iterator
+from functools import lru_cache
+from itertools import islice
+from types import CodeType
 from typing import Any
 
-ALLOWED_FUNCTIONS = {
-    "sum",
-    "len",
-    "min",
-    "max",
-    "any",
-    "all",
-    "range",
-}
-
-ALLOWED_ATTRIBUTES = {
-    "startswith",
-    "endswith",
-    "lower",
-    "upper",
-    "strip",
-    "split",
-    "get",
-}
+logger = logging.getLogger(__name__)
+
+ALLOWED_FUNCTIONS = frozenset(
+    {
+        "sum",
+        "len",
+        "min",
+        "max",
+        "any",
+        "all",
+        "range",
+    }
+)
+
+ALLOWED_ATTRIBUTES = frozenset(
+    {
+        "startswith",
+        "endswith",
+        "lower",
+        "upper",
+        "strip",
+        "split",
+        "get",
+    }
+)
+
+# Names an expression may reference outside of comprehensions
+_ALLOWED_NAMES = ALLOWED_FUNCTIONS | {"body", "headers", "context"}
+
+# Maximum number of distinct expressions kept compiled
+_EXPRESSION_CACHE_SIZE = 512
+
+# Number of elements consumed between deadline checks in the safe builtins
+_CHECK_INTERVAL = 1024
 
 
 class ExpressionError(Exception):
@@ -45,6 +64,10 @@ class SafeExpressionEvaluator:
 
     def __init__(self, timeout_seconds: float = 0.25) -> None:
         self.timeout_seconds = timeout_seconds
+        # The safe builtins are bound to one controller whose deadline is
+        # reset per evaluation, so they are built once per evaluator
+        self._controller = _TimeoutController()
+        self._builtins = _build_safe_builtins(self._controller)
 
     def evaluate(
         self,
@@ -65,45 +88,24 @@ class SafeExpressionEvaluator:
         Returns:
             The result of the evaluated expression.
         """
-        try:
-            _validate_expression(expression)
-        except ExpressionError:
-            raise
+        code = _compile_expression(expression)
 
-        controller = _TimeoutController(self.timeout_seconds)
-        safe_locals = _build_safe_locals(
-            body=body,
-            headers=headers or {},
-            context=context,
-            controller=controller,
-        )
+        safe_locals = self._builtins.copy()
+        safe_locals["body"] = body
+        safe_locals["headers"] = headers or {}
+        safe_locals["context"] = context
+        self._controller.start(self.timeout_seconds)
         try:
-            tree = ast.parse(expression, mode="eval")
-            return eval(  # noqa: S307
-                compile(tree, "<expression>", "eval"),
-                {"__builtins__": {}},
-                safe_locals,
-            )
-        except (ExpressionTimeoutError, ExpressionError):
+            return eval(code, {"__builtins__": {}}, safe_locals)  # noqa: S307
+        except ExpressionError:
             raise
         except Exception as exc:
-            import traceback
-            from logging import getLogger
-            getLogger(__name__).debug(f"Unexpected exception in expression evaluation: {traceback.format_exc()}")
+            logger.debug("Unexpected exception in expression evaluation", exc_info=True)
             raise ExpressionError(f"Expression evaluation failed: {exc}") from exc
 
 
-def _build_safe_locals(
-    *,
-    body: Any,
-    headers: dict[str, Any],
-    context: dict[str, Any],
-    controller: _TimeoutController,
-) -> dict[str, Any]:
+def _build_safe_builtins(controller: _TimeoutController) -> dict[str, Any]:
     return {
-        "body": body,
-        "headers": headers,
-        "context": context,
         "sum": _safe_sum(controller),
         "len": len,
         "min": _safe_min(controller),
@@ -115,7 +117,10 @@ def _build_safe_locals(
 
 
 class _TimeoutController:
-    def __init__(self, timeout_seconds: float) -> None:
+    def __init__(self) -> None:
+        self._deadline = 0.0
+
+    def start(self, timeout_seconds: float) -> None:
         self._deadline = time.perf_counter() + timeout_seconds
 
     def check(self) -> None:
@@ -123,13 +128,26 @@ class _TimeoutController:
             raise ExpressionTimeoutError("Expression evaluation timed out")
 
 
+def _checked_chunks(
+    values: Iterable[Any], controller: _TimeoutController
+) -> Iterator[list[Any]]:
+    """Yield values in fixed-size chunks, checking the deadline per chunk."""
+    iterator = iter(values)
+    while chunk := list(islice(iterator, _CHECK_INTERVAL)):
+        controller.check()
+        yield chunk
+
+
 def _safe_range(
     controller: _TimeoutController,
 ) -> Callable[..., Generator[int, None, None]]:
     def _range(*args: int) -> Generator[int, None, None]:
-        for value in range(*args):
+        values = range(*args)
+        # Slice rather than index by len(), which overflows past sys.maxsize
+        while values:
             controller.check()
-            yield value
+            yield from values[:_CHECK_INTERVAL]
+            values = values[_CHECK_INTERVAL:]
 
     return _range
 
@@ -137,9 +155,8 @@ def _safe_range(
 def _safe_sum(controller: _TimeoutController) -> Callable[[Iterable[Any]], Any]:
     def _sum(values: Iterable[Any]) -> Any:
         total = 0
-        for value in values:
-            controller.check()
-            total += value
+        for chunk in _checked_chunks(values, controller):
+            total = sum(chunk, total)
         return total
 
     return _sum
@@ -147,13 +164,13 @@ def _safe_sum(controller: _TimeoutController) -> Callable[[Iterable[Any]], Any]:
 
 def _safe_min(controller: _TimeoutController) -> Callable[[Iterable[Any]], Any]:
     def _min(values: Iterable[Any]) -> Any:
-        iterator = iter(values)
+        chunks = _checked_chunks(values, controller)
         try:
-            current = next(iterator)
+            current = min(next(chunks))
         except StopIteration as exc:
             raise ValueError("min() arg is an empty sequence") from exc
-        for value in iterator:
-            controller.check()
+        for chunk in chunks:
+            value = min(chunk)
             if value < current:
                 current = value
         return current
@@ -163,13 +180,13 @@ def _safe_min(controller: _TimeoutController) -> Callable[[Iterable[Any]], Any]:
 
 def _safe_max(controller: _TimeoutController) -> Callable[[Iterable[Any]], Any]:
     def _max(values: Iterable[Any]) -> Any:
-        iterator = iter(values)
+        chunks = _checked_chunks(values, controller)
         try:
-            current = next(iterator)
+            current = max(next(chunks))
         except StopIteration as exc:
             raise ValueError("max() arg is an empty sequence") from exc
-        for value in iterator:
-            controller.check()
+        for chunk in chunks:
+            value = max(chunk)
             if value > current:
                 current = value
         return current
@@ -179,8 +196,10 @@ def _safe_max(controller: _TimeoutController) -> Callable[[Iterable[Any]], Any]:
 
 def _safe_any(controller: _TimeoutController) -> Callable[[Iterable[Any]], bool]:
     def _any(values: Iterable[Any]) -> bool:
-        for value in values:
-            controller.check()
+        # Iterate lazily so any() still stops at the first truthy value
+        for index, value in enumerate(values):
+            if not index % _CHECK_INTERVAL:
+                controller.check()
             if value:
                 return True
         return False
@@ -190,8 +209,10 @@ def _safe_any(controller: _TimeoutController) -> Callable[[Iterable[Any]], bool]
 
 def _safe_all(controller: _TimeoutController) -> Callable[[Iterable[Any]], bool]:
     def _all(values: Iterable[Any]) -> bool:
-        for value in values:
-            controller.check()
+        # Iterate lazily so all() still stops at the first falsy value
+        for index, value in enumerate(values):
+            if not index % _CHECK_INTERVAL:
+                controller.check()
             if not value:
                 return False
         return True
@@ -199,27 +220,25 @@ def _safe_all(controller: _TimeoutController) -> Callable[[Iterable[Any]], bool]
     return _all
 
 
-def _validate_expression(expression: str) -> None:
+@lru_cache(maxsize=_EXPRESSION_CACHE_SIZE)
+def _compile_expression(expression: str) -> CodeType:
+    """Validate and compile an expression, caching the code object."""
+    tree = _validate_expression(expression)
+    return compile(tree, "<expression>", "eval")
+
+
+def _validate_expression(expression: str) -> ast.Expression:
     try:
         tree = ast.parse(expression, mode="eval")
     except SyntaxError as exc:
         raise ExpressionError(f"Invalid expression syntax: {exc}") from exc
 
-    validator = _ExpressionValidator(
-        allowed_names={
-            "body",
-            "headers",
-            "context",
-            *ALLOWED_FUNCTIONS,
-        }
-    )
-    validator.visit(tree)
-
+    _VALIDATOR.validate(tree)
+    return tree
 
-class _ExpressionValidator(ast.NodeVisitor):
-    """AST validator enforcing a strict subset of Python expressions."""
 
-    _allowed_nodes: tuple[type[ast.AST], ...] = (
+_ALLOWED_NODE_TYPES: frozenset[type[ast.AST]] = frozenset(
+    {
         ast.Expression,
         ast.BoolOp,
         ast.BinOp,
@@ -263,73 +282,91 @@ class _ExpressionValidator(ast.NodeVisitor):
         ast.IsNot,
         ast.USub,
         ast.UAdd,
-    )
-    if hasattr(ast, "Index"):
-        _allowed_nodes = _allowed_nodes + (ast.Index,)
+    }
+)
+
 
-    def __init__(self, *, allowed_names: set[str]) -> None:
+class _ExpressionValidator:
+    """AST validator enforcing a strict subset of Python expressions.
+
+    Node types are checked against a frozenset and children are reached
+    through their ``_fields`` directly, avoiding ``ast.NodeVisitor``'s
+    per-node method lookup. Each call carries the names in scope so that
+    comprehension variables are only visible inside their comprehension.
+    """
+
+    def __init__(self, *, allowed_names: frozenset[str]) -> None:
         self._allowed_names = allowed_names
 
-    def visit(self, node: ast.AST) -> Any:
-        if not isinstance(node, self._allowed_nodes):
+    def validate(self, tree: ast.AST) -> None:
+        """Raise ExpressionSecurityError if the tree uses disallowed syntax."""
+        self._check(tree, self._allowed_names)
+
+    def _check(self, node: ast.AST, names: frozenset[str]) -> None:
+        if type(node) not in _ALLOWED_NODE_TYPES:
             raise ExpressionSecurityError(
                 f"Disallowed expression node: {type(node).__name__}"
             )
-        return super().visit(node)
-
-    def visit_Name(self, node: ast.Name) -> Any:
-        if node.id not in self._allowed_names:
-            raise ExpressionSecurityError(f"Disallowed name: {node.id}")
-        return None
-
-    def visit_Attribute(self, node: ast.Attribute) -> Any:
-        if node.attr.startswith("__") or node.attr not in ALLOWED_ATTRIBUTES:
-            raise ExpressionSecurityError(f"Attribute access not allowed: {node.attr}")
-        self.visit(node.value)
-        return None
-
-    def visit_Call(self, node: ast.Call) -> Any:
-        if isinstance(node.func, ast.Name):
-            if node.func.id not in ALLOWED_FUNCTIONS:
-                raise ExpressionSecurityError("Only approved functions may be called")
-        elif isinstance(node.func, ast.Attribute):
-            self.visit_Attribute(node.func)
+
+        if isinstance(node, ast.Name):
+            if node.id not in names:
+                raise ExpressionSecurityError(f"Disallowed name: {node.id}")
+        elif isinstance(node, ast.Attribute):
+            _check_attribute(node)
+            self._check(node.value, names)
+        elif isinstance(node, ast.Call):
+            for child in _call_children(node):
+                self._check(child, names)
+        elif isinstance(node, (ast.ListComp, ast.GeneratorExp)):
+            scope = _comprehension_scope(node, names)
+            for comp in node.generators:
+                self._check(comp.iter, scope)
+                for if_clause in comp.ifs:
+                    self._check(if_clause, scope)
+            self._check(node.elt, scope)
         else:
+            for field in node._fields:
+                value = getattr(node, field)
+                if isinstance(value, ast.AST):
+                    self._check(value, names)
+                elif isinstance(value, list):
+                    for item in value:
+                        if isinstance(item, ast.AST):
+                            self._check(item, names)
+
+
+def _check_attribute(node: ast.Attribute) -> None:
+    if node.attr.startswith("__") or node.attr not in ALLOWED_ATTRIBUTES:
+        raise ExpressionSecurityError(f"Attribute access not allowed: {node.attr}")
+
+
+def _call_children(node: ast.Call) -> list[ast.AST]:
+    func = node.func
+    children: list[ast.AST] = []
+    if isinstance(func, ast.Name):
+        if func.id not in ALLOWED_FUNCTIONS:
             raise ExpressionSecurityError("Only approved functions may be called")
-        for arg in node.args:
-            self.visit(arg)
-        for keyword in node.keywords:
-            self.visit(keyword.value)
-        return None
-
-    def visit_ListComp(self, node: ast.ListComp) -> Any:
-        self._visit_comprehension(node.elt, node.generators)
-        return None
+    elif isinstance(func, ast.Attribute):
+        _check_attribute(func)
+        children.append(func.value)
+    else:
+        raise ExpressionSecurityError("Only approved functions may be called")
+    children.extend(node.args)
+    children.extend(keyword.value for keyword in node.keywords)
+    return children
+
+
+def _comprehension_scope(
+    node: ast.ListComp | ast.GeneratorExp, names: frozenset[str]
+) -> frozenset[str]:
+    bound_names: list[str] = []
+    for comp in node.generators:
+        if not isinstance(comp.target, ast.Name):
+            raise ExpressionSecurityError(
+                "Only simple names are allowed in comprehensions"
+            )
+        bound_names.append(comp.target.id)
+    return names.union(bound_names)
 
-    def visit_GeneratorExp(self, node: ast.GeneratorExp) -> Any:
-        self._visit_comprehension(node.elt, node.generators)
-        return None
 
-    def _visit_comprehension(
-        self,
-        element: ast.AST,
-        generators: Iterable[ast.comprehension],
-    ) -> None:
-        bound_names: list[str] = []
-        for comp in generators:
-            if not isinstance(comp.target, ast.Name):
-                raise ExpressionSecurityError(
-                    "Only simple names are allowed in comprehensions"
-                )
-            bound_names.append(comp.target.id)
-
-        original = set(self._allowed_names)
-        self._allowed_names.update(bound_names)
-
-        for comp in generators:
-            self.visit(comp.iter)
-            for if_clause in comp.ifs:
-                self.visit(if_clause)
-
-        self.visit(element)
-        self._allowed_names = original
+_VALIDATOR = _ExpressionValidator(allowed_names=_ALLOWED_NAMES)
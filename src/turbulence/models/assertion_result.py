@@ -32,7 +32,7 @@ class AssertionResult(BaseModel):
     )
     message: str = Field(
         default="",
-        description="Human-readable message describing the result",
+        description="Human-readable message describing a failure (empty on pass)",
     )
     path: str | None = Field(
         default=None,
@@ -12,11 +12,17 @@ from turbulence.pressure.config import TurbulenceConfig, TurbulencePolicy
 
 
 class TurbulenceEngine:
-    """Apply deterministic turbulence injections for HTTP actions."""
+    """Apply deterministic turbulence injections for HTTP actions.
+
+    The engine holds no per-instance state (injections are derived from the
+    seed and instance ID), so one engine can be shared by every instance of
+    a scenario. Resolved policies are cached per service/action pair.
+    """
 
     def __init__(self, config: TurbulenceConfig | None, seed: int) -> None:
         self._config = config
         self._seed = seed
+        self._policies: dict[tuple[str, str], TurbulencePolicy | None] = {}
 
     def is_enabled(self) -> bool:
         """Return True if turbulence is enabled."""
@@ -26,7 +32,13 @@ class TurbulenceEngine:
         """Resolve a turbulence policy for a specific service and action."""
         if self._config is None:
             return None
-        return self._config.resolve(service=service, action=action)
+        key = (service, action)
+        try:
+            return self._policies[key]
+        except KeyError:
+            policy = self._config.resolve(service=service, action=action)
+            self._policies[key] = policy
+            return policy
 
     async def apply(
         self,
@@ -84,7 +96,7 @@ class TurbulenceEngine:
                     errors=[f"Injected timeout after {timeout_after}ms"],
                     action_name=action_name,
                 )
-                updated_context = dict(context)
+                updated_context = context
 
             turbulence_info["attempts"].append(
                 {
@@ -5,10 +5,12 @@ import math
 from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 from jinja2 import Environment, PackageLoader, select_autoescape
 
+from turbulence.storage.base import RunNotFoundError
+
 
 def calculate_percentile(data: list[float], percentile: int) -> float:
     """Calculate the Nth percentile of a list of values."""
@@ -25,55 +27,108 @@ def calculate_percentile(data: list[float], percentile: int) -> float:
     return d0 + (d1 - d0) * (k - f)
 
 
-@dataclass
-class ActionStats:
-    """Statistics for a single action type within a scenario."""
+def calculate_percentiles(
+    data: list[float], percentiles: tuple[int, ...]
+) -> tuple[float, ...]:
+    """Calculate several percentiles of a list of values with a single sort.
 
-    name: str
-    count: int = 0
-    latencies: list[float] = field(default_factory=list)
-    fail_count: int = 0
+    Uses the same linear interpolation as ``calculate_percentile``, but sorts
+    a copy, leaving ``data`` in its original order.
+    """
+    if not data:
+        return tuple(0.0 for _ in percentiles)
+    ordered = sorted(data)
+    last = len(ordered) - 1
+    results = []
+    for percentile in percentiles:
+        k = last * (percentile / 100.0)
+        f = math.floor(k)
+        c = math.ceil(k)
+        if f == c:
+            results.append(ordered[f])
+        else:
+            d0 = ordered[f]
+            results.append(d0 + (ordered[c] - d0) * (k - f))
+    return tuple(results)
+
+
+_REPORTED_PERCENTILES = (50, 95, 99)
+
+
+@dataclass(slots=True)
+class _PercentileCache:
+    """Reported percentiles of a latency series and the length they cover."""
+
+    count: int = -1
+    values: tuple[float, ...] = ()
+
+    def get(self, latencies: list[float]) -> tuple[float, ...]:
+        """Return the percentiles, recomputing them if the series has grown."""
+        if self.count != len(latencies):
+            self.values = calculate_percentiles(latencies, _REPORTED_PERCENTILES)
+            self.count = len(latencies)
+        return self.values
+
+
+class _LatencyPercentilesMixin:
+    """Computes p50/p95/p99 for a ``latencies`` series in one pass.
+
+    The result is cached against the series length, so the template reading
+    p50, p95 and p99 in turn only sorts the series once.
+    """
+
+    __slots__ = ()
+
+    latencies: list[float]
+    _percentile_cache: _PercentileCache
+
+    def _latency_percentiles(self) -> tuple[float, ...]:
+        return self._percentile_cache.get(self.latencies)
 
     @property
     def p50(self) -> float:
-        return calculate_percentile(self.latencies, 50)
+        return self._latency_percentiles()[0]
 
     @property
     def p95(self) -> float:
-        return calculate_percentile(self.latencies, 95)
+        return self._latency_percentiles()[1]
 
     @property
     def p99(self) -> float:
-        return calculate_percentile(self.latencies, 99)
+        return self._latency_percentiles()[2]
+
+
+@dataclass(slots=True)
+class ActionStats(_LatencyPercentilesMixin):
+    """Statistics for a single action type within a scenario."""
+
+    name: str
+    count: int = 0
+    latencies: list[float] = field(default_factory=list)
+    fail_count: int = 0
+    _percentile_cache: _PercentileCache = field(
+        default_factory=_PercentileCache, init=False, repr=False, compare=False
+    )
 
     @property
     def avg_latency(self) -> float:
         return sum(self.latencies) / len(self.latencies) if self.latencies else 0.0
 
 
-@dataclass
-class ServiceStats:
+@dataclass(slots=True)
+class ServiceStats(_LatencyPercentilesMixin):
     """Statistics for a service across all scenarios."""
 
     name: str
     request_count: int = 0
     fail_count: int = 0
     latencies: list[float] = field(default_factory=list)
+    _percentile_cache: _PercentileCache = field(
+        default_factory=_PercentileCache, init=False, repr=False, compare=False
+    )
 
-    @property
-    def p50(self) -> float:
-        return calculate_percentile(self.latencies, 50)
-
-    @property
-    def p95(self) -> float:
-        return calculate_percentile(self.latencies, 95)
-
-    @property
-    def p99(self) -> float:
-        return calculate_percentile(self.latencies, 99)
 
-
-@dataclass
+@dataclass(slots=True)
 class ScenarioStats:
     """Statistics for a single scenario."""
 
@@ -102,7 +157,7 @@ class ScenarioStats:
         return sorted(self.actions.values(), key=lambda a: a.name)
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportData:
     """Aggregated data for the HTML report."""
 
@@ -159,6 +214,11 @@ class ReportData:
 class HTMLReportGenerator:
     """Generates self-contained HTML reports from Turbulence run artifacts."""
 
+    TEMPLATE_NAME = "report.html.j2"
+
+    # Shared by every generator in the process; built on first use.
+    _env: ClassVar[Environment | None] = None
+
     def __init__(self, run_path: Path) -> None:
         """Initialize the report generator.
 
@@ -166,28 +226,46 @@ class HTMLReportGenerator:
             run_path: Path to the run directory containing artifacts.
         """
         self.run_path = run_path
-        self.env = Environment(
-            loader=PackageLoader("turbulence.report", "templates"),
-            autoescape=select_autoescape(["html", "xml"]),
-        )
+        self.env = self._get_env()
+
+    @classmethod
+    def _get_env(cls) -> Environment:
+        """Return the shared Jinja environment, building it on first use.
+
+        The packaged templates never change at runtime, so auto-reload is
+        disabled and the report template is compiled up front.
+        """
+        if cls._env is None:
+            env = Environment(
+                loader=PackageLoader("turbulence.report", "templates"),
+                autoescape=select_autoescape(["html", "xml"]),
+                auto_reload=False,
+                cache_size=400,
+            )
+            env.get_template(cls.TEMPLATE_NAME)
+            cls._env = env
+        return cls._env
 
     def _load_manifest(self) -> dict[str, Any]:
         """Load the run manifest.json file."""
-        manifest_path = self.run_path / "manifest.json"
-        if not manifest_path.exists():
+        try:
+            with (self.run_path / "manifest.json").open() as f:
+                result: dict[str, Any] = json.load(f)
+                return result
+        except FileNotFoundError:
+            # Only stat the run directory once the manifest is known missing
+            if not self.run_path.is_dir():
+                raise RunNotFoundError(self.run_path) from None
             return {}
-        with manifest_path.open() as f:
-            result: dict[str, Any] = json.load(f)
-            return result
 
     def _load_summary(self) -> dict[str, Any]:
         """Load the run summary.json file."""
-        summary_path = self.run_path / "summary.json"
-        if not summary_path.exists():
+        try:
+            with (self.run_path / "summary.json").open() as f:
+                result: dict[str, Any] = json.load(f)
+                return result
+        except FileNotFoundError:
             return {}
-        with summary_path.open() as f:
-            result: dict[str, Any] = json.load(f)
-            return result
 
     def _load_jsonl(self, filename: str) -> list[dict[str, Any]]:
         """Load a JSONL file and return all records.
@@ -198,18 +276,14 @@ class HTMLReportGenerator:
         Returns:
             List of parsed JSON records.
         """
-        file_path = self.run_path / filename
-        if not file_path.exists():
+        try:
+            with (self.run_path / filename).open("rb") as f:
+                return [
+                    json.loads(stripped) for line in f if (stripped := line.strip())
+                ]
+        except FileNotFoundError:
             return []
 
-        records = []
-        with file_path.open() as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    records.append(json.loads(line))
-        return records
-
     def _load_from_sqlite(self) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
         """Load all records from SQLite database.
 
@@ -286,85 +360,90 @@ class HTMLReportGenerator:
             duration_ms=summary.get("duration_ms", 0.0),
         )
 
-        # Map instance_id to scenario_id for step aggregation
-        instance_scenario_map: dict[str, str] = {}
+        # Map instance_id straight to its ScenarioStats so each step costs a
+        # single dict lookup during aggregation
+        instance_scenario_map: dict[str, ScenarioStats] = {}
+        # Error messages are collected and counted in one Counter.update call
+        error_messages: list[str] = []
 
         # Process instances for overall and per-scenario stats
         for instance in instances:
             report_data.total_instances += 1
             passed = instance.get("passed", False)
             scenario = instance.get("scenario_id", "unknown")
+
+            scenario_stats = report_data.scenarios.get(scenario)
+            if scenario_stats is None:
+                scenario_stats = ScenarioStats(name=scenario)
+                report_data.scenarios[scenario] = scenario_stats
+
             instance_id = instance.get("instance_id")
             if instance_id:
-                instance_scenario_map[instance_id] = scenario
-
-            if scenario not in report_data.scenarios:
-                report_data.scenarios[scenario] = ScenarioStats(name=scenario)
+                instance_scenario_map[instance_id] = scenario_stats
 
             if passed:
                 report_data.pass_count += 1
-                report_data.scenarios[scenario].pass_count += 1
+                scenario_stats.pass_count += 1
             else:
                 report_data.fail_count += 1
-                report_data.scenarios[scenario].fail_count += 1
+                scenario_stats.fail_count += 1
 
             # Error categorization from instance-level errors
             if not passed and instance.get("error"):
-                error_msg = instance["error"]
-                # Simplify error message for categorization (e.g. "HTTP 500..." -> "HTTP 500")
-                category = self._categorize_error(error_msg)
-                report_data.error_categories[category] += 1
+                error_messages.append(instance["error"])
 
         # Process steps for latency and action stats
         for step in steps:
-            instance_id = step.get("instance_id")
-            scenario = instance_scenario_map.get(instance_id, "unknown")
-            if scenario not in report_data.scenarios:
-                report_data.scenarios[scenario] = ScenarioStats(name=scenario)
+            scenario_stats = instance_scenario_map.get(step.get("instance_id"))
+            if scenario_stats is None:
+                scenario_stats = report_data.scenarios.get("unknown")
+                if scenario_stats is None:
+                    scenario_stats = ScenarioStats(name="unknown")
+                    report_data.scenarios["unknown"] = scenario_stats
 
             step_name = step.get("step_name", "unknown")
             obs = step.get("observation", {})
             latency = obs.get("latency_ms", 0.0)
             service = obs.get("service")
+            ok = obs.get("ok", False)
 
             # Update ActionStats
-            scenario_stats = report_data.scenarios[scenario]
-            if step_name not in scenario_stats.actions:
-                scenario_stats.actions[step_name] = ActionStats(name=step_name)
+            action_stats = scenario_stats.actions.get(step_name)
+            if action_stats is None:
+                action_stats = ActionStats(name=step_name)
+                scenario_stats.actions[step_name] = action_stats
 
-            action_stats = scenario_stats.actions[step_name]
             action_stats.count += 1
             action_stats.latencies.append(latency)
-            if not obs.get("ok", False):
+            if not ok:
                 action_stats.fail_count += 1
                 # Collect errors from observations
-                for err in obs.get("errors", []):
-                    category = self._categorize_error(err)
-                    report_data.error_categories[category] += 1
+                error_messages.extend(obs.get("errors", []))
 
             # Update ServiceStats
             if service:
-                if service not in report_data.services:
-                    report_data.services[service] = ServiceStats(name=service)
+                service_stats = report_data.services.get(service)
+                if service_stats is None:
+                    service_stats = ServiceStats(name=service)
+                    report_data.services[service] = service_stats
 
-                service_stats = report_data.services[service]
                 service_stats.request_count += 1
                 service_stats.latencies.append(latency)
-                if not obs.get("ok", False):
+                if not ok:
                     service_stats.fail_count += 1
 
-        # Process assertions for failure analysis
-        for assertion in assertions:
-            if not assertion.get("passed", True):
-                name = assertion.get("assertion_name", "unknown")
-                # assertions.jsonl doesn't have 'service', it relies on implicit knowledge or manual mapping?
-                # The existing code tried to get 'service' from assertion dict.
-                # If we want service failures from assertions, we need 'service' in assertion record.
-                # Since we can't easily add it now without changing AssertAction execution,
-                # we'll stick to what we have or just use step failures for service stats.
-                # report_data.failures_by_service[service] += 1  <-- Removing this as it's unreliable from assertions
+        # Simplify error messages for categorization (e.g. "HTTP 500..." -> "HTTP 500")
+        report_data.error_categories.update(
+            map(self._categorize_error, error_messages)
+        )
 
-                report_data.failing_assertions[name] += 1
+        # Process assertions for failure analysis. assertions.jsonl has no
+        # 'service' field, so failures_by_service comes from step stats below.
+        report_data.failing_assertions.update(
+            assertion.get("assertion_name", "unknown")
+            for assertion in assertions
+            if not assertion.get("passed", True)
+        )
 
         # Fill failures_by_service from ServiceStats instead
         for service_name, stats in report_data.services.items():
@@ -406,14 +485,17 @@ class HTMLReportGenerator:
 
         Returns:
             Path to the generated report file.
+
+        Raises:
+            RunNotFoundError: If the run directory does not exist.
         """
         if output_path is None:
             output_path = self.run_path / "report.html"
 
         report_data = self._collect_report_data()
-        template = self.env.get_template("report.html.j2")
+        template = self.env.get_template(self.TEMPLATE_NAME)
 
-        html_content = template.render(
+        stream = template.stream(
             run_id=report_data.run_id,
             timestamp=report_data.timestamp,
             sut_name=report_data.sut_name,
@@ -428,6 +510,9 @@ class HTMLReportGenerator:
             services=report_data.services_stats_list,
             error_categories=report_data.error_categories_list,
         )
+        # Buffer small chunks so the write loop doesn't issue a syscall per
+        # template fragment.
+        stream.enable_buffering(size=10)
 
-        output_path.write_text(html_content)
+        stream.dump(str(output_path), encoding="utf-8")
         return output_path
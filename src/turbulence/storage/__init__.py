@@ -4,7 +4,7 @@ from pathlib import Path
 from typing import Any
 
 from turbulence.models.manifest import RunManifest
-from turbulence.storage.base import StorageWriter
+from turbulence.storage.base import RunNotFoundError, StorageWriter
 from turbulence.storage.jsonl import JSONLStorageWriter
 
 
@@ -29,3 +29,10 @@ def create_storage_writer(storage_type: str = "jsonl") -> StorageWriter:
         return SQLiteStorageWriter()
     else:
         raise ValueError(f"Unknown storage type: {storage_type}")
+
+
+__all__ = [
+    "RunNotFoundError",
+    "StorageWriter",
+    "create_storage_writer",
+]
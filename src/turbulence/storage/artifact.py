@@ -2,6 +2,7 @@
 
 import json
 import threading
+from collections.abc import Sequence
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -230,18 +231,44 @@ class ArtifactStore:
             observation: Observation data from step execution.
             timestamp: When the step executed (default: now).
         """
-        self._ensure_initialized()
+        self.write_step_batch(
+            [
+                self.build_step_record(
+                    instance_id=instance_id,
+                    correlation_id=correlation_id,
+                    step_index=step_index,
+                    step_name=step_name,
+                    step_type=step_type,
+                    observation=observation,
+                    timestamp=timestamp,
+                )
+            ]
+        )
+
+    def build_step_record(
+        self,
+        instance_id: str,
+        correlation_id: str,
+        step_index: int,
+        step_name: str,
+        step_type: str,
+        observation: Observation | dict[str, Any],
+        timestamp: datetime | None = None,
+    ) -> StepRecord:
+        """Build a step record for a later ``write_step_batch`` call.
+
+        Takes the same arguments as ``write_step``; the timestamp defaults to
+        now, so records buffered during an instance keep their step times.
 
+        Returns:
+            The step record, not yet written or counted.
+        """
         if isinstance(observation, Observation):
             obs_dict = observation.model_dump()
         else:
             obs_dict = observation
 
-        latency = obs_dict.get("latency_ms")
-        if latency is not None and isinstance(latency, (int, float)):
-            self._latencies.append(float(latency))
-
-        record = StepRecord(
+        return StepRecord(
             instance_id=instance_id,
             run_id=self._run_id,
             correlation_id=correlation_id,
@@ -252,10 +279,25 @@ class ArtifactStore:
             observation=obs_dict,
         )
 
+    def write_step_batch(self, records: Sequence[StepRecord]) -> None:
+        """Write several step records to steps.jsonl in one storage call.
+
+        Args:
+            records: Step records from ``build_step_record``, in order.
+        """
+        self._ensure_initialized()
+
+        latencies = [
+            float(latency)
+            for record in records
+            if isinstance(latency := record.observation.get("latency_ms"), (int, float))
+        ]
+
         with self._write_lock:
-            self._storage.write_step(record)
+            self._storage.write_steps(records)
 
-            self._total_steps += 1
+            self._latencies.extend(latencies)
+            self._total_steps += len(records)
 
     def write_assertion(
         self,
@@ -286,8 +328,43 @@ class ArtifactStore:
             message: Result message (if not using assertion_result).
             timestamp: When the assertion was evaluated (default: now).
         """
-        self._ensure_initialized()
+        self.write_assertion_batch(
+            [
+                self.build_assertion_record(
+                    instance_id=instance_id,
+                    correlation_id=correlation_id,
+                    step_index=step_index,
+                    assertion_result=assertion_result,
+                    assertion_name=assertion_name,
+                    passed=passed,
+                    expected=expected,
+                    actual=actual,
+                    message=message,
+                    timestamp=timestamp,
+                )
+            ]
+        )
 
+    def build_assertion_record(
+        self,
+        instance_id: str,
+        correlation_id: str,
+        step_index: int,
+        assertion_result: AssertionResult | None = None,
+        assertion_name: str = "",
+        passed: bool = False,
+        expected: Any = None,
+        actual: Any = None,
+        message: str = "",
+        timestamp: datetime | None = None,
+    ) -> AssertionRecord:
+        """Build an assertion record for a later ``write_assertion_batch`` call.
+
+        Takes the same arguments as ``write_assertion``.
+
+        Returns:
+            The assertion record, not yet written or counted.
+        """
         if assertion_result is not None:
             assertion_name = assertion_result.name
             passed = assertion_result.passed
@@ -295,7 +372,7 @@ class ArtifactStore:
             actual = assertion_result.actual
             message = assertion_result.message
 
-        record = AssertionRecord(
+        return AssertionRecord(
             instance_id=instance_id,
             run_id=self._run_id,
             correlation_id=correlation_id,
@@ -308,15 +385,23 @@ class ArtifactStore:
             timestamp=timestamp or datetime.now(timezone.utc),
         )
 
+    def write_assertion_batch(self, records: Sequence[AssertionRecord]) -> None:
+        """Write several assertion records to assertions.jsonl in one storage call.
+
+        Args:
+            records: Assertion records from ``build_assertion_record``, in order.
+        """
+        self._ensure_initialized()
+
+        passed_count = sum(1 for record in records if record.passed)
+
         with self._write_lock:
-            self._storage.write_assertion(record)
+            self._storage.write_assertions(records)
 
             # Update tracking
-            self._total_assertions += 1
-            if passed:
-                self._assertions_passed += 1
-            else:
-                self._assertions_failed += 1
+            self._total_assertions += len(records)
+            self._assertions_passed += passed_count
+            self._assertions_failed += len(records) - passed_count
 
     def write_instance_artifact(
         self,
@@ -1,5 +1,6 @@
 """Base classes and protocols for storage backends."""
 
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Protocol, runtime_checkable
 
@@ -11,6 +12,14 @@ from turbulence.models.manifest import (
 )
 
 
+class RunNotFoundError(FileNotFoundError):
+    """Raised when a run's artifact directory does not exist."""
+
+    def __init__(self, run_path: Path) -> None:
+        self.run_path = run_path
+        super().__init__(f"Run not found at {run_path}")
+
+
 @runtime_checkable
 class StorageWriter(Protocol):
     """Protocol for storage backend implementations.
@@ -52,6 +61,22 @@ class StorageWriter(Protocol):
         """
         ...
 
+    def write_steps(self, records: Sequence[StepRecord]) -> None:
+        """Write a batch of step records in one operation.
+
+        Args:
+            records: The step records to write, in order.
+        """
+        ...
+
+    def write_assertions(self, records: Sequence[AssertionRecord]) -> None:
+        """Write a batch of assertion records in one operation.
+
+        Args:
+            records: The assertion records to write, in order.
+        """
+        ...
+
     def close(self) -> None:
         """Close any open resources (files, database connections)."""
         ...
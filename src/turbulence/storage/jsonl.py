@@ -1,6 +1,7 @@
 """JSONL (JSON Lines) writer utilities for streaming artifact storage."""
 
 import json
+from collections.abc import Sequence
 from pathlib import Path
 from typing import IO, Any
 
@@ -73,6 +74,30 @@ class JSONLWriter:
         self._file.write(line + "\n")
         self._file.flush()
 
+    def write_many(self, records: Sequence[dict[str, Any] | BaseModel]) -> None:
+        """Write several records as JSON lines with a single flush.
+
+        Args:
+            records: Dictionaries or Pydantic models to write, in order.
+
+        Raises:
+            RuntimeError: If the writer has not been opened.
+        """
+        if self._file is None:
+            raise RuntimeError("JSONLWriter must be opened before writing")
+        if not records:
+            return
+
+        lines = [
+            record.model_dump_json()
+            if isinstance(record, BaseModel)
+            else json.dumps(record, default=str)
+            for record in records
+        ]
+        lines.append("")
+        self._file.write("\n".join(lines))
+        self._file.flush()
+
     def __enter__(self) -> "JSONLWriter":
         """Context manager entry."""
         return self.open()
@@ -130,6 +155,16 @@ class JSONLStorageWriter:
         if self._assertions_writer:
             self._assertions_writer.write(record)
 
+    def write_steps(self, records: Sequence[StepRecord]) -> None:
+        """Write a batch of step records."""
+        if self._steps_writer:
+            self._steps_writer.write_many(records)
+
+    def write_assertions(self, records: Sequence[AssertionRecord]) -> None:
+        """Write a batch of assertion records."""
+        if self._assertions_writer:
+            self._assertions_writer.write_many(records)
+
     def close(self) -> None:
         """Close all open file handles."""
         if self._instances_writer:
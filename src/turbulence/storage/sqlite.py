@@ -2,6 +2,7 @@
 
 import json
 import sqlite3
+from collections.abc import Sequence
 from pathlib import Path
 
 from turbulence.models.manifest import (
@@ -163,52 +164,74 @@ class SQLiteStorageWriter:
 
     def write_step(self, record: StepRecord) -> None:
         """Write a step record."""
-        if not self._conn:
+        self.write_steps([record])
+
+    def write_steps(self, records: Sequence[StepRecord]) -> None:
+        """Write a batch of step records in one transaction."""
+        if not self._conn or not records:
             return
 
         with self._conn:
-            self._conn.execute(
+            self._conn.executemany(
                 """
                 INSERT INTO steps 
                 (instance_id, run_id, correlation_id, step_index, step_name, step_type, timestamp, observation)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                (
-                    record.instance_id,
-                    record.run_id,
-                    record.correlation_id,
-                    record.step_index,
-                    record.step_name,
-                    record.step_type,
-                    record.timestamp.isoformat() if record.timestamp else None,
-                    json.dumps(record.observation),
-                ),
+                [
+                    (
+                        record.instance_id,
+                        record.run_id,
+                        record.correlation_id,
+                        record.step_index,
+                        record.step_name,
+                        record.step_type,
+                        record.timestamp.isoformat() if record.timestamp else None,
+                        json.dumps(record.observation),
+                    )
+                    for record in records
+                ],
             )
 
     def write_assertion(self, record: AssertionRecord) -> None:
         """Write an assertion record."""
-        if not self._conn:
+        self.write_assertions([record])
+
+    def write_assertions(self, records: Sequence[AssertionRecord]) -> None:
+        """Write a batch of assertion records in one transaction."""
+        if not self._conn or not records:
             return
 
         with self._conn:
-            self._conn.execute(
+            self._conn.executemany(
                 """
                 INSERT INTO assertions 
                 (instance_id, run_id, correlation_id, step_index, assertion_name, passed, expected, actual, message, timestamp)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                (
-                    record.instance_id,
-                    record.run_id,
-                    record.correlation_id,
-                    record.step_index,
-                    record.assertion_name,
-                    record.passed,
-                    json.dumps(record.expected) if record.expected is not None else None,
-                    json.dumps(record.actual) if record.actual is not None else None,
-                    record.message,
-                    record.timestamp.isoformat() if record.timestamp else None,
-                ),
+                [
+                    (
+                        record.instance_id,
+                        record.run_id,
+                        record.correlation_id,
+                        record.step_index,
+                        record.assertion_name,
+                        record.passed,
+                        (
+                            json.dumps(record.expected)
+                            if record.expected is not None
+                            else None
+                        ),
+                        (
+                            json.dumps(record.actual)
+                            if record.actual is not None
+                            else None
+                        ),
+                        record.message,
+                        record.timestamp.isoformat() if record.timestamp else None,
+                    )
+                    for record in records
+                ],
             )
 
     def close(self) -> None:
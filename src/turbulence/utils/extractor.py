@@ -3,9 +3,10 @@
 import logging
 from typing import Any
 
-from jsonpath_ng import parse
 from jsonpath_ng.exceptions import JsonPathParserError
 
+from turbulence.utils.jsonpath import NO_MATCH, JSONPathMatcher, compile_matcher
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,24 +23,52 @@ def extract_values(
     Returns:
         A dictionary containing the extracted values.
     """
-    extracted = {}
-
     if not data or not isinstance(data, (dict, list)):
-        return extracted
+        return {}
 
+    compiled_map: dict[str, JSONPathMatcher] = {}
     for var_name, jpath_expr in extraction_map.items():
         try:
-            jsonpath_expr = parse(jpath_expr)
-            matches = jsonpath_expr.find(data)
-
-            if matches:
-                # If multiple matches, take the first one (standard behavior for Turbulence)
-                extracted[var_name] = matches[0].value
-            else:
-                logger.debug(f"JSONPath '{jpath_expr}' found no matches for variable '{var_name}'")
+            compiled_map[var_name] = compile_matcher(jpath_expr)
         except JsonPathParserError as e:
             logger.warning(f"Malformed JSONPath expression '{jpath_expr}': {e}")
         except Exception as e:
             logger.error(f"Unexpected error extracting '{jpath_expr}': {e}")
 
+    return extract_compiled_values(data, compiled_map)
+
+
+def extract_compiled_values(
+    data: Any,
+    compiled_map: dict[str, JSONPathMatcher],
+) -> dict[str, Any]:
+    """Extract values using JSONPath expressions that are already compiled.
+
+    Args:
+        data: The source data (usually a dictionary or list from JSON).
+        compiled_map: A mapping of variable names to compiled JSONPath matchers.
+
+    Returns:
+        A dictionary containing the extracted values.
+    """
+    extracted: dict[str, Any] = {}
+
+    if not data or not isinstance(data, (dict, list)):
+        return extracted
+
+    for var_name, matcher in compiled_map.items():
+        try:
+            # If multiple matches, take the first one (standard behavior for Turbulence)
+            value = matcher.first(data)
+
+            if value is not NO_MATCH:
+                extracted[var_name] = value
+            else:
+                logger.debug(
+                    f"JSONPath '{matcher.expression}' found no matches "
+                    f"for variable '{var_name}'"
+                )
+        except Exception as e:
+            logger.error(f"Unexpected error extracting '{matcher.expression}': {e}")
+
     return extracted
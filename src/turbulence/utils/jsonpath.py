@@ -0,0 +1,145 @@
+"""Cached JSONPath compilation."""
+
+from functools import lru_cache
+from typing import Any, cast
+
+from jsonpath_ng import JSONPath
+from jsonpath_ng.jsonpath import Child, Fields, Index, Root
+from jsonpath_ng.parser import parse as jsonpath_parse
+
+
+@lru_cache(maxsize=512)
+def compile_jsonpath(expression: str) -> JSONPath:
+    """Parse a JSONPath expression, reusing the compiled form on repeat calls.
+
+    Expressions come from scenario configuration and are effectively static,
+    so each distinct expression is parsed once per process. Parse errors are
+    not cached and are raised on every call.
+
+    Args:
+        expression: JSONPath expression string.
+
+    Returns:
+        The compiled JSONPath object.
+
+    Raises:
+        JsonPathParserError: If the expression is malformed.
+    """
+    return cast(JSONPath, jsonpath_parse(expression))  # type: ignore[no-untyped-call]
+
+
+# Returned by JSONPathMatcher.first when the expression matches nothing
+NO_MATCH: Any = object()
+
+# A simple path step: a field name, or an integer list index
+_Step = str | int
+
+
+def _simple_steps(jsonpath: JSONPath) -> tuple[_Step, ...] | None:
+    """Flatten a pure field/index path into steps, or None if it is not simple.
+
+    Simple paths are chains of single named fields and single integer indices
+    (``$.data.items[0].id``). Wildcards, slices, unions and recursive descent
+    return None and are evaluated by jsonpath_ng instead.
+    """
+    steps: list[_Step] = []
+    node: JSONPath | None = jsonpath
+    while True:
+        if isinstance(node, Child):
+            right = node.right
+            node = node.left
+        else:
+            right = node
+            node = None
+
+        if isinstance(right, Fields) and len(right.fields) == 1:
+            field = right.fields[0]
+            if field == "*":
+                return None
+            steps.append(field)
+        elif isinstance(right, Index) and len(right.indices) == 1:
+            steps.append(right.indices[0])
+        elif not (isinstance(right, Root) and node is None):
+            return None
+
+        if node is None:
+            break
+
+    steps.reverse()
+    return tuple(steps)
+
+
+class JSONPathMatcher:
+    """A compiled JSONPath that resolves the first matching value.
+
+    Simple field/index paths are walked directly over the data, which skips
+    building jsonpath_ng's full list of match contexts when only the first
+    value is used. Other expressions fall back to ``jsonpath.find``.
+    """
+
+    __slots__ = ("expression", "jsonpath", "_steps")
+
+    def __init__(self, expression: str, jsonpath: JSONPath) -> None:
+        """Initialize the matcher.
+
+        Args:
+            expression: JSONPath expression string.
+            jsonpath: The compiled JSONPath for ``expression``.
+        """
+        self.expression = expression
+        self.jsonpath = jsonpath
+        self._steps = _simple_steps(jsonpath)
+
+    def __repr__(self) -> str:
+        """Show the source expression."""
+        return f"JSONPathMatcher({self.expression!r})"
+
+    def first(self, data: Any) -> Any:
+        """Return the first value matched in data, or ``NO_MATCH``.
+
+        Args:
+            data: The data to search (usually parsed JSON).
+
+        Returns:
+            The first matched value (which may be None), or ``NO_MATCH``.
+        """
+        steps = self._steps
+        if steps is None:
+            matches = self.jsonpath.find(data)
+            return matches[0].value if matches else NO_MATCH
+
+        # Mirrors jsonpath_ng: fields use .get(), indices skip dicts and
+        # empty or out-of-range sequences
+        value = data
+        for step in steps:
+            if type(step) is int:
+                if isinstance(value, dict) or not value:
+                    return NO_MATCH
+                size = len(value)
+                if not -size <= step < size:
+                    return NO_MATCH
+                value = value[step]
+            else:
+                try:
+                    value = value.get(step, NO_MATCH)
+                except (TypeError, AttributeError):
+                    return NO_MATCH
+                if value is NO_MATCH:
+                    return NO_MATCH
+        return value
+
+
+@lru_cache(maxsize=512)
+def compile_matcher(expression: str) -> JSONPathMatcher:
+    """Compile a JSONPath expression into a cached first-match matcher.
+
+    Args:
+        expression: JSONPath expression string.
+
+    Returns:
+        The matcher for the expression.
+
+    Raises:
+        JSONPathError: If the expression is malformed.
+    """
+    return JSONPathMatcher(expression, compile_jsonpath(expression))
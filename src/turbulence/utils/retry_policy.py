@@ -56,17 +56,22 @@ async def with_retry(
     """
     last_exception: Exception | None = None
     last_result: T | None = None
-
-    for attempt in range(1, config.max_attempts + 1):
-        start_time = time.perf_counter()
+    max_attempts = config.max_attempts
+    # Only pay for the clock reads when someone is listening for timings
+    measure = on_attempt is not None
+    start_time = 0.0
+
+    for attempt in range(1, max_attempts + 1):
+        if measure:
+            start_time = time.perf_counter()
         try:
             result = await func()
-            duration_ms = (time.perf_counter() - start_time) * 1000
 
-            if on_attempt:
+            if on_attempt is not None:
+                duration_ms = (time.perf_counter() - start_time) * 1000
                 on_attempt(attempt, result, None, duration_ms)
 
-            if attempt < config.max_attempts and should_retry_result(result):
+            if attempt < max_attempts and should_retry_result(result):
                 last_result = result
                 # Fall through to sleep and retry
             else:
@@ -74,13 +79,13 @@ async def with_retry(
         except (asyncio.CancelledError, KeyboardInterrupt):
             raise
         except Exception as e:
-            duration_ms = (time.perf_counter() - start_time) * 1000
             last_exception = e
 
-            if on_attempt:
+            if on_attempt is not None:
+                duration_ms = (time.perf_counter() - start_time) * 1000
                 on_attempt(attempt, None, e, duration_ms)
 
-            if attempt == config.max_attempts or not is_retryable(e):
+            if attempt == max_attempts or not is_retryable(e):
                 break
 
             # If it's a retryable exception, we clear the last result if any
@@ -89,7 +94,7 @@ async def with_retry(
             # Calculate delay
             delay = _calculate_delay(config, attempt)
             logger.debug(
-                f"Attempt {attempt}/{config.max_attempts} failed with exception: {e}. "
+                f"Attempt {attempt}/{max_attempts} failed with exception: {e}. "
                 f"Retrying in {delay:.2f}s..."
             )
             await asyncio.sleep(delay)
@@ -98,7 +103,7 @@ async def with_retry(
         # If we got here, it means should_retry_result returned True
         delay = _calculate_delay(config, attempt)
         logger.debug(
-            f"Attempt {attempt}/{config.max_attempts} returned retryable result. "
+            f"Attempt {attempt}/{max_attempts} returned retryable result. "
             f"Retrying in {delay:.2f}s..."
         )
         await asyncio.sleep(delay)
@@ -3,7 +3,7 @@
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 class VariationType(str, Enum):
@@ -35,16 +35,18 @@ class ParameterVariation(BaseModel):
         description="Maximum value for range (for range type)",
     )
 
-    def model_post_init(self, __context: Any) -> None:
+    @model_validator(mode="after")
+    def validate_for_type(self) -> "ParameterVariation":
         """Validate configuration based on type."""
         if self.type == VariationType.CHOICE:
             if not self.values:
                 raise ValueError("Choice variation requires 'values' list")
-        elif self.type == VariationType.RANGE:
-            if self.min is None or self.max is None:
-                raise ValueError("Range variation requires 'min' and 'max'")
-            if self.min >= self.max:
-                raise ValueError("Range 'min' must be less than 'max'")
+            return self
+        if self.min is None or self.max is None:
+            raise ValueError("Range variation requires 'min' and 'max'")
+        if self.min >= self.max:
+            raise ValueError("Range 'min' must be less than 'max'")
+        return self
 
 
 class ToggleVariation(BaseModel):
@@ -78,23 +80,26 @@ class TimingConfig(BaseModel):
         description="Delay between steps in milliseconds {min: X, max: Y}",
     )
 
-    def model_post_init(self, __context: Any) -> None:
+    @model_validator(mode="after")
+    def validate_ranges(self) -> "TimingConfig":
         """Validate timing ranges."""
-        if self.jitter_ms:
-            if "min" not in self.jitter_ms or "max" not in self.jitter_ms:
-                raise ValueError("jitter_ms requires 'min' and 'max' keys")
-            if self.jitter_ms["min"] < 0:
-                raise ValueError("jitter_ms 'min' must be >= 0")
-            if self.jitter_ms["min"] >= self.jitter_ms["max"]:
-                raise ValueError("jitter_ms 'min' must be less than 'max'")
-
-        if self.step_delay_ms:
-            if "min" not in self.step_delay_ms or "max" not in self.step_delay_ms:
-                raise ValueError("step_delay_ms requires 'min' and 'max' keys")
-            if self.step_delay_ms["min"] < 0:
-                raise ValueError("step_delay_ms 'min' must be >= 0")
-            if self.step_delay_ms["min"] >= self.step_delay_ms["max"]:
-                raise ValueError("step_delay_ms 'min' must be less than 'max'")
+        if self.jitter_ms is None and self.step_delay_ms is None:
+            return self
+        _validate_ms_range("jitter_ms", self.jitter_ms)
+        _validate_ms_range("step_delay_ms", self.step_delay_ms)
+        return self
+
+
+def _validate_ms_range(name: str, value: dict[str, int] | None) -> None:
+    """Check a {min, max} millisecond range from a TimingConfig field."""
+    if not value:
+        return
+    if "min" not in value or "max" not in value:
+        raise ValueError(f"{name} requires 'min' and 'max' keys")
+    if value["min"] < 0:
+        raise ValueError(f"{name} 'min' must be >= 0")
+    if value["min"] >= value["max"]:
+        raise ValueError(f"{name} 'min' must be less than 'max'")
 
 
 class VariationConfig(BaseModel):
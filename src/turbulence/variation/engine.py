@@ -1,10 +1,39 @@
 """Variation engine for deterministic input fuzzing."""
 
 import random
+from collections.abc import Callable
+from functools import partial
 from typing import Any
 
 from turbulence.variation.config import VariationConfig, VariationType
 
+# A compiled variation step: draws from the instance RNG into the result dict.
+_VariationOp = Callable[[random.Random, dict[str, Any]], None]
+
+
+def _choice_op(
+    name: str, values: tuple[Any, ...], rng: random.Random, out: dict[str, Any]
+) -> None:
+    out[name] = rng.choice(values)
+
+
+def _range_op(
+    name: str, low: float, high: float, rng: random.Random, out: dict[str, Any]
+) -> None:
+    out[name] = rng.uniform(low, high)
+
+
+def _toggle_op(
+    name: str, probability: float, rng: random.Random, out: dict[str, Any]
+) -> None:
+    out[name] = rng.random() < probability
+
+
+def _randint_op(
+    name: str, low: int, high: int, rng: random.Random, out: dict[str, Any]
+) -> None:
+    out[name] = rng.randint(low, high)
+
 
 class VariationEngine:
     """Generates deterministic variations based on seed and configuration.
@@ -23,6 +52,60 @@ class VariationEngine:
         """
         self.config = config
         self.base_seed = base_seed
+        self._ops = self._compile(config)
+
+    @staticmethod
+    def _compile(config: VariationConfig) -> tuple[_VariationOp, ...]:
+        """Specialize the config into a straight-line list of RNG draws.
+
+        The config is immutable once the engine is built, so every type check
+        and None guard is resolved here rather than per instance. Ops are
+        emitted in the same order the draws have always been made so results
+        stay reproducible across versions.
+        """
+        ops: list[_VariationOp] = []
+
+        # Parameter variations
+        for param_name, param_config in config.parameters.items():
+            if param_config.type == VariationType.CHOICE:
+                if param_config.values:
+                    ops.append(
+                        partial(_choice_op, param_name, tuple(param_config.values))
+                    )
+            elif param_config.type == VariationType.RANGE:
+                if param_config.min is not None and param_config.max is not None:
+                    ops.append(
+                        partial(
+                            _range_op, param_name, param_config.min, param_config.max
+                        )
+                    )
+
+        # Toggle variations (boolean flags with probability)
+        for toggle in config.toggles:
+            ops.append(partial(_toggle_op, toggle.name, toggle.probability))
+
+        # Timing variations (stored with _ prefix for internal use)
+        if config.timing:
+            if config.timing.jitter_ms:
+                ops.append(
+                    partial(
+                        _randint_op,
+                        "_timing_jitter_ms",
+                        config.timing.jitter_ms["min"],
+                        config.timing.jitter_ms["max"],
+                    )
+                )
+            if config.timing.step_delay_ms:
+                ops.append(
+                    partial(
+                        _randint_op,
+                        "_step_delay_ms",
+                        config.timing.step_delay_ms["min"],
+                        config.timing.step_delay_ms["max"],
+                    )
+                )
+
+        return tuple(ops)
 
     def apply(self, instance_index: int) -> dict[str, Any]:
         """Generate variation values for a specific instance.
@@ -34,35 +117,9 @@ class VariationEngine:
             Dictionary of variation values to inject into context
         """
         # Create deterministic RNG for this instance
-        seed = self.base_seed + instance_index
-        rng = random.Random(seed)
+        rng = random.Random(self.base_seed + instance_index)
 
         result: dict[str, Any] = {}
-
-        # Apply parameter variations
-        for param_name, param_config in self.config.parameters.items():
-            if param_config.type == VariationType.CHOICE:
-                if param_config.values:
-                    result[param_name] = rng.choice(param_config.values)
-            elif param_config.type == VariationType.RANGE:
-                if param_config.min is not None and param_config.max is not None:
-                    result[param_name] = rng.uniform(param_config.min, param_config.max)
-
-        # Apply toggle variations (boolean flags with probability)
-        for toggle in self.config.toggles:
-            result[toggle.name] = rng.random() < toggle.probability
-
-        # Apply timing variations (stored with _ prefix for internal use)
-        if self.config.timing:
-            if self.config.timing.jitter_ms:
-                result["_timing_jitter_ms"] = rng.randint(
-                    self.config.timing.jitter_ms["min"],
-                    self.config.timing.jitter_ms["max"],
-                )
-            if self.config.timing.step_delay_ms:
-                result["_step_delay_ms"] = rng.randint(
-                    self.config.timing.step_delay_ms["min"],
-                    self.config.timing.step_delay_ms["max"],
-                )
-
+        for op in self._ops:
+            op(rng, result)
         return result
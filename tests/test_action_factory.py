@@ -0,0 +1,53 @@
+"""Tests for the action runner factory."""
+
+from typing import Any
+
+import pytest
+
+from turbulence.actions import ActionRunnerFactory
+from turbulence.config.scenario import WaitAction
+from turbulence.models.observation import Observation
+
+
+class _ActionOnlyRunner:
+    """Runner whose constructor accepts only the action."""
+
+    def __init__(self, action: Any) -> None:
+        self.action = action
+
+    async def execute(
+        self, context: dict[str, Any]
+    ) -> tuple[Observation, dict[str, Any]]:
+        return Observation(ok=True, latency_ms=0.0), context
+
+
+class TestActionRunnerFactory:
+    """Tests for ActionRunnerFactory."""
+
+    def test_create_passes_only_accepted_arguments(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Dependencies the runner does not accept are not passed to it."""
+        monkeypatch.setattr(ActionRunnerFactory, "_runners", {})
+        monkeypatch.setattr(ActionRunnerFactory, "_runner_params", {})
+        ActionRunnerFactory.register("wait", _ActionOnlyRunner)
+        action = WaitAction(
+            name="poll", service="api", path="/status", expect={"status_code": 200}
+        )
+
+        runner = ActionRunnerFactory.create(action, client=object(), seed=1)
+
+        assert isinstance(runner, _ActionOnlyRunner)
+        assert runner.action is action
+
+    def test_create_unknown_type_raises(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Unregistered action types are rejected."""
+        monkeypatch.setattr(ActionRunnerFactory, "_runners", {})
+        action = WaitAction(
+            name="poll", service="api", path="/status", expect={"status_code": 200}
+        )
+
+        with pytest.raises(ValueError, match="No runner registered"):
+            ActionRunnerFactory.create(action)
@@ -0,0 +1,326 @@
+"""Tests for the API artifact reader service."""
+
+import json
+import math
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from turbulence.api.services.artifact_reader import ArtifactReaderService, _loads
+
+
+def _write_run(runs_dir: Path) -> str:
+    """Write a small run with three instances and one step."""
+    run_id = "run_test"
+    run_path = runs_dir / run_id
+    run_path.mkdir(parents=True)
+    (run_path / "manifest.json").write_text(
+        json.dumps(
+            {
+                "sut_name": "shop",
+                "scenarios": ["checkout"],
+                "started_at": "2024-01-22T10:00:00+00:00",
+            }
+        )
+    )
+    instances = [
+        {"instance_id": "i1", "scenario_id": "checkout", "passed": True},
+        {"instance_id": "i2", "scenario_id": "checkout", "passed": False},
+        {"instance_id": "i3", "scenario_id": "checkout", "error": "boom"},
+    ]
+    (run_path / "instances.jsonl").write_text(
+        "\n".join(json.dumps(inst) for inst in instances) + "\n"
+    )
+    step = {
+        "instance_id": "i1",
+        "action_name": "get",
+        "action_type": "http",
+        "observation": {"ok": True, "status_code": 200, "body": {"id": 1}},
+    }
+    (run_path / "steps.jsonl").write_text(json.dumps(step) + "\n")
+    return run_id
+
+
+class TestArtifactReaderService:
+    """Tests for ArtifactReaderService."""
+
+    def test_list_runs_newest_first_with_limit(self, tmp_path: Path) -> None:
+        """Runs are listed by descending ID, skipping non-run entries."""
+        for day in ("01", "03", "02"):
+            run_path = tmp_path / f"run_202401{day}_000000"
+            run_path.mkdir()
+            (run_path / "manifest.json").write_text(json.dumps({"sut_name": "shop"}))
+        (tmp_path / "run_20240104_000000").mkdir()
+        (tmp_path / "run_20240105_000000.txt").write_text("not a run")
+        reader = ArtifactReaderService(tmp_path)
+
+        runs = reader.list_runs(limit=2)
+
+        assert [run.id for run in runs] == [
+            "run_20240103_000000",
+            "run_20240102_000000",
+        ]
+        assert ArtifactReaderService(tmp_path / "missing").list_runs() == []
+
+    def test_list_runs_filters_across_batches(self, tmp_path: Path) -> None:
+        """Filtered listings keep newest-first order beyond the first batch."""
+        for index in range(12):
+            run_path = tmp_path / f"run_{index:02d}"
+            run_path.mkdir()
+            (run_path / "manifest.json").write_text(json.dumps({"sut_name": "shop"}))
+            passed = index % 5 == 0
+            (run_path / "instances.jsonl").write_text(
+                json.dumps({"instance_id": "i1", "passed": passed}) + "\n"
+            )
+        (tmp_path / "run_99").mkdir()
+        reader = ArtifactReaderService(tmp_path)
+
+        runs = reader.list_runs(limit=2, status="passed")
+
+        assert [run.id for run in runs] == ["run_10", "run_05"]
+
+    def test_get_run_without_manifest(self, tmp_path: Path) -> None:
+        """A directory without a manifest is not reported as a run."""
+        (tmp_path / "run_partial").mkdir()
+        reader = ArtifactReaderService(tmp_path)
+
+        assert reader.get_run("run_partial") is None
+        assert reader.get_run("missing") is None
+        assert reader.list_runs() == []
+
+    def test_to_dict_matches_asdict(self, tmp_path: Path) -> None:
+        """to_dict produces the same payload as dataclasses.asdict."""
+        run_id = _write_run(tmp_path)
+        reader = ArtifactReaderService(tmp_path)
+
+        run = reader.get_run(run_id)
+        instance = reader.get_instance(run_id, "i1")
+
+        assert run is not None
+        assert instance is not None
+        assert run.to_dict() == asdict(run)
+        assert instance.to_dict() == asdict(instance)
+        for summary in reader.list_instances(run_id):
+            assert summary.to_dict() == asdict(summary)
+
+    def test_list_instances_paginates_filtered_stream(self, tmp_path: Path) -> None:
+        """Pagination applies after filtering the instance stream."""
+        run_id = _write_run(tmp_path)
+        reader = ArtifactReaderService(tmp_path)
+
+        failed = [inst.instance_id for inst in reader.iter_instances(run_id, "failed")]
+        page = reader.list_instances(run_id, status="failed", page=2, limit=1)
+
+        assert failed == ["i2", "i3"]
+        assert [inst.instance_id for inst in page] == ["i3"]
+        for status in ("passed", "failed", "errors", "unknown", None):
+            listed = reader.list_instances(run_id, status=status, limit=10)
+            streamed = list(reader.iter_instances(run_id, status))
+            assert listed == streamed
+        assert list(reader.iter_instances("missing")) == []
+
+    def test_etags_track_artifact_changes(self, tmp_path: Path) -> None:
+        """ETags are stable until a backing file changes, and scoped per instance."""
+        run_id = _write_run(tmp_path)
+        reader = ArtifactReaderService(tmp_path)
+
+        run_etag = reader.run_etag(run_id)
+        instance_etag = reader.instance_etag(run_id, "i1")
+
+        assert run_etag is not None
+        assert run_etag == reader.run_etag(run_id)
+        assert instance_etag != reader.instance_etag(run_id, "i2")
+        assert reader.run_etag("missing") is None
+
+        with (tmp_path / run_id / "instances.jsonl").open("a") as f:
+            f.write(json.dumps({"instance_id": "i4", "passed": True}) + "\n")
+
+        assert reader.run_etag(run_id) != run_etag
+        assert reader.instance_etag(run_id, "i1") != instance_etag
+
+    def test_loads_matches_stdlib(self) -> None:
+        """Line decoding accepts what json.loads accepts and rejects the rest."""
+        assert _loads(b'{"id": "i1", "passed": true}') == {"id": "i1", "passed": True}
+        assert math.isnan(_loads(b'{"duration_ms": NaN}')["duration_ms"])
+
+        with pytest.raises(json.JSONDecodeError):
+            _loads(b'{"id": ')
+
+    def test_get_instance_matches_escaped_ids(self, tmp_path: Path) -> None:
+        """Instances whose IDs are escaped in JSON are still found."""
+        run_id = _write_run(tmp_path)
+        with (tmp_path / run_id / "instances.jsonl").open("a") as f:
+            f.write(json.dumps({"instance_id": 'café"1', "passed": True}) + "\n")
+        reader = ArtifactReaderService(tmp_path)
+
+        assert reader.get_instance(run_id, 'café"1') is not None
+        assert reader.get_instance(run_id, "i1") is not None
+        assert reader.get_instance(run_id, "i9") is None
+
+    def test_summary_and_listing_share_one_scan(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """instances.jsonl is decoded once until it changes on disk."""
+        run_id = _write_run(tmp_path)
+        reader = ArtifactReaderService(tmp_path)
+        reads: list[Path] = []
+        read_instances = reader._read_instances
+
+        def counting_read(path: Path) -> Any:
+            reads.append(path)
+            return read_instances(path)
+
+        monkeypatch.setattr(reader, "_read_instances", counting_read)
+
+        run = reader.get_run(run_id)
+        instances = reader.list_instances(run_id)
+        assert run is not None
+        assert run.stats.total == len(instances) == 3
+        assert len(reads) == 1
+
+        with (tmp_path / run_id / "instances.jsonl").open("a") as f:
+            f.write(json.dumps({"instance_id": "i4", "passed": True}) + "\n")
+
+        assert len(reader.list_instances(run_id)) == 4
+        assert len(reads) == 2
+
+    def test_run_summaries_reused_until_files_change(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Polling the run list rebuilds only runs whose files changed."""
+        run_id = _write_run(tmp_path)
+        reader = ArtifactReaderService(tmp_path)
+        builds: list[Path] = []
+        build_run_summary = reader._build_run_summary
+
+        def counting_build(run_path: Path) -> Any:
+            builds.append(run_path)
+            return build_run_summary(run_path)
+
+        monkeypatch.setattr(reader, "_build_run_summary", counting_build)
+
+        reader.list_runs()
+        reader.list_runs()
+        assert reader.get_run(run_id) is not None
+        assert len(builds) == 1
+
+        (tmp_path / run_id / "summary.json").write_text(
+            json.dumps({"p95_latency_ms": 12.5})
+        )
+
+        run = reader.get_run(run_id)
+        assert run is not None
+        assert run.stats.p95_latency_ms == 12.5
+        assert len(builds) == 2
+
+    def test_run_without_instances_file(self, tmp_path: Path) -> None:
+        """A run with only a manifest reports empty stats."""
+        run_id = _write_run(tmp_path)
+        (tmp_path / run_id / "instances.jsonl").unlink()
+        reader = ArtifactReaderService(tmp_path)
+
+        run = reader.get_run(run_id)
+
+        assert run is not None
+        assert run.stats.total == 0
+        assert run.failures == []
+
+    def test_get_instance_reads_indexed_steps(self, tmp_path: Path) -> None:
+        """Steps are read for the requested instance only, in file order."""
+        run_id = _write_run(tmp_path)
+        steps_path = tmp_path / run_id / "steps.jsonl"
+        with steps_path.open("a") as f:
+            f.write(json.dumps({"instance_id": "i2", "action_name": "other"}) + "\n")
+            f.write(json.dumps({"instance_id": "i1", "action_name": "second"}) + "\n")
+            f.write("not json\n")
+        reader = ArtifactReaderService(tmp_path)
+
+        instance = reader.get_instance(run_id, "i1")
+
+        assert instance is not None
+        assert [(step.index, step.name) for step in instance.steps] == [
+            (0, "get"),
+            (1, "second"),
+        ]
+        assert instance.steps[0].observation.body == {"id": 1}
+
+        with steps_path.open("a") as f:
+            f.write(json.dumps({"instance_id": "i1", "action_name": "third"}) + "\n")
+
+        instance = reader.get_instance(run_id, "i1")
+        assert instance is not None
+        assert [s.name for s in instance.steps] == ["get", "second", "third"]
+
+    def test_step_index_reads_leading_and_escaped_ids(self, tmp_path: Path) -> None:
+        """IDs read from the line prefix match those from a full decode."""
+        run_id = _write_run(tmp_path)
+        steps_path = tmp_path / run_id / "steps.jsonl"
+        with steps_path.open("a") as f:
+            f.write('{"instance_id":"i2","action_name":"compact"}\n')
+            f.write(json.dumps({"instance_id": 'café"1', "action_name": "esc"}) + "\n")
+            f.write(json.dumps({"action_name": "late", "instance_id": "i3"}) + "\n")
+        reader = ArtifactReaderService(tmp_path)
+
+        index = reader._index_steps(steps_path)
+
+        assert sorted(index.ranges) == ["café\"1", "i1", "i2", "i3"]
+
+    def test_step_index_extends_for_appended_lines(self, tmp_path: Path) -> None:
+        """Appends resume indexing at the last complete line."""
+        run_id = _write_run(tmp_path)
+        steps_path = tmp_path / run_id / "steps.jsonl"
+        reader = ArtifactReaderService(tmp_path)
+        first = reader._index_steps(steps_path)
+
+        partial = json.dumps({"instance_id": "i1", "action_name": "second"})
+        with steps_path.open("a") as f:
+            f.write(partial[:10])
+        extended = reader._index_steps(steps_path, first)
+
+        assert extended.end == first.end
+        assert len(extended.ranges["i1"]) == 1
+
+        with steps_path.open("a") as f:
+            f.write(partial[10:] + "\n")
+        extended = reader._index_steps(steps_path, extended)
+
+        assert extended.ranges == reader._index_steps(steps_path).ranges
+        assert len(first.ranges["i1"]) == 1
+
+        instance = reader.get_instance(run_id, "i1")
+        assert instance is not None
+        assert [s.name for s in instance.steps] == ["get", "second"]
+
+
+class TestRunRoutes:
+    """Tests for the run API responses."""
+
+    def test_non_finite_floats_are_served_as_null(self, tmp_path: Path) -> None:
+        """NaN in instances.jsonl is returned as null rather than failing."""
+        from fastapi.testclient import TestClient
+
+        from turbulence.api.main import create_app
+
+        run_id = _write_run(tmp_path)
+        (tmp_path / run_id / "instances.jsonl").write_text(
+            '{"instance_id": "i1", "passed": true, "duration_ms": NaN}\n'
+        )
+        client = TestClient(create_app(runs_dir=tmp_path))
+
+        for path in (
+            "/api/runs",
+            f"/api/runs/{run_id}",
+            f"/api/runs/{run_id}/instances",
+        ):
+            response = client.get(path)
+            assert response.status_code == 200, path
+            assert "NaN" not in response.text
+
+        instances = client.get(f"/api/runs/{run_id}/instances").json()["instances"]
+        assert instances[0]["duration_ms"] is None
+
+        stream = client.get(f"/api/runs/{run_id}/instances/stream")
+        assert "NaN" not in stream.text
+        assert json.loads(stream.text.splitlines()[0])["duration_ms"] is None
@@ -1,6 +1,7 @@
 """Tests for artifact storage and JSONL persistence."""
 
 import json
+import math
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -74,6 +75,20 @@ class TestJSONLWriter:
         assert data["status_code"] == 200
         assert data["latency_ms"] == 100.5
 
+    def test_write_many_matches_single_writes(self, tmp_path: Path) -> None:
+        """Test that a batch write produces the same lines as single writes."""
+        records = [{"id": 1}, Observation(ok=True, latency_ms=1.0), {"id": 3}]
+
+        with JSONLWriter(tmp_path / "single.jsonl") as writer:
+            for record in records:
+                writer.write(record)
+        with JSONLWriter(tmp_path / "batch.jsonl") as writer:
+            writer.write_many(records)
+            writer.write_many([])
+
+        batch = (tmp_path / "batch.jsonl").read_text()
+        assert batch == (tmp_path / "single.jsonl").read_text()
+
     def test_write_without_opening_raises_error(self, tmp_path: Path) -> None:
         """Test that writing without opening raises RuntimeError."""
         jsonl_path = tmp_path / "test.jsonl"
@@ -485,6 +500,51 @@ class TestArtifactStore:
         assert summary_data["pass_rate"] == 95.0
         assert summary_data["duration_ms"] >= 0
 
+    @pytest.mark.parametrize("storage_type", ["jsonl", "sqlite"])
+    def test_batched_steps_and_assertions(
+        self, tmp_path: Path, storage_type: str
+    ) -> None:
+        """Test that batches are written in order and counted in the summary."""
+        store = ArtifactStore(
+            run_id="run_001",
+            base_path=tmp_path,
+            storage_type=storage_type,
+        ).initialize()
+
+        steps = [
+            store.build_step_record(
+                instance_id="inst_001",
+                correlation_id="corr_001",
+                step_index=index,
+                step_name=f"step-{index}",
+                step_type="http",
+                observation=Observation(ok=True, latency_ms=10.0 * (index + 1)),
+            )
+            for index in range(3)
+        ]
+        assertions = [
+            store.build_assertion_record(
+                instance_id="inst_001",
+                correlation_id="corr_001",
+                step_index=3,
+                assertion_name=name,
+                passed=passed,
+            )
+            for name, passed in (("ok", True), ("bad", False))
+        ]
+        store.write_step_batch(steps)
+        store.write_assertion_batch(assertions)
+        store.write_step_batch([])
+        summary = store.finalize()
+
+        assert summary.total_steps == 3
+        assert summary.total_assertions == 2
+        assert summary.assertions_failed == 1
+        assert summary.p50_latency_ms == 20.0
+        if storage_type == "jsonl":
+            records = read_jsonl(tmp_path / "run_001" / "steps.jsonl")
+            assert [r["step_name"] for r in records] == ["step-0", "step-1", "step-2"]
+
     def test_correlation_ids_in_all_records(self, tmp_path: Path) -> None:
         """Test that correlation IDs are present in all records."""
         store = ArtifactStore(
@@ -692,3 +752,77 @@ class TestArtifactStore:
         instances = read_jsonl(tmp_path / "run_001" / "instances.jsonl")
         # Timestamps should be serialized as ISO format strings
         assert "T" in instances[0]["started_at"]  # ISO format contains T
+
+    def test_sqlite_json_columns_round_trip(self, tmp_path: Path) -> None:
+        """Test that SQLite JSON columns decode back to the written values."""
+        import sqlite3
+
+        store = ArtifactStore(
+            run_id="run_001",
+            base_path=tmp_path,
+            storage_type="sqlite",
+        ).initialize()
+        body = {"id": 2**70, "items": [{"name": "café", "price": 1.5}]}
+        store.write_step(
+            instance_id="inst_001",
+            correlation_id="corr_001",
+            step_index=0,
+            step_name="get",
+            step_type="http",
+            observation=Observation(
+                ok=True, status_code=200, latency_ms=5.0, body=body
+            ),
+        )
+        store.write_assertion(
+            instance_id="inst_001",
+            correlation_id="corr_001",
+            step_index=0,
+            assertion_name="status",
+            passed=True,
+            expected={1: "a"},
+            actual="a",
+        )
+        store.finalize()
+
+        conn = sqlite3.connect(tmp_path / "run_001" / "turbulence.db")
+        (observation,) = conn.execute("SELECT observation FROM steps").fetchone()
+        expected, actual = conn.execute(
+            "SELECT expected, actual FROM assertions"
+        ).fetchone()
+        conn.close()
+
+        assert json.loads(observation)["body"] == body
+        assert json.loads(expected) == {"1": "a"}
+        assert json.loads(actual) == "a"
+
+    def test_sqlite_json_columns_keep_non_finite_floats(self, tmp_path: Path) -> None:
+        """Test that NaN and infinities are stored as-is, not as null."""
+        import sqlite3
+
+        store = ArtifactStore(
+            run_id="run_001",
+            base_path=tmp_path,
+            storage_type="sqlite",
+        ).initialize()
+        store.write_step(
+            instance_id="inst_001",
+            correlation_id="corr_001",
+            step_index=0,
+            step_name="get",
+            step_type="http",
+            observation=Observation(
+                ok=True,
+                status_code=200,
+                latency_ms=5.0,
+                body={"ratio": float("nan"), "limit": float("inf")},
+            ),
+        )
+        store.finalize()
+
+        conn = sqlite3.connect(tmp_path / "run_001" / "turbulence.db")
+        (observation,) = conn.execute("SELECT observation FROM steps").fetchone()
+        conn.close()
+
+        body = json.loads(observation)["body"]
+        assert math.isnan(body["ratio"])
+        assert body["limit"] == float("inf")
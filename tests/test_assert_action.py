@@ -43,6 +43,7 @@ class TestStatusCodeAssertion:
         assert observation.ok is True
         assert observation.action_name == "check_status"
         assert not observation.errors
+        assert updated_context["_last_assertion"]["message"] == ""
 
     @pytest.mark.asyncio
     async def test_status_code_fails(self) -> None:
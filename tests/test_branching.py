@@ -5,13 +5,20 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from turbulence.config.scenario import (
+    Assertion,
     BranchAction,
+    GrpcAction,
     HttpAction,
     Scenario,
     StopCondition,
 )
 from turbulence.config.sut import SUTConfig
-from turbulence.engine.scenario_runner import ScenarioRunner
+from turbulence.engine.scenario_runner import (
+    ScenarioRunner,
+    _action_plans,
+    _compile_action,
+    prepare_scenario,
+)
 from turbulence.engine.template import TemplateEngine
 from turbulence.models.observation import Observation
 
@@ -55,7 +62,7 @@ async def test_conditional_skip(scenario_runner):
 
     # We need to mock _execute_action because we don't want to actually hit the network
     # But since we're testing skipping, step1 should NOT call _execute_action
-    scenario_runner._execute_action = AsyncMock(return_value=(Observation(ok=True, action_name="step2", latency_ms=0.0), context))
+    scenario_runner._execute_action = AsyncMock(return_value=Observation(ok=True, action_name="step2", latency_ms=0.0))
 
     results = []
     async for r in scenario_runner.execute_flow(scenario, context):
@@ -93,7 +100,7 @@ async def test_branching_if_true(scenario_runner):
 
     context = {}
     client = MagicMock()
-    scenario_runner._execute_action = AsyncMock(return_value=(Observation(ok=True, action_name="true_step", latency_ms=0.0), context))
+    scenario_runner._execute_action = AsyncMock(return_value=Observation(ok=True, action_name="true_step", latency_ms=0.0))
 
     results = []
     async for r in scenario_runner.execute_flow(scenario, context):
@@ -130,7 +137,7 @@ async def test_branching_if_false(scenario_runner):
 
     context = {}
     client = MagicMock()
-    scenario_runner._execute_action = AsyncMock(return_value=(Observation(ok=True, action_name="false_step", latency_ms=0.0), context))
+    scenario_runner._execute_action = AsyncMock(return_value=Observation(ok=True, action_name="false_step", latency_ms=0.0))
 
     results = []
     async for r in scenario_runner.execute_flow(scenario, context):
@@ -167,7 +174,7 @@ async def test_branching_with_context(scenario_runner):
 
     context = {"last_response": {"status_code": 200}}
     client = MagicMock()
-    scenario_runner._execute_action = AsyncMock(return_value=(Observation(ok=True, action_name="success_step", latency_ms=0.0), context))
+    scenario_runner._execute_action = AsyncMock(return_value=Observation(ok=True, action_name="success_step", latency_ms=0.0))
 
     results = []
     async for r in scenario_runner.execute_flow(scenario, context):
@@ -176,3 +183,165 @@ async def test_branching_with_context(scenario_runner):
     assert len(results) == 2
     assert results[0][2].branch_taken == "if_true"
     assert results[1][2].action_name == "success_step"
+
+
+def test_render_action_reuses_static_actions(scenario_runner):
+    """Actions without templates skip rendering; templated ones are rebuilt."""
+    static = HttpAction(name="static", service="api", method="GET", path="/health")
+    templated = HttpAction(
+        name="templated", service="api", method="GET", path="/users/{{user_id}}"
+    )
+    newline = HttpAction(name="newline", service="api", method="GET", path="/a\n")
+    context = {"user_id": 7}
+
+    assert scenario_runner._render_action(static, context) is static
+    assert scenario_runner._render_action(newline, context).path == "/a"
+    for _ in range(2):
+        rendered = scenario_runner._render_action(templated, context)
+        assert rendered.path == "/users/7"
+        assert templated.path == "/users/{{user_id}}"
+
+
+def test_render_action_rebuilds_any_action_type(scenario_runner):
+    """Rendered actions keep their type, including gRPC calls."""
+    action = GrpcAction(
+        name="get_user",
+        service="api",
+        method="UserService/GetUser",
+        message={"id": "{{user_id}}"},
+    )
+
+    rendered = scenario_runner._render_action(action, {"user_id": 7})
+
+    assert isinstance(rendered, GrpcAction)
+    assert rendered.body == {"id": 7}
+
+
+@pytest.mark.asyncio
+async def test_execute_assertion_renders_templates(scenario_runner):
+    """Final assertions render against the context on every call."""
+    assertion = Assertion(
+        name="user_matches",
+        expect={"context_path": "user_id", "equals": "{{ expected_id }}"},
+    )
+
+    for expected_id, ok in (("7", True), ("8", False)):
+        context = {"user_id": "7", "expected_id": expected_id}
+        observation = await scenario_runner.execute_assertion(assertion, context)
+
+        assert observation.ok is ok
+        assert context["_last_assertion"]["expected"] == expected_id
+
+
+@pytest.mark.asyncio
+async def test_flow_updates_one_context_in_place(scenario_runner):
+    """Every step sees and yields the caller's context dict."""
+    scenario = Scenario(
+        id="in_place",
+        flow=[
+            {"name": "pick", "type": "decide", "decision": "d", "output_var": "x"},
+            {"name": "check", "type": "assert", "expect": {"status_code": 200}},
+        ],
+    )
+    context = {"last_response": {"status_code": 200}}
+
+    steps = [step async for step in scenario_runner.execute_flow(scenario, context)]
+
+    assert all(step_context is context for *_, step_context in steps)
+    assert context["_last_assertion"]["passed"] is True
+
+
+@pytest.mark.asyncio
+async def test_branch_steps_yield_their_own_assertion_result(scenario_runner):
+    """Each assert in a branch is yielded before the next one overwrites it."""
+    scenario = Scenario(
+        id="branch_asserts",
+        flow=[
+            BranchAction(
+                name="branch",
+                condition="true",
+                if_true=[
+                    {
+                        "name": "a1",
+                        "type": "assert",
+                        "expect": {"jsonpath": "$.x", "equals": 1},
+                    },
+                    {
+                        "name": "a2",
+                        "type": "assert",
+                        "expect": {"jsonpath": "$.x", "equals": 2},
+                    },
+                ],
+                if_false=[],
+            )
+        ],
+    )
+    context = {"last_response": {"status_code": 200, "body": {"x": 1}}}
+
+    passed = {
+        action.name: step_context["_last_assertion"]["passed"]
+        async for _, action, _, step_context in scenario_runner.execute_flow(
+            scenario, context
+        )
+        if action.type == "assert"
+    }
+
+    assert passed == {"a1": True, "a2": False}
+
+
+def test_prepare_scenario_compiles_nested_actions(template_engine):
+    """Branch steps and final assertions get plans before the first run."""
+    nested = HttpAction(name="nested", service="api", method="GET", path="/{{x}}")
+    scenario = Scenario(
+        id="prepared",
+        flow=[
+            BranchAction(
+                name="branch", condition="{{ flag }}", if_true=[nested], if_false=[]
+            )
+        ],
+        assertions=[Assertion(name="final", expect={"status_code": 200})],
+    )
+
+    prepare_scenario(scenario, template_engine)
+
+    assert id(nested) in _action_plans[template_engine]
+    assert id(scenario.flow[0]) not in _action_plans[template_engine]
+
+
+def test_prepare_scenario_defers_malformed_templates(template_engine):
+    """A template that does not parse fails its instance, not the whole run."""
+    broken = HttpAction(name="broken", service="api", method="GET", path="/x/{{ bad }")
+    valid = HttpAction(name="valid", service="api", method="GET", path="/{{x}}")
+    scenario = Scenario(
+        id="broken",
+        flow=[
+            BranchAction(
+                name="branch", condition="{{ flag }}", if_true=[broken], if_false=[]
+            ),
+            valid,
+        ],
+    )
+
+    prepare_scenario(scenario, template_engine)
+
+    assert id(valid) in _action_plans[template_engine]
+    assert id(broken) not in _action_plans[template_engine]
+
+
+def test_action_plans_are_per_template_engine():
+    """An engine with its own filters never reuses another engine's plan."""
+    plain = TemplateEngine()
+    shouting = TemplateEngine()
+    shouting._env.filters["default"] = lambda value, *args: str(value).upper()
+    action = HttpAction(
+        name="get", service="api", method="GET", path="/{{ x | default('y') }}"
+    )
+
+    plain_plan = _compile_action(action, plain)
+    shouting_plan = _compile_action(action, shouting)
+
+    assert plain_plan is not shouting_plan
+    assert plain_plan.template is not None
+    assert shouting_plan.template is not None
+    assert plain_plan.template.render({"x": "a"})["path"] == "/a"
+    assert shouting_plan.template.render({"x": "a"})["path"] == "/A"
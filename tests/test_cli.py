@@ -1,6 +1,7 @@
 """Tests for CLI commands (FEAT-001)."""
 
 import re
+from pathlib import Path
 
 from typer.testing import CliRunner
 
@@ -104,6 +105,14 @@ class TestReportCommand:
         result = runner.invoke(app, ["report"])
         assert result.exit_code != 0
 
+    def test_report_run_not_found(self, tmp_path: Path) -> None:
+        """Report on a missing run exits with a not-found error."""
+        result = runner.invoke(
+            app, ["report", "--run-id", "run_missing", "--runs-dir", str(tmp_path)]
+        )
+        assert result.exit_code == 1
+        assert "Run 'run_missing' not found" in strip_ansi(result.stdout)
+
 
 class TestReplayCommand:
     """Test the replay command options."""
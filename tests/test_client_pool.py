@@ -67,3 +67,32 @@ async def test_client_pool_close_all(sut_config):
     await pool.close_all()
     assert closed
     assert len(pool._http_clients) == 0
+
+
+@pytest.mark.asyncio
+async def test_client_pool_sizes_http_limits_to_parallelism(sut_config):
+    pool = ClientPool(sut_config, parallelism=50)
+
+    client = await pool.get_http_client("api")
+    limits = client._transport._pool
+
+    assert limits._max_connections == 100
+    assert limits._max_keepalive_connections == 50
+    assert limits._keepalive_expiry == 30.0
+
+    await pool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_client_pool_warm_up_creates_every_client(sut_config):
+    pool = ClientPool(sut_config)
+
+    await pool.warm_up()
+    http_clients = dict(pool._http_clients)
+    channel = pool._grpc_channels["grpc-svc"]
+
+    assert set(http_clients) == {"api", "auth"}
+    assert await pool.get_http_client("api") is http_clients["api"]
+    assert await pool.get_grpc_channel("grpc-svc") is channel
+
+    await pool.close_all()
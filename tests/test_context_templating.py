@@ -107,6 +107,16 @@ class TestTemplateEngineNestedAccess:
         assert result == 42
         assert isinstance(result, int)
 
+    def test_attribute_access_on_objects(self) -> None:
+        """Non-dict values are traversed by attribute."""
+        engine = TemplateEngine()
+        context = {"ctx": WorkflowContext(run_id="run_1"), "items": [1, 2]}
+
+        assert engine.render_string("{{ctx.run_id}}", context) == "run_1"
+        with pytest.raises(TemplateError) as exc_info:
+            engine.render_string("{{items.first}}", context)
+        assert exc_info.value.missing_var == "items.first"
+
 
 class TestTemplateEngineInJsonBody:
     """Test template substitution in JSON bodies."""
@@ -227,6 +237,87 @@ class TestTemplateEngineEdgeCases:
         assert engine.has_templates(["{{var}}"]) is True
         assert engine.has_templates(42) is False
 
+    def test_has_templates_in_nested_values(self) -> None:
+        """Templates are found at any depth; half markers do not count."""
+        engine = TemplateEngine()
+        nested = {"a": [{"b": "static"}, {"c": ["x", "{{var}}"]}]}
+        assert engine.has_templates(nested) is True
+        assert engine.has_templates({"a": ["{{", "}}"], "b": ("{{var}}",)}) is False
+
+    def test_plain_strings_skip_jinja(self) -> None:
+        """Strings without template syntax are returned as is."""
+        engine = TemplateEngine()
+        plain = "/static/path"
+
+        assert engine.render_string(plain, {}) is plain
+        assert engine.render_string("line\n", {}) == "line"
+        assert engine.render_string("{% if x %}yes{% endif %}", {"x": 1}) == "yes"
+        assert engine._from_string.cache_info().misses == 2
+
+    def test_repeated_render_reuses_compiled_template(self) -> None:
+        """Each template string is compiled once and rendered per context."""
+        engine = TemplateEngine()
+        template = "/users/{{ user_id }}/orders"
+
+        assert engine.render_string(template, {"user_id": 1}) == "/users/1/orders"
+        assert engine.render_string(template, {"user_id": 2}) == "/users/2/orders"
+        assert engine._from_string.cache_info().misses == 1
+
+        with pytest.raises(TemplateError):
+            engine.render_string(template, {})
+
+
+class TestTemplateEngineCompiled:
+    """Test rendering of pre-compiled templates."""
+
+    def test_compiled_matches_render_dict(self) -> None:
+        """Compiled templates render the same values as render_dict."""
+        engine = TemplateEngine()
+        data = {
+            "path": "/users/{{user.id}}",
+            "amount": "{{ amount }}",
+            "items": ["{{user.id}}", "static", 3, None],
+            "text": "line\n",
+            "nested": {"name": "{{ user.name | upper }}"},
+        }
+        context = {"user": {"id": 7, "name": "ada"}, "amount": 9.5}
+
+        compiled = engine.compile_dict(data)
+
+        for _ in range(2):
+            assert compiled.render(context) == engine.render_dict(data, context)
+
+    def test_compiled_renders_fresh_containers(self) -> None:
+        """Each render returns new dicts and lists, even for static parts."""
+        engine = TemplateEngine()
+        data = {"id": "{{ user.id }}", "tags": ["a"], "meta": {"source": "cli"}}
+        compiled = engine.compile_dict(data)
+
+        first = compiled.render({"user": {"id": 1}})
+        first["meta"]["source"] = "changed"
+        first["tags"].append("b")
+        second = compiled.render({"user": {"id": 2}})
+
+        assert second == {"id": 2, "tags": ["a"], "meta": {"source": "cli"}}
+        assert list(second) == list(data)
+        assert data["meta"] == {"source": "cli"}
+
+    def test_compiled_missing_variable_raises_error(self) -> None:
+        """Missing variables raise TemplateError at render time."""
+        engine = TemplateEngine()
+        compiled = engine.compile_value(["{{missing}}", "/a/{{other}}"])
+
+        with pytest.raises(TemplateError) as exc_info:
+            compiled.render({})
+        assert exc_info.value.missing_var == "missing"
+
+    def test_is_static_detection(self) -> None:
+        """is_static flags anything Jinja would rewrite."""
+        assert TemplateEngine.is_static({"key": ["plain", 1, None]}) is True
+        assert TemplateEngine.is_static("{% if x %}y{% endif %}") is False
+        assert TemplateEngine.is_static("trailing\n") is False
+        assert TemplateEngine.is_static("crlf\r\nline") is False
+
 
 class TestWorkflowContext:
     """Test WorkflowContext management."""
@@ -238,6 +329,23 @@ class TestWorkflowContext:
         assert ctx.instance_id.startswith("inst_")
         assert ctx.correlation_id.startswith("corr_")
 
+    def test_generated_ids_fill_only_missing_fields(self) -> None:
+        """Generated IDs are unique per context and never override given ones."""
+        first = WorkflowContext(run_id="run_given")
+        second = WorkflowContext(run_id="run_given")
+        assert first.run_id == "run_given"
+        assert first.instance_id != second.instance_id
+        assert first.correlation_id != second.correlation_id
+
+    def test_generated_ids_are_fully_random(self) -> None:
+        """Generated IDs have no fixed digits and share none with each other."""
+        contexts = [WorkflowContext() for _ in range(64)]
+        for offset in range(12):
+            digits = {ctx.instance_id[5 + offset] for ctx in contexts}
+            assert len(digits) > 1
+        for ctx in contexts:
+            assert ctx.correlation_id[5:13] != ctx.run_id[4:12]
+
     def test_set_entry_data(self) -> None:
         """Entry data can be set."""
         ctx = WorkflowContext()
@@ -257,6 +365,14 @@ class TestWorkflowContext:
         assert ctx.get("id") == "123"
         assert ctx.get("name") == "test"
 
+    def test_get_falls_back_to_fields_only(self) -> None:
+        """get() resolves model and extra fields but not other attributes."""
+        ctx = WorkflowContext(run_id="run_test", tenant="acme")
+        assert ctx.get("run_id") == "run_test"
+        assert ctx.get("tenant") == "acme"
+        assert ctx.get("to_dict") is None
+        assert ctx.get("missing", "fallback") == "fallback"
+
     def test_to_dict_for_templating(self) -> None:
         """to_dict produces correct structure for templating."""
         ctx = WorkflowContext(run_id="run_test", instance_id="inst_test")
@@ -286,6 +402,14 @@ class TestWorkflowContext:
         copy.extract("new_key", "new_value")
         assert ctx.get("new_key") is None
 
+    def test_extractions_are_per_instance(self) -> None:
+        """Each context starts with its own empty extraction store."""
+        first = WorkflowContext()
+        first.extract("order_id", "ord_001")
+        second = WorkflowContext()
+        assert second.get("order_id") is None
+        assert second.to_dict().keys() == first.to_dict().keys() - {"order_id"}
+
 
 class TestContextWithTemplateEngine:
     """Test WorkflowContext integration with TemplateEngine."""
@@ -7,9 +7,11 @@ import pytest
 
 from turbulence.report import HTMLReportGenerator
 from turbulence.report.html import (
+    ActionStats,
     ReportData,
     ScenarioStats,
     calculate_percentile,
+    calculate_percentiles,
 )
 
 
@@ -34,6 +36,18 @@ class TestPercentiles:
         assert calculate_percentile(data, 0) == 1.0
         assert calculate_percentile(data, 100) == 10.0
 
+    def test_calculate_percentiles_matches_single(self) -> None:
+        data = [7.0, 1.0, 9.0, 3.0, 5.0, 2.0]
+        expected = tuple(calculate_percentile(list(data), p) for p in (50, 95, 99))
+        assert calculate_percentiles(data, (50, 95, 99)) == expected
+        assert data == [7.0, 1.0, 9.0, 3.0, 5.0, 2.0]
+
+    def test_action_stats_percentiles_track_new_latencies(self) -> None:
+        stats = ActionStats(name="checkout", latencies=[1.0, 2.0, 3.0])
+        assert stats.p50 == 2.0
+        stats.latencies.append(100.0)
+        assert stats.p50 == 2.5
+
 
 class TestScenarioStats:
     """Tests for ScenarioStats dataclass."""
@@ -388,7 +388,10 @@ class TestHttpActionRunner:
 
     @pytest.mark.asyncio
     async def test_context_preserved_on_update(self, sut_config: SUTConfig) -> None:
-        """Test that existing context is preserved when adding extracted values."""
+        """Test that existing context is preserved when adding extracted values.
+
+        Extracted values are merged into the caller's context in place.
+        """
         action = HttpAction(
             name="context-test",
             service="api",
@@ -414,8 +417,8 @@ class TestHttpActionRunner:
         ):
             observation, updated_context = await runner.execute(initial_context)
 
-        # Original context should be unchanged
-        assert initial_context == {"existing_key": "existing_value"}
+        # The same context object is returned, updated in place
+        assert updated_context is initial_context
         # Updated context should have both
         assert updated_context["existing_key"] == "existing_value"
         assert updated_context["user_id"] == 123
@@ -576,6 +579,46 @@ class TestHttpActionRunner:
         # Verify the provided client was used
         mock_client.request.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_body_decoded_by_content_type(self, sut_config: SUTConfig) -> None:
+        """Test that JSON-looking non-JSON responses are kept as text."""
+        action = HttpAction(
+            name="content-type-test",
+            service="api",
+            method="GET",
+            path="/page",
+        )
+
+        runner = HttpActionRunner(action=action, sut_config=sut_config)
+
+        html_response = httpx.Response(
+            status_code=200,
+            text='{"id": 1}',
+            headers={"Content-Type": "text/html; charset=utf-8"},
+        )
+        with patch.object(
+            httpx.AsyncClient,
+            "request",
+            new_callable=AsyncMock,
+            return_value=html_response,
+        ):
+            observation, _ = await runner.execute({})
+        assert observation.body == '{"id": 1}'
+
+        problem_response = httpx.Response(
+            status_code=200,
+            text='{"title": "oops"}',
+            headers={"Content-Type": "application/problem+json"},
+        )
+        with patch.object(
+            httpx.AsyncClient,
+            "request",
+            new_callable=AsyncMock,
+            return_value=problem_response,
+        ):
+            observation, _ = await runner.execute({})
+        assert observation.body == {"title": "oops"}
+
 
 class TestObservationModel:
     """Tests for the Observation model."""
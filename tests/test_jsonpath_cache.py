@@ -0,0 +1,97 @@
+"""Tests for cached JSONPath compilation."""
+
+from pathlib import Path
+from textwrap import dedent
+
+import pytest
+
+from turbulence.config.loader import ConfigLoadError, load_scenario
+from turbulence.config.scenario import Expectation, HttpAction
+from turbulence.utils.jsonpath import NO_MATCH, compile_jsonpath, compile_matcher
+
+
+class TestCompileJsonpath:
+    """Test JSONPath compile cache."""
+
+    def test_reuses_compiled_expression(self) -> None:
+        """Repeated expressions return the same compiled object."""
+        first = compile_jsonpath("$.data.items[0].id")
+        second = compile_jsonpath("$.data.items[0].id")
+
+        assert first is second
+        assert first.find({"data": {"items": [{"id": 7}]}})[0].value == 7
+
+    def test_matcher_first_agrees_with_find(self) -> None:
+        """Direct walks of simple paths match jsonpath_ng's first result."""
+        data = {
+            "data": {"items": [{"id": 7, "tags": ["a", "b"]}, {"id": None}]},
+            "name": "abc",
+            "empty": [],
+        }
+        expressions = [
+            "$",
+            "$.data.items[0].id",
+            "$.data.items[1].id",
+            "$.data.items[-1].id",
+            "$.data.items[5].id",
+            "$.data.items[0].tags[1]",
+            "$.name[0]",
+            "$.name.first",
+            "$.empty[0]",
+            "$.data[0]",
+            "$.missing.id",
+            "data.items[0].id",
+            "$.data.items[*].id",
+            "$..id",
+        ]
+
+        for expression in expressions:
+            matches = compile_jsonpath(expression).find(data)
+            expected = matches[0].value if matches else NO_MATCH
+            assert compile_matcher(expression).first(data) == expected, expression
+
+    def test_expectation_compiles_jsonpath(self) -> None:
+        """Expectations carry their compiled JSONPath."""
+        expect = Expectation(jsonpath="$.status", equals="ok")
+
+        assert expect._compiled_jsonpath is compile_matcher("$.status")
+        assert expect._compiled_jsonpath.jsonpath is compile_jsonpath("$.status")
+        assert expect._jsonpath_error is None
+
+    def test_http_action_compiles_extract(self) -> None:
+        """Malformed extraction paths are recorded, valid ones compiled."""
+        action = HttpAction(
+            name="create",
+            service="api",
+            method="POST",
+            path="/orders",
+            extract={"order_id": "$.id", "broken": "$["},
+        )
+
+        assert set(action._compiled_extract) == {"order_id"}
+        assert set(action._extract_errors) == {"broken"}
+
+    def test_load_scenario_rejects_invalid_jsonpath(self, tmp_path: Path) -> None:
+        """Invalid JSONPaths fail at load time rather than at execution."""
+        scenario_file = tmp_path / "scenario.yaml"
+        scenario_file.write_text(
+            dedent("""
+                id: broken
+                flow:
+                  - name: create
+                    type: http
+                    service: api
+                    method: POST
+                    path: /orders
+                    extract:
+                      order_id: $.order_id
+                  - name: check
+                    type: assert
+                    expect:
+                      jsonpath: "$["
+                      equals: ok
+            """)
+        )
+
+        with pytest.raises(ConfigLoadError, match=r"flow\.1\.expect\.jsonpath"):
+            load_scenario(scenario_file)
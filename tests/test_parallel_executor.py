@@ -91,3 +91,50 @@ async def test_parallel_executor_cancels_new_instances() -> None:
 
     assert stats.completed <= parallelism
     assert stats.cancelled >= total_instances - stats.completed
+
+
+@pytest.mark.asyncio
+async def test_parallel_executor_bounds_live_tasks() -> None:
+    """Only `parallelism` instance tasks exist, however many instances run."""
+    total_instances = 50
+    parallelism = 3
+    started: list[int] = []
+    max_tasks = 0
+
+    async def workflow(instance_index: int) -> InstanceResult:
+        nonlocal max_tasks
+        started.append(instance_index)
+        max_tasks = max(max_tasks, len(asyncio.all_tasks()))
+        await asyncio.sleep(0)
+        now = datetime.now(timezone.utc)
+        return InstanceResult(
+            instance_id=f"inst_{instance_index}",
+            correlation_id=f"corr_{instance_index}",
+            scenario_id="test",
+            started_at=now,
+            completed_at=now,
+            duration_ms=1.0,
+            passed=True,
+        )
+
+    executor = ParallelExecutor(parallelism=parallelism)
+    stats = await executor.execute(total_instances, workflow)
+
+    # Worker tasks plus the test's own task
+    assert max_tasks <= parallelism + 1
+    assert started == list(range(total_instances))
+    assert stats.completed == total_instances
+
+
+@pytest.mark.asyncio
+async def test_parallel_executor_records_instance_errors() -> None:
+    """Unexpected exceptions become error results instead of vanishing."""
+
+    async def workflow(instance_index: int) -> InstanceResult:
+        raise RuntimeError(f"boom {instance_index}")
+
+    executor = ParallelExecutor(parallelism=2)
+    stats = await executor.execute(3, workflow)
+
+    assert stats.errors == 3
+    assert sorted(r.error for r in executor.results) == ["boom 0", "boom 1", "boom 2"]
@@ -19,6 +19,7 @@ from turbulence.engine.replay import (
     StepResult,
 )
 from turbulence.models.observation import Observation
+from turbulence.storage.base import RunNotFoundError
 
 
 @pytest.fixture
@@ -178,13 +179,26 @@ class TestReplayEngine:
         assert "run_001" in str(exc_info.value)
 
     def test_load_instance_run_not_found(self, temp_runs_dir: Path) -> None:
-        """Test loading from non-existent run raises error."""
+        """Test loading from non-existent run raises RunNotFoundError."""
         engine = ReplayEngine(runs_dir=temp_runs_dir)
 
-        with pytest.raises(InstanceNotFoundError) as exc_info:
+        with pytest.raises(RunNotFoundError) as exc_info:
             engine.load_instance("run_nonexistent", "inst_test123")
 
         assert "run_nonexistent" in str(exc_info.value)
+        # Callers that only handle missing instances still catch it
+        assert isinstance(exc_info.value, InstanceNotFoundError)
+        assert exc_info.value.instance_id == "inst_test123"
+
+    @pytest.mark.asyncio
+    async def test_replay_run_not_found(self, temp_runs_dir: Path) -> None:
+        """Test replaying from a non-existent run returns a failed result."""
+        engine = ReplayEngine(runs_dir=temp_runs_dir)
+
+        result = await engine.replay("run_nonexistent", "inst_test123")
+
+        assert result.success is False
+        assert "run_nonexistent" in (result.error or "")
 
     def test_load_scenario_success(
         self, temp_runs_dir: Path, temp_scenarios_dir: Path
@@ -630,3 +644,27 @@ class TestReplayEdgeCases:
         # First step should show difference (original was 200, replay is 500)
         assert result.steps[0].has_difference is True
         assert "status_code" in (result.steps[0].difference_details or "")
+
+    def test_escaped_and_substring_instance_ids(self, tmp_path: Path) -> None:
+        """Test IDs written escaped, or contained in other IDs, still match exactly."""
+        runs_dir = tmp_path / "runs"
+        run_dir = runs_dir / "run_ids"
+        run_dir.mkdir(parents=True)
+
+        with (run_dir / "instances.jsonl").open("w") as f:
+            for instance_id in ("inst_1", "inst_10", 'café"1'):
+                record = {
+                    "instance_id": instance_id,
+                    "run_id": "run_ids",
+                    "correlation_id": instance_id,
+                    "scenario_id": "test",
+                }
+                f.write(json.dumps(record) + "\n")
+
+        engine = ReplayEngine(runs_dir=runs_dir)
+
+        assert engine.load_instance("run_ids", "inst_10").correlation_id == "inst_10"
+        assert engine.load_instance("run_ids", "inst_1").correlation_id == "inst_1"
+        assert engine.load_instance("run_ids", 'café"1').correlation_id == 'café"1'
+        with pytest.raises(InstanceNotFoundError):
+            engine.load_instance("run_ids", "inst")
@@ -0,0 +1,109 @@
+"""Tests for the sandboxed expression evaluator."""
+
+import ast
+
+import pytest
+
+from turbulence.evaluation import (
+    ExpressionError,
+    ExpressionSecurityError,
+    ExpressionTimeoutError,
+    SafeExpressionEvaluator,
+    sandbox,
+)
+
+
+def _evaluate(expression: str, body: object = None) -> object:
+    evaluator = SafeExpressionEvaluator()
+    return evaluator.evaluate(expression, body=body, headers=None, context={})
+
+
+class TestExpressionValidation:
+    """Tests for the AST whitelist."""
+
+    @pytest.mark.parametrize(
+        ("expression", "message"),
+        [
+            ('__import__("os")', "Only approved functions"),
+            ("body.__class__", "Attribute access not allowed"),
+            ("(lambda: 1)()", "Only approved functions"),
+            ('f"{body}"', "Disallowed expression node: JoinedStr"),
+            ("sum(*body)", "Disallowed expression node: Starred"),
+            ("[x for (x, y) in body]", "Only simple names"),
+            ("[y for y in body] and y", "Disallowed name: y"),
+        ],
+    )
+    def test_rejects_disallowed_syntax(self, expression: str, message: str) -> None:
+        """Expressions outside the whitelist are rejected before evaluation."""
+        with pytest.raises(ExpressionSecurityError, match=message):
+            _evaluate(expression, [])
+
+    def test_repeated_expressions_compile_once(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Validation and compilation run once per distinct expression."""
+        calls: list[str] = []
+        validate = sandbox._validate_expression
+
+        def counting_validate(expression: str) -> ast.Expression:
+            calls.append(expression)
+            return validate(expression)
+
+        monkeypatch.setattr(sandbox, "_validate_expression", counting_validate)
+        sandbox._compile_expression.cache_clear()
+
+        assert _evaluate("len(body) + 1", [1, 2]) == 3
+        assert _evaluate("len(body) + 1", [1]) == 2
+        assert calls == ["len(body) + 1"]
+
+    def test_comprehension_names_are_scoped(self) -> None:
+        """Comprehension variables are usable inside their comprehension."""
+        body = {"items": [{"price": 5}, {"price": 15}]}
+        expression = 'len([i for i in body.get("items") if i.get("price") > 10])'
+
+        assert _evaluate(expression, body) == 1
+
+
+class TestSafeBuiltins:
+    """Tests for the deadline-checked builtins."""
+
+    def test_aggregates_match_builtins_across_chunks(self) -> None:
+        """Results match the builtins for inputs spanning several chunks."""
+        body = [(i * 7919) % 3001 - 1500 for i in range(5000)]
+
+        assert _evaluate("sum(body)", body) == sum(body)
+        assert _evaluate("min(body)", body) == min(body)
+        assert _evaluate("max(body)", body) == max(body)
+        assert _evaluate("any(x > 1499 for x in body)", body) is True
+        assert _evaluate("all(x > -1500 for x in body)", body) is False
+        assert _evaluate("sum(range(3, 5000, 7))") == sum(range(3, 5000, 7))
+
+    def test_any_and_all_short_circuit(self) -> None:
+        """Elements after the deciding one are never evaluated."""
+        body = {"items": [{"price": -1}, {"name": "x"}]}
+
+        assert _evaluate("all(i['price'] > 0 for i in body['items'])", body) is False
+        assert _evaluate("any(i['price'] < 0 for i in body['items'])", body) is True
+
+    def test_empty_min_raises(self) -> None:
+        """min() of an empty sequence is reported as an evaluation error."""
+        with pytest.raises(ExpressionError, match="empty sequence"):
+            _evaluate("min(body)", [])
+
+    def test_long_running_expression_times_out(self) -> None:
+        """Large iterations still hit the evaluation deadline."""
+        evaluator = SafeExpressionEvaluator(timeout_seconds=0.01)
+
+        with pytest.raises(ExpressionTimeoutError):
+            evaluator.evaluate(
+                "sum(range(10 ** 9))", body=None, headers=None, context={}
+            )
+
+    def test_huge_range_times_out(self) -> None:
+        """Ranges longer than sys.maxsize still hit the evaluation deadline."""
+        evaluator = SafeExpressionEvaluator(timeout_seconds=0.01)
+
+        with pytest.raises(ExpressionTimeoutError):
+            evaluator.evaluate(
+                "sum(range(10 ** 20))", body=None, headers=None, context={}
+            )
@@ -251,6 +251,23 @@ class TestLoadScenarios:
         with pytest.raises(ConfigLoadError):
             load_scenarios(tmp_path)
 
+    def test_load_order_is_deterministic(self, tmp_path: Path) -> None:
+        """Scenarios keep sorted file order and every failure is reported."""
+        for index in range(20):
+            (tmp_path / f"s{index:02d}.yaml").write_text(f"id: scenario-{index:02d}")
+        (tmp_path / "extra.yml").write_text("id: extra")
+
+        scenarios = load_scenarios(tmp_path)
+        assert [s.id for s in scenarios] == [
+            *(f"scenario-{index:02d}" for index in range(20)),
+            "extra",
+        ]
+
+        (tmp_path / "bad1.yaml").write_text("missing_id: true")
+        (tmp_path / "bad2.yaml").write_text("missing_id: true")
+        with pytest.raises(ConfigLoadError, match="Failed to load 2 scenario"):
+            load_scenarios(tmp_path)
+
     def test_load_fixture_scenarios(self) -> None:
         """Load fixture scenario files."""
         fixture_path = Path(__file__).parent / "fixtures" / "scenarios"
@@ -137,3 +137,25 @@ async def test_deterministic_latency_with_seed() -> None:
     latency_a = obs_a.turbulence["attempts"][0]["injected_latency_ms"]
     latency_b = obs_b.turbulence["attempts"][0]["injected_latency_ms"]
     assert latency_a == latency_b
+
+
+def test_resolve_policy_is_cached_per_service_and_action() -> None:
+    """Policies are resolved once per service/action pair."""
+    config = TurbulenceConfig(
+        global_policy=TurbulencePolicy(retry_count=1),
+        actions={"get_user": TurbulencePolicy(timeout_after_ms=50)},
+    )
+    engine = TurbulenceEngine(config, seed=123)
+
+    policy = engine.resolve_policy(service="api", action="get_user")
+
+    assert policy is not None
+    assert policy.retry_count == 1
+    assert policy.timeout_after_ms == 50
+    assert engine.resolve_policy(service="api", action="get_user") is policy
+    other = engine.resolve_policy(service="api", action="list_users")
+    assert other is not None
+    assert other.timeout_after_ms is None
+    assert TurbulenceEngine(None, seed=1).resolve_policy(
+        service="api", action="get_user"
+    ) is None
@@ -87,7 +87,7 @@ async def test_variation_end_to_end_flow(tmp_path):
         # Verify action path is rendered correctly with variation
         assert variations_applied["user_id"] in rendered_action.path
         from turbulence.models.observation import Observation
-        return Observation(ok=True, status_code=200, latency_ms=1.0, headers={}, body={}, action_name=action.name, service="api"), context
+        return Observation(ok=True, status_code=200, latency_ms=1.0, headers={}, body={}, action_name=action.name, service="api")
 
     scenario_runner._execute_action = mock_execute_action
 
@@ -570,6 +570,44 @@ class TestContextHandling:
         assert context["user_id"] == "123"
         assert context["order_id"] == "456"
 
+    @pytest.mark.asyncio
+    async def test_polls_share_fallback_client(
+        self,
+        sut_config: SUTConfig,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Without a pooled client, one client serves every poll and is closed."""
+        action = WaitAction(
+            name="wait_ready",
+            type="wait",
+            service="api",
+            path="/status",
+            interval_seconds=0.01,
+            timeout_seconds=5.0,
+            expect=Expectation(jsonpath="$.ready", equals=True),
+        )
+        bodies = iter([{"ready": False}, {"ready": False}, {"ready": True}])
+        transport = httpx.MockTransport(
+            lambda _request: httpx.Response(200, json=next(bodies))
+        )
+        created: list[httpx.AsyncClient] = []
+        async_client = httpx.AsyncClient
+
+        def make_client(**kwargs: Any) -> httpx.AsyncClient:
+            client = async_client(transport=transport, **kwargs)
+            created.append(client)
+            return client
+
+        monkeypatch.setattr(httpx, "AsyncClient", make_client)
+
+        runner = WaitActionRunner(action, sut_config)
+        observation, _ = await runner.execute({})
+
+        assert observation.ok is True
+        assert observation.total_attempts == 3
+        assert len(created) == 1
+        assert created[0].is_closed
+
 
 class TestWaitObservationModel:
     """Test WaitObservation and PollAttempt models."""